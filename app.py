@@ -1,5 +1,11 @@
-import dash_mantine_components as dmc
+import multiprocessing
 import sys
+
+if __name__ == "__main__":
+    # Frozen (PyInstaller) worker processes start here: run the worker, not the app
+    multiprocessing.freeze_support()
+
+import dash_mantine_components as dmc
 from datetime import timedelta
 from dash import Dash, Input, Output, State, callback, dcc, html
 from components.sidebar import build_sidebar
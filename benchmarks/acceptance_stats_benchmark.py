@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the flowmeter acceptance statistics kernels.
+
+Compares the previous per-sample Python loops of Test 2.1 (time differences),
+Test 1.2 (unit check) and Test 4.1 (pandas rolling mean plus the per-reading
+stability loop) with services.acceptance_stats on synthetic 1M-sample signals,
+and checks that both produce the same results.
+
+Usage (from the repository root):
+    python benchmarks/acceptance_stats_benchmark.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import acceptance_stats  # noqa: E402
+
+SAMPLES = 1_000_000
+WINDOW = 10
+DRIFT_THRESHOLD = 5.0
+
+
+def make_signal(samples: int, seed: int = 0) -> tuple:
+    """~5 s reporting timestamps with jitter and gaps, and a noisy flow signal with spikes and drift."""
+    rng = np.random.default_rng(seed)
+    timestamps = np.cumsum(rng.choice([4, 5, 5, 5, 6, 30], size=samples)).astype(np.int64)
+    values = 500 + rng.normal(0, 5, samples) + np.linspace(0, 40, samples)
+    values[rng.integers(0, samples, samples // 1000)] *= 6.2898
+    return timestamps, values
+
+
+def legacy_time_diffs(timestamps: np.ndarray) -> dict:
+    """Previous Test 2.1 loop."""
+    time_differences = []
+    for k in range(len(timestamps) - 1):
+        time_differences.append(timestamps[k + 1] - timestamps[k])
+    diffs = np.array(time_differences)
+    return {'max': float(np.max(diffs)), 'mean': float(np.mean(diffs)),
+            'median': float(np.median(diffs)), 'std': float(np.std(diffs)),
+            'p95': float(np.percentile(diffs, 95)), 'under_5s': int(np.sum(diffs <= 5.0))}
+
+
+def kernel_time_diffs(timestamps: np.ndarray) -> dict:
+    diffs = acceptance_stats.time_differences(timestamps)
+    stats = acceptance_stats.summary_stats(diffs, percentiles=(95,))
+    stats['under_5s'] = acceptance_stats.count_at_most(diffs, 5.0)
+    return stats
+
+
+def legacy_unit_check(values: np.ndarray, min_acceptable: float, max_acceptable: float) -> int:
+    """Previous Test 1.2 loop."""
+    values = values.tolist()
+    conversions = 0
+    for index in range(len(values)):
+        if not min_acceptable <= values[index] <= max_acceptable:
+            values[index] = values[index] / 6.2898
+            conversions += 1
+    return conversions
+
+
+def legacy_stability(values: np.ndarray) -> tuple:
+    """Previous Test 4.1: pandas rolling mean, then per-reading loops."""
+    mean_value, std_deviation = np.mean(values), np.std(values)
+    lower, upper = mean_value - 3 * std_deviation, mean_value + 3 * std_deviation
+    outliers = len(values[(values < lower) | (values > upper)])
+    rolling_mean = pd.Series(values).rolling(window=WINDOW, center=True).mean()
+    threshold = mean_value * (DRIFT_THRESHOLD / 100.0)
+
+    drift_violations = 0
+    for rolling_val in rolling_mean.dropna():
+        if abs(rolling_val - mean_value) > threshold:
+            drift_violations += 1
+
+    stable = 0
+    for i, value in enumerate(values):
+        rolling_stable = True
+        if not pd.isna(rolling_mean.iloc[i]):
+            rolling_stable = abs(rolling_mean.iloc[i] - mean_value) <= threshold
+        if lower <= value <= upper and rolling_stable:
+            stable += 1
+    return outliers, drift_violations, stable
+
+
+def kernel_stability(values: np.ndarray) -> tuple:
+    mean_value, _, lower, upper = acceptance_stats.sigma_bounds(values, 3.0)
+    outliers = acceptance_stats.count_outside(values, lower, upper)
+    rolling_mean = acceptance_stats.rolling_mean(values, WINDOW, center=True)
+    drifting = acceptance_stats.drift_mask(rolling_mean, mean_value, mean_value * (DRIFT_THRESHOLD / 100.0))
+    stable = int(np.count_nonzero((values >= lower) & (values <= upper) & ~drifting))
+    return outliers, int(np.count_nonzero(drifting)), stable
+
+
+def timed(func, *args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t0
+
+
+def report(name: str, old_elapsed: float, new_elapsed: float) -> None:
+    print(f"{name}: old {old_elapsed:.3f}s, new {new_elapsed:.4f}s, "
+          f"speedup {old_elapsed / max(new_elapsed, 1e-9):.0f}x")
+
+
+def run(samples: int) -> None:
+    timestamps, values = make_signal(samples)
+    print(f"{samples:,} samples")
+
+    old, old_elapsed = timed(legacy_time_diffs, timestamps)
+    new, new_elapsed = timed(kernel_time_diffs, timestamps)
+    if old != new:
+        raise AssertionError(f"Test 2.1 statistics differ: {old} vs {new}")
+    report("  Test 2.1 time differences", old_elapsed, new_elapsed)
+
+    old, old_elapsed = timed(legacy_unit_check, values, 400.0, 700.0)
+    new, new_elapsed = timed(acceptance_stats.count_outside, values, 400.0, 700.0)
+    if old != new:
+        raise AssertionError(f"Test 1.2 conversions differ: {old} vs {new}")
+    report("  Test 1.2 unit check", old_elapsed, new_elapsed)
+
+    old, old_elapsed = timed(legacy_stability, values)
+    new, new_elapsed = timed(kernel_stability, values)
+    if old != new:
+        raise AssertionError(f"Test 4.1 stability differs: {old} vs {new}")
+    report("  Test 4.1 stability", old_elapsed, new_elapsed)
+
+
+if __name__ == "__main__":
+    run(SAMPLES)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Stand-in for dreview.exe used by the review benchmarks.
+
+Accepts dreview's command line (review file, -match=(...), -TBEGIN=, -TEND=,
+-DT=) and writes the review file's contents to stdout, so a ".review" file here
+is simply the CSV dreview would print for it (header, unit line, rows).
+
+Stand-in options (double dash, anywhere on the line) simulate a failing or slow
+dreview for the checks:
+    --fail=<text>       fail for review files whose name contains <text>
+    --fail-after=<n>    lines printed before failing (default 0)
+    --exit-code=<n>     exit code on failure (default 3)
+    --sleep=<sec>       sleep this long before exiting (e.g. to test cancellation)
+
+Usage:
+    python benchmarks/dreview_stub.py <file.review> -match=(...) -TBEGIN=... -TEND=...
+"""
+
+import itertools
+import os
+import shutil
+import sys
+import time
+
+
+def main(argv: list) -> int:
+    options = dict(arg[2:].partition('=')[::2] for arg in argv[1:] if arg.startswith('--'))
+    args = [arg for arg in argv[1:] if not arg.startswith('--')]
+    if not args:
+        print("usage: dreview_stub.py <file.review> [options]", file=sys.stderr)
+        return 2
+
+    fail = 'fail' in options and options['fail'] in os.path.basename(args[0])
+    try:
+        with open(args[0]) as review:
+            if fail:
+                sys.stdout.writelines(itertools.islice(review, int(options.get('fail-after', 0))))
+            else:
+                shutil.copyfileobj(review, sys.stdout, 1 << 16)
+            sys.stdout.flush()
+    except OSError as ex:
+        print(f"cannot read {args[0]}: {ex}", file=sys.stderr)
+        return 1
+
+    time.sleep(float(options.get('sleep', 0)))
+    if fail:
+        print(f"simulated failure for {args[0]}", file=sys.stderr)
+        return int(options.get('exit-code', 3))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
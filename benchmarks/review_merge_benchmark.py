@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark for merging dreview CSV outputs.
+
+Compares the previous clean (rewrite every file without its unit line) plus
+pandas concat merge with ReviewCsvService.merge_csv_files, which drops the unit
+line while streaming and k-way merges the files by TIME, on synthetic dreview
+outputs with overlapping time ranges. Checks that both produce the same rows.
+
+Usage (from the repository root):
+    python benchmarks/review_merge_benchmark.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.review_to_csv_service import ReviewCsvService  # noqa: E402
+
+FILES = 24
+ROWS_PER_FILE = 50_000
+MERGED_FILE = "merged.csv"
+
+
+def write_review_csvs(folder: Path, seed: int = 0) -> None:
+    """dreview-style CSVs: header, unit line, 1 s rows; consecutive files overlap by 10%."""
+    rnd = random.Random(seed)
+    start = datetime(2025, 1, 13)
+    for i in range(FILES):
+        lines = ["TIME, M1:VAL,M1:ST,M1:FLAT", ",m3/h,,"]
+        t0 = start + timedelta(seconds=int(i * ROWS_PER_FILE * 0.9))
+        for k in range(ROWS_PER_FILE):
+            t = t0 + timedelta(seconds=k)
+            lines.append(f"{t:%y/%m/%d %H:%M:%S},{rnd.uniform(0, 200):.3f},{rnd.randint(0, 1)},0")
+        (folder / f"review_{i:03d}.csv").write_text("\n".join(lines))
+
+
+def legacy_clean_and_merge(folder: Path) -> None:
+    """Previous clean_csv_files + merge_csv_files."""
+    csv_files = list(folder.glob("*.csv"))
+    for csv_file in csv_files:
+        lines = csv_file.read_text().splitlines()
+        if len(lines) > 1:
+            lines.pop(1)
+            csv_file.write_text("\n".join(lines))
+    df_list = [pd.read_csv(f, on_bad_lines='skip', engine='python') for f in csv_files]
+    pd.concat(df_list, ignore_index=True).to_csv(folder / MERGED_FILE, index=False)
+    for csv_file in csv_files:
+        csv_file.unlink()
+
+
+def streaming_merge(folder: Path) -> None:
+    service = ReviewCsvService.__new__(ReviewCsvService)
+    service.folder_path = folder
+    service.merged_file = MERGED_FILE
+    service.merge_csv_files()
+
+
+def timed(func, folder: Path) -> float:
+    t0 = time.perf_counter()
+    func(folder)
+    return time.perf_counter() - t0
+
+
+def run() -> None:
+    with tempfile.TemporaryDirectory() as old_dir, tempfile.TemporaryDirectory() as new_dir:
+        old_folder, new_folder = Path(old_dir), Path(new_dir)
+        write_review_csvs(old_folder)
+        write_review_csvs(new_folder)
+
+        old_elapsed = timed(legacy_clean_and_merge, old_folder)
+        new_elapsed = timed(streaming_merge, new_folder)
+
+        old = pd.read_csv(old_folder / MERGED_FILE)
+        new = pd.read_csv(new_folder / MERGED_FILE)
+        if not pd.to_datetime(new['TIME'], format='%y/%m/%d %H:%M:%S').is_monotonic_increasing:
+            raise AssertionError("Streaming merge output is not in TIME order")
+        columns = list(old.columns)
+        old = old.sort_values(columns, kind='stable').reset_index(drop=True)
+        new = new.sort_values(columns, kind='stable').reset_index(drop=True)
+        pd.testing.assert_frame_equal(old, new, check_dtype=False)
+
+        print(f"{FILES} files x {ROWS_PER_FILE:,} rows: old {old_elapsed:.2f}s, new {new_elapsed:.2f}s, "
+              f"speedup {old_elapsed / max(new_elapsed, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark for ReviewCsvService pipe mode.
+
+Runs the dreview stand-in (benchmarks/dreview_stub.py) over synthetic review
+files two ways: redirected to one CSV per review file followed by
+merge_csv_files (the file workflow without the cmd.exe hop), and pipe mode,
+where the stand-in's stdout is merged directly. Checks that both merged files
+are identical.
+
+Pipe mode is run a second time with a single dreview process (far more files
+than processes) to check that buffered output stays bounded: finished files
+spill to disk instead of waiting in memory for the last file to start.
+
+Usage (from the repository root):
+    python benchmarks/review_pipe_benchmark.py
+"""
+
+import filecmp
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.review_merge_benchmark import write_review_csvs  # noqa: E402
+from services.review_to_csv_service import PIPE_BUFFER_LINES, ReviewCsvService  # noqa: E402
+
+STUB = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "dreview_stub.py")]
+MERGED_FILE = "merged.csv"
+
+
+def make_review_folder(folder: Path) -> None:
+    """Synthetic .review files holding the CSV the stand-in prints for them."""
+    write_review_csvs(folder)
+    for csv_file in folder.glob("*.csv"):
+        csv_file.rename(csv_file.with_suffix(".review"))
+
+
+def make_service(folder: Path, pipe_output: bool, max_processes: int = None) -> ReviewCsvService:
+    return ReviewCsvService(folder_path=str(folder), start_time="25/01/13_00:00:00",
+                            end_time="25/01/31_00:00:00", peek_list=["M1:VAL", "M1:ST", "M1:FLAT"],
+                            dump_all=True, merged_file=MERGED_FILE,
+                            pipe_output=pipe_output, dreview_command=STUB,
+                            max_processes=max_processes, time_pruning=False)
+
+
+def file_workflow(folder: Path) -> None:
+    """dreview redirected to a CSV per review file, then merged."""
+    service = make_service(folder, pipe_output=False)
+    for review_file in service.review_files:
+        with open(folder / f"{review_file.stem}.csv", "w") as out:
+            subprocess.run(service._dreview_args(review_file), stdout=out, check=True)
+    service.merge_csv_files()
+
+
+def pipe_workflow(folder: Path) -> None:
+    make_service(folder, pipe_output=True).run()
+
+
+def peak_buffered_pipe_run(folder: Path) -> tuple:
+    """Pipe mode with one dreview process; returns (peak buffered lines, total rows)."""
+    service = make_service(folder, pipe_output=True, max_processes=1)
+    peak = 0
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, sum(pipe.buffered_lines for pipe in list(service._pipes)))
+            time.sleep(0.005)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        service.run()
+    finally:
+        done.set()
+        sampler.join()
+    return peak, sum(pipe.rows for pipe in service._pipes)
+
+
+def timed(func, folder: Path) -> float:
+    t0 = time.perf_counter()
+    func(folder)
+    return time.perf_counter() - t0
+
+
+def run() -> None:
+    with tempfile.TemporaryDirectory() as file_dir, tempfile.TemporaryDirectory() as pipe_dir:
+        file_folder, pipe_folder = Path(file_dir), Path(pipe_dir)
+        make_review_folder(file_folder)
+        make_review_folder(pipe_folder)
+
+        file_elapsed = timed(file_workflow, file_folder)
+        pipe_elapsed = timed(pipe_workflow, pipe_folder)
+
+        if not filecmp.cmp(file_folder / MERGED_FILE, pipe_folder / MERGED_FILE, shallow=False):
+            raise AssertionError("Pipe mode merged file differs from the file workflow")
+        leftovers = [f.name for f in pipe_folder.glob("*.csv") if f.name != MERGED_FILE]
+        if leftovers:
+            raise AssertionError(f"Pipe mode left per-file CSVs behind: {leftovers}")
+
+        file_count = len(list(pipe_folder.glob('*.review')))
+        print(f"{file_count} review files: "
+              f"file workflow {file_elapsed:.2f}s, pipe mode {pipe_elapsed:.2f}s")
+
+        peak, total = peak_buffered_pipe_run(pipe_folder)
+        if not filecmp.cmp(file_folder / MERGED_FILE, pipe_folder / MERGED_FILE, shallow=False):
+            raise AssertionError("Single-process pipe mode merged file differs from the file workflow")
+        if peak > file_count * PIPE_BUFFER_LINES:
+            raise AssertionError(f"Pipe mode buffered {peak} lines, bound is {file_count * PIPE_BUFFER_LINES}")
+        leftovers = list(Path(tempfile.gettempdir()).glob("review_*.dreview"))
+        if leftovers:
+            raise AssertionError(f"Pipe mode left spill files behind: {leftovers}")
+        print(f"  1 dreview process: peak {peak:,} of {total:,} lines buffered in memory")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Behaviour checks for ReviewCsvService pipe mode, using the dreview stand-in
+(benchmarks/dreview_stub.py) as a real subprocess.
+
+Covers:
+  - pipe mode vs the file workflow (same merged file, no failures reported)
+  - a dreview that exits non-zero part-way through one file (reported in
+    files_failed, the run is not marked cancelled)
+  - every dreview failing (run() raises, no merged file is left behind)
+  - cancellation while dreview is running (run() returns promptly with
+    cancelled set, no merged file and no dreview processes left)
+
+The file workflow is the one from review_pipe_benchmark.py (the stand-in
+redirected to one CSV per review file, then merge_csv_files), since the
+service's own file mode goes through cmd.exe.
+
+Usage (from the repository root):
+    python benchmarks/review_pipe_check.py
+"""
+
+import filecmp
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import psutil
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.review_merge_benchmark import FILES, ROWS_PER_FILE  # noqa: E402
+from benchmarks.review_pipe_benchmark import (MERGED_FILE, STUB, file_workflow,  # noqa: E402
+                                              make_review_folder)
+from services.review_to_csv_service import ReviewCsvService  # noqa: E402
+
+FAIL_AFTER_LINES = 100
+
+
+def pipe_service(folder: Path, *stub_options: str, max_processes: int = None) -> ReviewCsvService:
+    return ReviewCsvService(folder_path=str(folder), start_time="25/01/13_00:00:00",
+                            end_time="25/01/31_00:00:00", peek_list=["M1:VAL", "M1:ST", "M1:FLAT"],
+                            dump_all=True, merged_file=MERGED_FILE, pipe_output=True,
+                            dreview_command=STUB + list(stub_options),
+                            max_processes=max_processes, time_pruning=False)
+
+
+def check(label: str, ok: bool) -> None:
+    print(f"  {'ok  ' if ok else 'FAIL'} {label}")
+    if not ok:
+        sys.exit(1)
+
+
+def stub_processes() -> list:
+    return [child for child in psutil.Process().children(recursive=True)
+            if child.is_running() and child.status() != psutil.STATUS_ZOMBIE]
+
+
+def run() -> None:
+    with tempfile.TemporaryDirectory() as file_dir, tempfile.TemporaryDirectory() as pipe_dir:
+        file_folder, pipe_folder = Path(file_dir), Path(pipe_dir)
+        make_review_folder(file_folder)
+        make_review_folder(pipe_folder)
+        merged_path = pipe_folder / MERGED_FILE
+
+        print("pipe mode vs file workflow:")
+        file_workflow(file_folder)
+        stats = pipe_service(pipe_folder).run()
+        check("merged files identical",
+              filecmp.cmp(file_folder / MERGED_FILE, merged_path, shallow=False))
+        check("all rows merged", stats['rows'] == FILES * ROWS_PER_FILE)
+        check("no failures, not cancelled", stats['files_failed'] == [] and not stats['cancelled'])
+
+        print("one dreview exits non-zero:")
+        failing = "review_005"
+        stats = pipe_service(pipe_folder, f"--fail={failing}", f"--fail-after={FAIL_AFTER_LINES}").run()
+        check("failed file reported", stats['files_failed'] == [f"{failing}.review"])
+        check("run not marked cancelled", not stats['cancelled'])
+        # Rows the failing dreview printed before exiting (less header and unit line) stay merged
+        check("other files merged",
+              stats['rows'] == (FILES - 1) * ROWS_PER_FILE + FAIL_AFTER_LINES - 2)
+
+        print("every dreview exits non-zero:")
+        merged_path.unlink()
+        try:
+            pipe_service(pipe_folder, "--fail=review_", "--fail-after=10").run()
+            raised = False
+        except RuntimeError:
+            raised = True
+        check("run() raises RuntimeError", raised)
+        check("no merged file left", not merged_path.exists())
+
+        print("cancel while dreview runs:")
+        service = pipe_service(pipe_folder, "--sleep=30", max_processes=2)
+        threading.Timer(1.0, service.cancel).start()
+        started = time.perf_counter()
+        stats = service.run()
+        elapsed = time.perf_counter() - started
+        check(f"run() returned after {elapsed:.1f}s", elapsed < 10)
+        check("run marked cancelled", stats['cancelled'])
+        check("no merged file left", not merged_path.exists())
+        time.sleep(0.5)
+        check("no dreview processes left", not stub_processes())
+
+    print("all pipe mode checks passed")
+
+
+if __name__ == "__main__":
+    run()
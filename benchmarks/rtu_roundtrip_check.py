@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Round-trip check for the native RTU .dt writer and the flat CSV writer.
+
+Writes synthetic .dt files with RtuWriter (straight and wrapped ring buffer),
+resizes them with RtuResizer.extract_range and copy_range (with and without a
+tag_mapping, including one that merges two tags), re-reads every output with
+RtuResizer and compares ids, times, values and the dictionary. Also checks that
+export_to_csv_flat is byte-identical to the previous per-row csv.writer loop
+across a DST change. Exits non-zero on the first mismatch.
+
+Usage (from the repository root):
+    python benchmarks/rtu_roundtrip_check.py
+"""
+
+import csv
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+# DST change inside the data window; set before tzlocal is first used
+os.environ.setdefault('TZ', 'America/Chicago')
+
+import numpy as np  # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.rtu_service import CUSTOM_EPOCH_UTC, RtuResizer, RtuWriter  # noqa: E402
+
+DICTIONARY = ['PUMP1.FLOW', 'PUMP1.PRESS', 'Tank "A",Level', 'VALVE_7', 'ÜBER.TEMP']
+POINTS = 60_000
+# 2026-03-08 02:00 local (America/Chicago) is skipped; start a few hours before
+START_SEC = int((datetime(2026, 3, 8, 5, tzinfo=timezone.utc) - CUSTOM_EPOCH_UTC).total_seconds())
+
+
+def make_points(seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Chronological points: every tag ~once per second, mixed quality bytes and odd values."""
+    rng = np.random.default_rng(seed)
+    times = START_SEC + np.sort(rng.integers(0, POINTS // 2, POINTS)).astype(np.int32)
+    nameids = rng.integers(1, len(DICTIONARY) + 1, POINTS, dtype=np.uint32)
+    # A few ids outside the dictionary (exported as UNKNOWN_<id>)
+    nameids[rng.integers(0, POINTS, 20)] = len(DICTIONARY) + 3
+    quality = rng.choice(np.array([0, 0, 0, 1, 0x40, 0x80], dtype=np.uint32), POINTS)
+    ids = ((quality << 24) | nameids).view(np.int32)
+    values = (rng.normal(100, 50, POINTS)).astype(np.float32)
+    values[::997] = np.nan
+    values[::1999] = np.inf
+    values[::2003] = -0.0
+    values[::3001] = np.float32(1.2345678e-20)
+    return ids, times, values
+
+
+def read_back(path: str) -> tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+    """Dictionary and all points of a .dt file in physical order."""
+    resizer = RtuResizer(path)
+    try:
+        ids, times, values = resizer._select_points()
+        return list(resizer.rtu.Dictionary), ids.copy(), times.copy(), values.copy()
+    finally:
+        resizer.close()
+
+
+def decoded(dictionary: list, ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> list:
+    """Points as (tag name, quality, time, value bits) tuples, independent of nameid numbering."""
+    nameids = (ids & 0xFFFFFF).tolist()
+    names = [dictionary[n - 1] if 1 <= n <= len(dictionary) else f"UNKNOWN_{n}" for n in nameids]
+    return list(zip(names, ((ids >> 24) & 0xFF).tolist(), times.astype(np.int64).tolist(),
+                    np.asarray(values, dtype=np.float32).view(np.uint32).tolist()))
+
+
+def check(label: str, ok: bool) -> None:
+    print(f"  {'ok  ' if ok else 'FAIL'} {label}")
+    if not ok:
+        sys.exit(1)
+
+
+def check_points(label: str, got: tuple, ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> None:
+    _, got_ids, got_times, got_values = got
+    check(f"{label}: ids", np.array_equal(got_ids.astype(np.int32), ids))
+    check(f"{label}: times", np.array_equal(got_times.astype(np.int64), times.astype(np.int64)))
+    check(f"{label}: values (bitwise)",
+          np.array_equal(got_values.astype(np.float32).view(np.uint32), values.view(np.uint32)))
+
+
+def legacy_flat_csv(csv_file: str, dictionary: list, ids: np.ndarray, times: np.ndarray,
+                    values: np.ndarray) -> None:
+    """Previous export_to_csv_flat row loop (one csv.writer row per point)."""
+    import tzlocal
+    local_tz = tzlocal.get_localzone()
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['datetime', 'timestamp', 'tag_name', 'value', 'quality'])
+        for tsec, point_id, val in zip(times.tolist(), ids.tolist(), values.tolist()):
+            nameid = point_id & 0xFFFFFF
+            qualid = (point_id >> 24) & 0xFF
+            dt_local = (CUSTOM_EPOCH_UTC + timedelta(seconds=tsec)).astimezone(local_tz).replace(tzinfo=None)
+            tag = dictionary[nameid - 1] if 1 <= nameid <= len(dictionary) else f"UNKNOWN_{nameid}"
+            writer.writerow([dt_local.strftime('%Y-%m-%d %H:%M:%S'), tsec, tag, float(val),
+                             "GOOD" if qualid == 0 else "BAD"])
+
+
+def run_case(workdir: str, name: str, ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> None:
+    print(f"{name}:")
+    source = os.path.join(workdir, f"{name}.dt")
+    RtuWriter(source).write(DICTIONARY, ids, times, values)
+    got = read_back(source)
+    check("dictionary", got[0] == DICTIONARY)
+    check_points("RtuWriter -> RtuResizer", got, ids, times, values)
+
+    # Resize a window (spanning the wrap point in the ring case) both ways
+    lo, hi = int(np.sort(times)[POINTS // 4]), int(np.sort(times)[3 * POINTS // 4])
+    window = (times >= lo) & (times <= hi)
+    expected = decoded(DICTIONARY, ids[window], times[window], values[window])
+    mappings = {
+        'no mapping': None,
+        'tag_mapping': {'PUMP1.FLOW': 'P1_FLOW', 'VALVE_7': 'V7'},
+        'merging tag_mapping': {'PUMP1.FLOW': 'PUMP1', 'PUMP1.PRESS': 'PUMP1'},
+    }
+    for label, mapping in mappings.items():
+        renamed = [(mapping.get(tag, tag) if mapping and not tag.startswith('UNKNOWN_') else tag,
+                    *rest) for tag, *rest in expected]
+        resizer = RtuResizer(source)
+        try:
+            extracted = os.path.join(workdir, f"{name}_extract.dt")
+            check(f"extract_range ({label}): count",
+                  resizer.extract_range(lo, hi, extracted, mapping) == len(expected))
+            copied = os.path.join(workdir, f"{name}_copy.dt")
+            written = resizer.copy_range(lo, hi, copied, mapping)
+        finally:
+            resizer.close()
+
+        out = read_back(extracted)
+        check(f"extract_range ({label}): points", decoded(*out) == renamed)
+        check(f"extract_range ({label}): dictionary has no duplicates", len(set(out[0])) == len(out[0]))
+        if mapping and len(set(mapping.values())) < len(mapping):
+            check(f"copy_range ({label}): falls back to extract_range", written is None)
+            continue
+        check(f"copy_range ({label}): block copy used", written == len(expected))
+        out = read_back(copied)
+        check(f"copy_range ({label}): points", decoded(*out) == renamed)
+        check(f"copy_range ({label}): dictionary",
+              out[0] == [mapping.get(tag, tag) if mapping else tag for tag in DICTIONARY])
+
+    # Flat CSV export must match the previous row-by-row writer byte for byte
+    legacy_csv = os.path.join(workdir, f"{name}_legacy.csv")
+    flat_csv = os.path.join(workdir, f"{name}_flat.csv")
+    legacy_flat_csv(legacy_csv, DICTIONARY, ids, times, values)
+    resizer = RtuResizer(source)
+    try:
+        resizer.export_to_csv_flat(flat_csv)
+    finally:
+        resizer.close()
+    with open(legacy_csv, 'rb') as a, open(flat_csv, 'rb') as b:
+        check("export_to_csv_flat byte-identical to the row writer", a.read() == b.read())
+
+
+def main() -> None:
+    ids, times, values = make_points()
+    with tempfile.TemporaryDirectory() as workdir:
+        run_case(workdir, 'straight', ids, times, values)
+        # Ring buffer that has wrapped: the newest third sits at the start of the file
+        shift = POINTS // 3
+        run_case(workdir, 'wrapped', np.roll(ids, shift), np.roll(times, shift), np.roll(values, shift))
+    print("all round-trip checks passed")
+
+
+if __name__ == '__main__':
+    main()
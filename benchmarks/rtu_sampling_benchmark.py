@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark for RTU "actual" sampling.
+
+Compares the previous per-target full scan (np.argmin over |timestamps - target|)
+with the searchsorted-based RtuResizer._select_actual_timestamps on synthetic
+1-day and 7-day timestamp sets, and checks that both select the same points.
+
+Usage (from the repository root):
+    python benchmarks/rtu_sampling_benchmark.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.rtu_service import RtuResizer  # noqa: E402
+
+SECONDS_PER_DAY = 86400
+INTERVAL_SEC = 60
+
+
+def legacy_select_actual(timestamps: np.ndarray, start_sec: int, end_sec: int, interval_sec: int) -> list:
+    """Previous _sample_actual selection loop (full scan per target)."""
+    selected = []
+    current_target = start_sec
+    last_selected_time = None
+
+    while current_target <= end_sec:
+        closest_idx = int(np.argmin(np.abs(timestamps - current_target)))
+        closest_time = timestamps[closest_idx]
+
+        if last_selected_time is not None and closest_time == last_selected_time:
+            current_target += interval_sec
+            continue
+
+        selected.append(closest_idx)
+        last_selected_time = closest_time
+        current_target = closest_time + interval_sec
+
+    return selected
+
+
+def make_timestamps(days: int, seed: int = 0) -> np.ndarray:
+    """1 Hz timestamps with ~5% missing seconds and a few multi-minute outages."""
+    rng = np.random.default_rng(seed)
+    start = 1_800_000_000
+    seconds = np.arange(start, start + days * SECONDS_PER_DAY, dtype=np.int64)
+    keep = rng.random(len(seconds)) > 0.05
+    for outage in rng.integers(0, len(seconds), 4 * days):
+        keep[outage:outage + int(rng.integers(120, 1800))] = False
+    return seconds[keep]
+
+
+def run(days: int) -> None:
+    timestamps = make_timestamps(days)
+    start_sec, end_sec = int(timestamps[0]), int(timestamps[-1])
+
+    t0 = time.perf_counter()
+    old = legacy_select_actual(timestamps, start_sec, end_sec, INTERVAL_SEC)
+    old_elapsed = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    new = RtuResizer._select_actual_timestamps(timestamps, start_sec, end_sec, INTERVAL_SEC)
+    new_elapsed = time.perf_counter() - t0
+
+    if new.tolist() != old:
+        raise AssertionError(f"{days}-day selection differs between old and new implementation")
+
+    print(f"{days}-day file: {len(timestamps):,} timestamps -> {len(new):,} samples | "
+          f"old {old_elapsed:.3f}s, new {new_elapsed:.4f}s, "
+          f"speedup {old_elapsed / max(new_elapsed, 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    for days in (1, 7):
+        run(days)
@@ -17,6 +17,7 @@ import base64
 from components.bootstrap_icon import BootstrapIcon
 from components.file_selector import create_file_selector, create_file_selector_callback
 from services.flowmeter_acceptance_service import FlowmeterAcceptanceService
+from services.job_service import get_job_service
 
 # Create file selectors for the three file inputs
 rtu_file_component, rtu_file_store, rtu_file_ids = create_file_selector(
@@ -499,8 +500,20 @@ def create_flowmeter_acceptance_page():
                                         leftSection=BootstrapIcon(
                                             icon="play-circle", width=20),
                                         disabled=True
+                                    ),
+                                    dmc.Button(
+                                        "Cancel",
+                                        id="cancel-analysis-btn",
+                                        size="lg",
+                                        variant="outline",
+                                        color="red",
+                                        leftSection=BootstrapIcon(
+                                            icon="x-circle", width=20),
+                                        disabled=True
                                     )
                                 ], justify="center", gap="md"),
+                                html.Div(id="analysis-progress",
+                                         style={'minHeight': '20px'}),
                                 dmc.Space(h="sm"),
                                 dmc.Group([
                                     dmc.Checkbox(
@@ -695,7 +708,12 @@ def create_flowmeter_acceptance_page():
         review_file_store,
 
         # Store for analysis results data
-        dcc.Store(id="analysis-results-store", data={})
+        dcc.Store(id="analysis-results-store", data={}),
+
+        # Background analysis job: ID of the running job and its status poll
+        dcc.Store(id="analysis-job-store", data={}),
+        dcc.Interval(id="analysis-job-interval", interval=1000,
+                     n_intervals=0, disabled=True)
     ], fluid=True, py="sm")
 
 
@@ -817,7 +835,12 @@ def handle_form_actions(partial_clicks, full_clicks,
      Output("analysis-results-content", "children"),
      Output("results-tab", "disabled"),
      Output("analysis-results-store", "data"),
-     Output('flowmeter-notifications', 'children', allow_duplicate=True)],
+     Output('flowmeter-notifications', 'children', allow_duplicate=True),
+     Output("analysis-job-store", "data"),
+     Output("analysis-job-interval", "disabled", allow_duplicate=True),
+     Output("cancel-analysis-btn", "disabled", allow_duplicate=True),
+     Output("run-analysis-btn", "disabled", allow_duplicate=True),
+     Output("analysis-progress", "children", allow_duplicate=True)],
     Input("run-analysis-btn", "n_clicks"),
     [State(rtu_file_ids['input'], "value"),
      State(csv_tags_ids['input'], "value"),
@@ -844,14 +867,34 @@ def handle_form_actions(partial_clicks, full_clicks,
      State("drift-threshold-input", "value"),
      State("stability-threshold-input", "value"),
      State("use-existing-data-checkbox", "checked"),
-     State("plotly-theme-store", "data")],
+     State("plotly-theme-store", "data"),
+     State("analysis-job-store", "data")],
     prevent_initial_call=True
 )
 def run_flowmeter_analysis(n_clicks, rtu_file, csv_file, review_file, start_time, end_time,
                            flat_threshold, min_flow, max_flow, accuracy_range,
                            rel1, rel2, rel3, rel4, tc1, tc2, rob1, acc1, acc2, acc3, acc4, acc5,
-                           stability_window, drift_threshold, stability_threshold, use_existing_data, theme_data):
-    """Run the flowmeter analysis with all parameters."""
+                           stability_window, drift_threshold, stability_threshold, use_existing_data, theme_data,
+                           job_data):
+    """Validate the parameters and start the flowmeter analysis as a background job."""
+    # Job store, interval, cancel button, run button and progress stay as they are
+    no_job_change = (dash.no_update,) * 5
+
+    # Only one analysis at a time - a second job would replace the first in the job store
+    running_job_id = (job_data or {}).get('job_id')
+    running_status = get_job_service().status(running_job_id) if running_job_id else None
+    if running_status and running_status['status'] == 'running':
+        already_running_notification = dmc.Notification(
+            title="Analysis Already Running",
+            message="Wait for the current analysis to finish or cancel it before starting another.",
+            color="orange",
+            autoClose=5000,
+            action="show",
+            icon=BootstrapIcon(icon="exclamation-triangle")
+        )
+        return (dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update,
+                already_running_notification, *no_job_change)
+
     if not all([rtu_file, csv_file, review_file]):
         missing_files_notification = dmc.Notification(
             title="Missing Files",
@@ -867,11 +910,9 @@ def run_flowmeter_analysis(n_clicks, rtu_file, csv_file, review_file, start_time
             title="Missing Files",
             color="red",
             icon=BootstrapIcon(icon="exclamation-triangle")
-        ), True, {}, missing_files_notification
+        ), True, {}, missing_files_notification, *no_job_change
 
     try:
-        # Show loading
-        # Here we would call the service to run the analysis
         service = FlowmeterAcceptanceService()
 
         # Convert datetime values to proper string format for the service
@@ -960,7 +1001,7 @@ def run_flowmeter_analysis(n_clicks, rtu_file, csv_file, review_file, start_time
                 action="show",
                 icon=BootstrapIcon(icon="exclamation-triangle")
             )
-            return False, "setup", dash.no_update, True, dash.no_update, error_notification
+            return False, "setup", dash.no_update, True, dash.no_update, error_notification, *no_job_change
 
         # Prepare parameters dictionary - UI must provide all required values, no defaults
         params = {
@@ -997,36 +1038,119 @@ def run_flowmeter_analysis(n_clicks, rtu_file, csv_file, review_file, start_time
             'use_existing_data': use_existing_data or False
         }
 
-        # Run analysis
-        results = service.run_analysis(params)
-
-        # Create results display
-        checks_selected = [rel1, rel2, rel3, rel4,
-                           tc1, tc2, rob1, acc1, acc2, acc3, acc4]
-        selected_count = sum(checks_selected)
+        # Run the analysis in the background; analysis-job-interval polls its progress
+        job_id = get_job_service().submit(
+            service.run_analysis, params, name="flowmeter_analysis", on_cancel=service.cancel)
 
-        # Generate comprehensive time series visualizations
-        plots = service.create_analysis_plots(theme_data)
+        started_notification = dmc.Notification(
+            title="Analysis Started",
+            message="Flowmeter analysis is running in the background. Progress is shown below the Run Analysis button.",
+            color="blue",
+            autoClose=5000,
+            action="show",
+            icon=BootstrapIcon(icon="clock")
+        )
 
-        # Create CSV export notification
-        csv_export_info = results.get('csv_export', {})
-        exported_files = csv_export_info.get('exported_files', [])
+        return (False, "setup", dash.no_update, True, dash.no_update, started_notification,
+                {'job_id': job_id}, False, False, True,
+                _analysis_progress_alert("Starting analysis...", None))
 
-        csv_notification = dmc.Notification(
-            title="CSV Data Exported",
-            message=f"Successfully exported {len(exported_files)} CSV files to _Data directory: SCADATagID_DIG.csv, SCADATagID_ANL.csv, Ref_SCADATagID.csv, MBSTagID.csv, Reference_Meter.csv",
-            color="green",
-            autoClose=5000,
+    except Exception as e:
+        error_notification = dmc.Notification(
+            title="Analysis Failed",
+            message="Please check your input files and parameters, then try again.",
+            color="red",
+            autoClose=False,
             action="show",
-            icon=BootstrapIcon(icon="file-earmark-spreadsheet")
+            icon=BootstrapIcon(icon="exclamation-triangle")
         )
 
-        # Don't override the Results tab content - let the new Results tab callbacks handle it
-        # Just return no_update for the content and let the store data trigger the callbacks
+        return False, "results", _analysis_error_content(str(e)), False, {}, error_notification, *no_job_change
 
-        return False, "results", dash.no_update, False, results, csv_notification
 
-    except Exception as e:
+# Stage labels for analysis progress
+ANALYSIS_STAGE_LABELS = {
+    'export': "Exporting data",
+    'tests': "Running meter tests",
+    'plots': "Generating plots",
+}
+
+
+def _analysis_progress_alert(message, percent):
+    """Progress alert shown below the Run Analysis button while the job runs."""
+    return dmc.Alert([
+        dmc.Group([
+            BootstrapIcon(icon="clock", width=16),
+            dmc.Text(message, size="sm")
+        ], gap="xs"),
+        dmc.Space(h="xs"),
+        dmc.Progress(value=100 if percent is None else percent,
+                     animated=True, color="blue", size="sm")
+    ], color="blue", variant="light", mt="sm")
+
+
+def _analysis_error_content(error):
+    """Results tab content for a failed analysis."""
+    return dmc.Stack([
+        dmc.Alert(
+            f"Analysis failed: {error}",
+            title="❌ Analysis Error",
+            color="red",
+            icon=BootstrapIcon(icon="exclamation-triangle")
+        ),
+        dmc.Text("Please check your input files and parameters, then try again.",
+                 ta="center", c="dimmed", size="sm")
+    ], gap="md")
+
+
+# Poll the background analysis job and show its results when it finishes
+@callback(
+    [Output("main-tabs", "value", allow_duplicate=True),
+     Output("analysis-results-content", "children", allow_duplicate=True),
+     Output("results-tab", "disabled", allow_duplicate=True),
+     Output("analysis-results-store", "data", allow_duplicate=True),
+     Output('flowmeter-notifications', 'children', allow_duplicate=True),
+     Output("analysis-job-store", "data", allow_duplicate=True),
+     Output("analysis-job-interval", "disabled", allow_duplicate=True),
+     Output("cancel-analysis-btn", "disabled", allow_duplicate=True),
+     Output("run-analysis-btn", "disabled", allow_duplicate=True),
+     Output("analysis-progress", "children", allow_duplicate=True)],
+    Input("analysis-job-interval", "n_intervals"),
+    State("analysis-job-store", "data"),
+    prevent_initial_call=True
+)
+def poll_analysis_job(n_intervals, job_data):
+    """Update analysis progress and collect the result of the background job."""
+    job_id = (job_data or {}).get('job_id')
+    status = get_job_service().status(job_id) if job_id else None
+    # Tab, results content, results tab, results store and notifications unchanged
+    no_results_change = (dash.no_update,) * 5
+
+    if status is None:
+        # Unknown or expired job - stop polling
+        return (*no_results_change, {}, True, True, False, "")
+
+    if status['status'] == 'running':
+        stage_label = ANALYSIS_STAGE_LABELS.get(status['stage'], "Starting analysis")
+        message = f"{stage_label}: {status['progress']} ({status['elapsed_sec']:.0f}s elapsed)"
+        return (*no_results_change, dash.no_update, False, False, True,
+                _analysis_progress_alert(message, status['percent']))
+
+    get_job_service().discard(job_id)
+    finished = ({}, True, True, False, "")
+
+    if status['status'] == 'cancelled':
+        cancel_notification = dmc.Notification(
+            title="Analysis Cancelled",
+            message="Flowmeter analysis has been cancelled",
+            color="orange",
+            autoClose=3000,
+            action="show"
+        )
+        return (dash.no_update, dash.no_update, dash.no_update, dash.no_update,
+                cancel_notification, *finished)
+
+    if status['status'] == 'failed':
         error_notification = dmc.Notification(
             title="Analysis Failed",
             message="Please check your input files and parameters, then try again.",
@@ -1035,17 +1159,45 @@ def run_flowmeter_analysis(n_clicks, rtu_file, csv_file, review_file, start_time
             action="show",
             icon=BootstrapIcon(icon="exclamation-triangle")
         )
+        return ("results", _analysis_error_content(status['error']), False, {},
+                error_notification, *finished)
+
+    results = status['result']
+
+    # Create CSV export notification
+    csv_export_info = results.get('csv_export', {})
+    exported_files = csv_export_info.get('exported_files', [])
+
+    csv_notification = dmc.Notification(
+        title="CSV Data Exported",
+        message=f"Successfully exported {len(exported_files)} CSV files to _Data directory: SCADATagID_DIG.csv, SCADATagID_ANL.csv, Ref_SCADATagID.csv, MBSTagID.csv, Reference_Meter.csv",
+        color="green",
+        autoClose=5000,
+        action="show",
+        icon=BootstrapIcon(icon="file-earmark-spreadsheet")
+    )
 
-        return False, "results", dmc.Stack([
-            dmc.Alert(
-                f"Analysis failed: {str(e)}",
-                title="❌ Analysis Error",
-                color="red",
-                icon=BootstrapIcon(icon="exclamation-triangle")
-            ),
-            dmc.Text("Please check your input files and parameters, then try again.",
-                     ta="center", c="dimmed", size="sm")
-        ], gap="md"), False, {}, error_notification
+    # Don't override the Results tab content - let the new Results tab callbacks handle it
+    # Just return no_update for the content and let the store data trigger the callbacks
+    return ("results", dash.no_update, False, results, csv_notification, *finished)
+
+
+# Cancel the background analysis job
+@callback(
+    [Output("cancel-analysis-btn", "disabled", allow_duplicate=True),
+     Output("analysis-progress", "children", allow_duplicate=True)],
+    Input("cancel-analysis-btn", "n_clicks"),
+    State("analysis-job-store", "data"),
+    prevent_initial_call=True
+)
+def cancel_analysis_job(n_clicks, job_data):
+    """Request cancellation; the poll callback reports when the job has stopped."""
+    job_id = (job_data or {}).get('job_id')
+    if not n_clicks or not job_id:
+        return dash.no_update, dash.no_update
+
+    get_job_service().cancel(job_id)
+    return True, _analysis_progress_alert("Cancelling analysis...", None)
 
 
 # Create file selector callbacks
@@ -1074,12 +1226,18 @@ create_file_selector_callback(review_file_ids, "Select Review File")
      Input("accuracy-check-2", "checked"),
      Input("accuracy-check-3", "checked"),
      Input("accuracy-check-4", "checked"),
-     Input("accuracy-check-5", "checked")]
+     Input("accuracy-check-5", "checked")],
+    State("analysis-job-store", "data")
 )
 def validate_required_fields(rtu_file, csv_file, review_file, min_flow, max_flow,
-                             rel1, rel2, rel3, rel4, tc1, tc2, rob1, acc1, acc2, acc3, acc4, acc5):
+                             rel1, rel2, rel3, rel4, tc1, tc2, rob1, acc1, acc2, acc3, acc4, acc5,
+                             job_data):
     """Validate required fields and enable/disable Run Analysis button."""
 
+    # Keep the button disabled while an analysis job is running
+    if (job_data or {}).get('job_id'):
+        return True
+
     # Check if all required file fields are filled
     files_valid = all([rtu_file, csv_file, review_file])
 
@@ -1101,21 +1259,6 @@ def validate_required_fields(rtu_file, csv_file, review_file, min_flow, max_flow
     # Enable button only if all validations pass
     return not (files_valid and flowrate_valid and at_least_one_check)
 
-# Callback to show loading overlay when analysis button is clicked
-
-
-@callback(
-    Output("analysis-loading", "visible", allow_duplicate=True),
-    Input("run-analysis-btn", "n_clicks"),
-    prevent_initial_call=True
-)
-def show_loading_on_click(n_clicks):
-    """Show loading overlay immediately when Run Analysis is clicked."""
-    if n_clicks and n_clicks > 0:
-        return True
-    return False
-
-
 # Results Tab Callbacks
 
 @callback(
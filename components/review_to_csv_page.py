@@ -99,6 +99,11 @@ class ReviewServiceWrapper:
             if task_manager:
                 task_manager.update_progress("Setting up Review file service...")
             
+            def report_file(files_done, file_count, review_file):
+                if task_manager:
+                    task_manager.update_progress(
+                        f"Processed review file {files_done}/{file_count}: {review_file.name}")
+
             # Create ReviewCsvService instance
             self._current_service = ReviewCsvService(
                 folder_path=review_folder_path,
@@ -106,7 +111,8 @@ class ReviewServiceWrapper:
                 end_time=end_formatted,
                 dump_all=dump_all,
                 freq=frequency_minutes if not dump_all else None,
-                merged_file="MergedReviewData.csv"
+                merged_file="MergedReviewData.csv",
+                progress_callback=report_file
             )
             
             # Set peek file
@@ -116,14 +122,15 @@ class ReviewServiceWrapper:
                 task_manager.update_progress("Processing Review files...")
             
             # Process the files (this is the time-consuming part)
-            self._current_service.run()
+            stats = self._current_service.run()
             
             # Success result
             result = {
                 'success': True,
                 'task_id': task_id,
                 'output_directory': review_folder_path,
-                'message': 'Review files converted successfully'
+                'message': 'Review files converted successfully',
+                'stats': stats
             }
             
             if task_manager:
@@ -850,9 +857,18 @@ def update_background_task_status(n_intervals):
             background_task_manager.reset()
             
             if result and result.get('success'):
+                stats = result.get('stats') or {}
+                throughput = (f" {stats['files']} files, {stats['rows']:,} rows in {stats['elapsed_sec']:.1f}s "
+                              f"({stats['files_per_sec']:.2f} files/s, {stats['rows_per_sec']:,.0f} rows/s)."
+                              if stats else "")
+                if stats.get('files_pruned'):
+                    throughput += f" {stats['files_pruned']} files outside the time range were skipped."
+                failed_files = stats.get('files_failed') or []
+                if failed_files:
+                    throughput += f" dreview failed for {len(failed_files)} file(s): {', '.join(failed_files)}."
                 success_alert = dmc.Alert(
-                    "Review files converted successfully! Output saved as MergedReviewData.csv in the Review folder.",
-                    color="green",
+                    "Review files converted successfully! Output saved as MergedReviewData.csv in the Review folder." + throughput,
+                    color="yellow" if failed_files else "green",
                     variant="light",
                     icon=BootstrapIcon(icon="check-circle", width=16)
                 )
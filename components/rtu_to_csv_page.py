@@ -29,6 +29,7 @@ class RtuServiceWrapper:
         self._background_thread = None
         self._current_service = None
         self._cancel_requested = False
+        self._cancel_event = threading.Event()
 
     def process_rtu_folder_with_new_service_async(self,
                                                   processing_params: Dict,
@@ -64,6 +65,7 @@ class RtuServiceWrapper:
 
             # Reset cancel flag
             self._cancel_requested = False
+            self._cancel_event.clear()
 
             if task_manager:
                 task_manager.update_progress(
@@ -81,6 +83,7 @@ class RtuServiceWrapper:
             enable_sampling = processing_params['enable_sampling']
             sampling_interval = processing_params['sampling_interval']
             sampling_type = processing_params['sampling_type']
+            output_mode = processing_params.get('output_mode', 'merged')
 
             # Get all .dt files in the folder
             dt_files = glob.glob(os.path.join(rtu_folder_path, "*.dt"))
@@ -116,60 +119,47 @@ class RtuServiceWrapper:
             start_time_str = format_datetime_for_service(start_datetime)
             end_time_str = format_datetime_for_service(end_datetime)
 
-            # Process each .dt file
-            output_files = []
+            # Export all .dt files as one time-ordered CSV (merged in memory)
             total_files = len(dt_files)
 
-            for i, dt_file in enumerate(dt_files, 1):
-                if self._cancel_requested:
-                    logger.info("Processing cancelled by user")
-                    break
-
+            def report_file(i, count, dt_file):
                 # Update progress less frequently to reduce overhead
-                if task_manager and (i == 1 or i % 5 == 0 or i == total_files):
+                if task_manager and (i == 1 or i % 5 == 0 or i == count):
                     task_manager.update_progress(
-                        f"Processing file {i}/{total_files}: {os.path.basename(dt_file)}")
+                        f"Processing file {i}/{count}: {os.path.basename(dt_file)}")
+
+            export_kwargs = {
+                'start_time': start_time_str,
+                'end_time': end_time_str,
+                'csv_format': "flat" if csv_format == "flat-csv" else "dataframe",
+                'progress_callback': report_file,
+                'cancel_event': self._cancel_event
+            }
 
-                # Generate output file name
-                base_name = os.path.splitext(os.path.basename(dt_file))[0]
-                output_file = os.path.join(
-                    rtu_folder_path, f"{base_name}_export.csv")
+            # Add tags file if using selected tags - ensure it's passed for both formats
+            if peek_selection == "SELECTED_PEEKS" and temp_tags_file:
+                export_kwargs['tags_file'] = temp_tags_file
 
-                # Prepare service call parameters
-                export_kwargs = {
-                    'start_time': start_time_str,
-                    'end_time': end_time_str
-                }
+            # Add sampling parameters if enabled
+            if enable_sampling:
+                export_kwargs['enable_sampling'] = True
+                export_kwargs['sample_interval'] = sampling_interval
+                export_kwargs['sample_mode'] = sampling_type
 
-                # Add tags file if using selected tags - ensure it's passed for both formats
-                if peek_selection == "SELECTED_PEEKS" and temp_tags_file:
-                    export_kwargs['tags_file'] = temp_tags_file
+            if output_mode == "per-file":
+                result = self._export_per_file(
+                    task_id, task_manager, sorted(dt_files), rtu_folder_path, export_kwargs)
+                if task_manager:
+                    task_manager.complete_task(result)
+                return
 
-                # Add sampling parameters if enabled
-                if enable_sampling:
-                    export_kwargs['enable_sampling'] = True
-                    export_kwargs['sample_interval'] = sampling_interval
-                    export_kwargs['sample_mode'] = sampling_type
+            merged_file = os.path.join(
+                rtu_folder_path, f"MergedDataFrame_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
 
-                # Call the appropriate export method based on CSV format
-                try:
-                    if csv_format == "flat-csv":
-                        points_exported = self._current_service.export_csv_flat(
-                            dt_file, output_file, **export_kwargs)
-                    else:  # dataframe-csv
-                        points_exported = self._current_service.export_csv_dataframe(
-                            dt_file, output_file, **export_kwargs)
-
-                    output_files.append(output_file)
-                    # Reduce logging frequency for performance
-                    if i == 1 or i % 10 == 0 or i == total_files:
-                        logger.info(
-                            f"Exported {points_exported} points from {dt_file} to {output_file}")
-
-                except Exception as e:
-                    logger.error(f"Failed to process {dt_file}: {str(e)}")
-                    # Continue with next file instead of failing completely
-                    continue
+            points_exported = self._current_service.export_folder_csv(
+                sorted(dt_files), merged_file, **export_kwargs)
+            skipped_files = self._current_service.last_skipped_files
+            files_processed = total_files - len(skipped_files)
 
             if self._cancel_requested:
                 result = {
@@ -177,44 +167,23 @@ class RtuServiceWrapper:
                     'error': 'Processing was cancelled by user',
                     'task_id': task_id
                 }
-            elif output_files:
-                # Merge all CSV files into one sorted by timestamp
-                merged_file = None
-                try:
-                    if task_manager:
-                        task_manager.update_progress(
-                            "Merging CSV files by timestamp...")
-
-                    merged_file = self._merge_csv_files(
-                        output_files, rtu_folder_path)
-
-                    # Success result with merged file
-                    result = {
-                        'success': True,
-                        'task_id': task_id,
-                        'output_directory': rtu_folder_path,
-                        'output_files': output_files,
-                        'merged_file': merged_file,
-                        'files_processed': len(output_files),
-                        'message': f'Successfully processed {len(output_files)} RTU files and merged into {os.path.basename(merged_file)}'
-                    }
-                except Exception as merge_error:
-                    logger.error(
-                        f"Failed to merge CSV files: {str(merge_error)}")
-                    # Still report success for individual files, but note merge failure
-                    result = {
-                        'success': True,
-                        'task_id': task_id,
-                        'output_directory': rtu_folder_path,
-                        'output_files': output_files,
-                        'files_processed': len(output_files),
-                        'merge_error': str(merge_error),
-                        'message': f'Successfully processed {len(output_files)} RTU files (merge failed: {str(merge_error)})'
-                    }
+            elif points_exported and os.path.exists(merged_file):
+                logger.info(
+                    f"Exported {points_exported} points from {files_processed} files to {merged_file}")
+                result = {
+                    'success': True,
+                    'task_id': task_id,
+                    'output_directory': rtu_folder_path,
+                    'output_files': [merged_file],
+                    'merged_file': merged_file,
+                    'files_processed': files_processed,
+                    'skipped_files': skipped_files,
+                    'message': f'Successfully processed {files_processed} RTU files and merged into {os.path.basename(merged_file)}'
+                }
             else:
                 result = {
                     'success': False,
-                    'error': 'No files were successfully processed',
+                    'error': 'No data found in the selected files and time range',
                     'task_id': task_id
                 }
 
@@ -242,107 +211,48 @@ class RtuServiceWrapper:
                 except:
                     pass  # Ignore cleanup errors
 
-    def _merge_csv_files(self, csv_files, output_directory):
-        """
-        Merge multiple CSV files into one, sorted by timestamp.
-
-        Args:
-            csv_files: List of CSV file paths to merge
-            output_directory: Directory where to save the merged file
-
-        Returns:
-            Path to the merged CSV file
-        """
-        import pandas as pd
-        from datetime import datetime
-
-        if not csv_files:
-            raise ValueError("No CSV files to merge")
-
-        logger.info(f"Merging {len(csv_files)} CSV files...")
-
-        # Read all CSV files
-        dataframes = []
-        for csv_file in csv_files:
-            try:
-                df = pd.read_csv(csv_file)
-
-                # Add source file column
-                df['source_file'] = os.path.basename(csv_file)
-
-                dataframes.append(df)
-                logger.debug(f"Read {len(df)} rows from {csv_file}")
-
-            except Exception as e:
-                logger.warning(f"Failed to read {csv_file}: {str(e)}")
-                continue
+    def _export_per_file(self, task_id: str, task_manager, dt_files: List[str],
+                         output_directory: str, export_kwargs: Dict) -> Dict:
+        """Export each .dt file to its own '_export.csv' across the RTUService process pool."""
+        def report_done(done, count, dt_file):
+            if task_manager:
+                task_manager.update_progress(
+                    f"Finished file {done}/{count}: {os.path.basename(dt_file)}")
 
-        if not dataframes:
-            raise ValueError("No valid CSV files could be read")
+        export_kwargs = dict(export_kwargs, progress_callback=report_done)
+        results = self._current_service.export_folder(
+            dt_files, output_directory, **export_kwargs)
+        skipped_files = self._current_service.last_skipped_files
 
-        # Combine all dataframes
-        merged_df = pd.concat(dataframes, ignore_index=True)
-        logger.info(
-            f"Combined {len(merged_df)} total rows from {len(dataframes)} files")
-
-        # Try to find timestamp column and sort by it
-        timestamp_columns = []
-        for col in merged_df.columns:
-            col_lower = col.lower()
-            if any(keyword in col_lower for keyword in ['time', 'date', 'timestamp', 'ts']):
-                timestamp_columns.append(col)
-
-        if timestamp_columns:
-            # Use the first timestamp column found
-            timestamp_col = timestamp_columns[0]
-            logger.info(f"Sorting by timestamp column: {timestamp_col}")
-
-            try:
-                # Try to convert to datetime if it's not already
-                if merged_df[timestamp_col].dtype == 'object':
-                    merged_df[timestamp_col] = pd.to_datetime(
-                        merged_df[timestamp_col], errors='coerce')
-
-                # Sort by timestamp
-                merged_df = merged_df.sort_values(
-                    by=timestamp_col).reset_index(drop=True)
-                logger.info("Successfully sorted by timestamp")
-
-            except Exception as e:
-                logger.warning(
-                    f"Failed to sort by timestamp column {timestamp_col}: {str(e)}")
-                # Continue without sorting
-        else:
-            logger.warning(
-                "No timestamp column found, files will be merged without sorting")
-
-        # Generate output filename
-        merged_filename = f"MergedDataFrame_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        merged_filepath = os.path.join(output_directory, merged_filename)
-
-        # Save merged file
-        merged_df.to_csv(merged_filepath, index=False)
-        logger.info(
-            f"Saved merged CSV file: {merged_filepath} ({len(merged_df)} rows)")
-
-        # Clean up individual CSV files after successful merge
-        for csv_file in csv_files:
-            try:
-                if os.path.exists(csv_file):
-                    os.remove(csv_file)
-                    logger.debug(f"Deleted individual file: {csv_file}")
-            except Exception as e:
-                logger.warning(
-                    f"Failed to delete individual file {csv_file}: {str(e)}")
+        if self._cancel_requested:
+            return {
+                'success': False,
+                'error': 'Processing was cancelled by user',
+                'task_id': task_id
+            }
+        if not results:
+            return {
+                'success': False,
+                'error': 'No data found in the selected files and time range',
+                'task_id': task_id
+            }
 
         logger.info(
-            f"Cleaned up {len(csv_files)} individual CSV files after merge")
-
-        return merged_filepath
+            f"Exported {sum(results.values())} points to {len(results)}/{len(dt_files)} CSV files")
+        return {
+            'success': True,
+            'task_id': task_id,
+            'output_directory': output_directory,
+            'output_files': sorted(results),
+            'files_processed': len(results),
+            'skipped_files': skipped_files,
+            'message': f'Successfully processed {len(results)} RTU files into individual CSV files'
+        }
 
     def cancel_processing(self):
         """Cancel the current RTU processing operation."""
         self._cancel_requested = True
+        self._cancel_event.set()
         logger.info("RTU processing cancellation requested")
 
 
@@ -517,15 +427,11 @@ def create_rtu_to_csv_page():
                             ], gap="xs"),
                             dmc.List([
                                 dmc.ListItem(
-                                    "All .dt files in the selected folder will be processed sequentially"),
-                                dmc.ListItem(
-                                    "Output files are created in the same folder as input files with '_export.csv' suffix"),
+                                    "Merged CSV: all .dt files in the selected folder are combined into one time-ordered 'MergedDataFrame_YYYYMMDD_HHMMSS.csv'"),
                                 dmc.ListItem(
-                                    "Each .dt file creates one corresponding CSV file (e.g., 'data.dt' → 'data_export.csv')"),
+                                    "One CSV per file: files are exported in parallel, each to its own CSV (e.g., 'data.dt' → 'data_export.csv')"),
                                 dmc.ListItem(
-                                    "After processing, all CSV files are automatically merged into 'MergedDataFrame_YYYYMMDD_HHMMSS.csv'"),
-                                dmc.ListItem(
-                                    "The merged file is sorted by timestamp column if found"),
+                                    "Output files are created in the same folder as the input files"),
                                 dmc.ListItem(
                                     "Flat CSV creates one file per tag, DataFrame CSV creates structured data"),
                                 dmc.ListItem(
@@ -732,6 +638,25 @@ def create_rtu_to_csv_page():
 
                                 dmc.Space(h="md"),
 
+                                # Output Mode
+                                dmc.Stack([
+                                    dmc.Text("Output Files",
+                                             size="sm", fw=500),
+                                    dmc.RadioGroup(
+                                        children=dmc.Group([
+                                            dmc.Radio(
+                                                "Merged CSV", value="merged"),
+                                            dmc.Radio("One CSV per file",
+                                                      value="per-file")
+                                        ], gap="xl"),
+                                        id="rtu-output-mode-radio",
+                                        value="merged",
+                                        size="sm"
+                                    )
+                                ], gap="xs"),
+
+                                dmc.Space(h="md"),
+
                                 # Sampling Options
                                 dmc.Stack([
                                     dmc.Text("Data Sampling",
@@ -1068,12 +993,13 @@ def update_convert_button_state(peek_file, rtu_folder, peek_selection):
      State('enable-sampling-switch', 'checked'),
      State('sampling-interval-input', 'value'),
      State('sampling-type-radio', 'value'),
+     State('rtu-output-mode-radio', 'value'),
      State(rtu_directory_ids['store'], 'data')],
     prevent_initial_call=True
 )
 def convert_rtu_to_csv(n_clicks, peek_file, start_datetime, end_datetime,
                        peek_selection, csv_format, enable_sampling, sampling_interval,
-                       sampling_type, rtu_folder):
+                       sampling_type, output_mode, rtu_folder):
     """Process RTU files and convert to CSV format using the new RTU service."""
 
     if not n_clicks:
@@ -1132,7 +1058,8 @@ def convert_rtu_to_csv(n_clicks, peek_file, start_datetime, end_datetime,
             'csv_format': csv_format,
             'enable_sampling': enable_sampling,
             'sampling_interval': sampling_interval if enable_sampling else None,
-            'sampling_type': sampling_type if enable_sampling else None
+            'sampling_type': sampling_type if enable_sampling else None,
+            'output_mode': output_mode
         }
 
         # Start background processing - everything heavy happens here
@@ -1251,9 +1178,14 @@ def update_background_task_status(n_intervals):
                     success_message = f"Successfully processed {files_processed} RTU files! Individual CSV files created."
                     notification_message = f"Successfully processed {files_processed} RTU files! Check folder: {output_directory}"
 
+                skipped_files = result.get('skipped_files') or []
+                if skipped_files:
+                    skipped_names = ", ".join(os.path.basename(f) for f in skipped_files)
+                    success_message += f" Skipped {len(skipped_files)} unreadable file(s): {skipped_names}"
+
                 success_alert = dmc.Alert(
                     success_message,
-                    color="green",
+                    color="yellow" if skipped_files else "green",
                     variant="light",
                     icon=BootstrapIcon(icon="check-circle", width=16)
                 )
@@ -0,0 +1,427 @@
+"""
+Vectorized statistics kernels for the flowmeter acceptance tests.
+
+Array-in, numbers-out helpers shared by Test 2.1 (reporting intervals), the 3.x
+accuracy tests and Test 4.1 (signal stability). Every kernel is a handful of NumPy
+passes over the whole signal - no per-sample Python loops - so a 1M-sample tag
+costs milliseconds rather than seconds.
+
+The streaming_* variants compute the same statistics from a chunk source (a
+callable returning a fresh iterator of 1-D float arrays) with state carried
+between chunks, so memory stays bounded by the chunk size however long the
+acceptance window is. They agree with the batch kernels to floating-point
+rounding (the MAD-based SNR is exact up to MAD_SAMPLE_SIZE steady-state readings
+and estimated from an evenly strided sample beyond that).
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, Sequence, Tuple
+
+import numpy as np
+import scipy.signal
+from scipy import stats as scipy_stats
+
+# A chunk source returns a new iterator over the signal on every call (one per pass)
+ChunkSource = Callable[[], Iterable[np.ndarray]]
+
+# Steady-state readings kept for the streaming median / MAD
+MAD_SAMPLE_SIZE = 1_000_000
+
+
+def summary_stats(values: np.ndarray, percentiles: Sequence[float] = (95,)) -> Dict[str, float]:
+    """
+    max, mean, median, std (population) and the requested percentiles ('p95', ...) of a
+    non-empty array. Median and percentiles come from a single partition pass.
+    """
+    values = np.asarray(values)
+    points = np.percentile(values, [50, *percentiles])
+    stats = {
+        'max': float(np.max(values)),
+        'mean': float(np.mean(values)),
+        'median': float(points[0]),
+        'std': float(np.std(values)),
+    }
+    for percentile, point in zip(percentiles, points[1:]):
+        stats[f'p{percentile:g}'] = float(point)
+    return stats
+
+
+def time_differences(timestamps: np.ndarray) -> np.ndarray:
+    """Differences between consecutive timestamps (length n - 1)."""
+    return np.diff(np.asarray(timestamps))
+
+
+def count_at_most(values: np.ndarray, threshold: float) -> int:
+    """Number of values <= threshold."""
+    return int(np.count_nonzero(np.asarray(values) <= threshold))
+
+
+def count_outside(values: np.ndarray, lower: float, upper: float) -> int:
+    """Number of values strictly below lower or above upper."""
+    values = np.asarray(values)
+    return int(np.count_nonzero((values < lower) | (values > upper)))
+
+
+def percentage(count: int, total: int) -> float:
+    """count / total as a percentage rounded to 2 decimals (0.0 when total is 0)."""
+    return round((count / total) * 100, 2) if total else 0.0
+
+
+def sigma_bounds(values: np.ndarray, k: float = 3.0) -> Tuple[float, float, float, float]:
+    """(mean, std, mean - k*std, mean + k*std) with the population standard deviation."""
+    values = np.asarray(values)
+    mean = np.mean(values)
+    std = np.std(values)
+    return mean, std, mean - k * std, mean + k * std
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums of every full window (length n - window + 1) from one cumulative sum."""
+    cumsum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    return cumsum[window:] - cumsum[:-window]
+
+
+def _place_windows(window_values: np.ndarray, n: int, window: int, center: bool) -> np.ndarray:
+    """Align per-window results with pandas .rolling(window, center=...) positions (NaN elsewhere)."""
+    out = np.full(n, np.nan)
+    start = window // 2 if center else window - 1
+    out[start:start + len(window_values)] = window_values
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int, center: bool = True) -> np.ndarray:
+    """
+    Rolling mean over full windows, positioned like pandas Series.rolling(window,
+    center=center).mean(). O(n) via a cumulative sum of the mean-removed signal
+    (which keeps the running sum small and the result accurate).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if window < 1 or n < window:
+        return np.full(n, np.nan)
+
+    offset = values.mean()
+    means = _window_sums(values - offset, window) / window + offset
+    return _place_windows(means, n, window, center)
+
+
+def drift_mask(rolling: np.ndarray, reference: float, threshold: float) -> np.ndarray:
+    """Positions whose rolling value deviates from reference by more than threshold (NaN -> False)."""
+    with np.errstate(invalid='ignore'):
+        return np.abs(rolling - reference) > threshold
+
+
+def mean_squared_error(a: np.ndarray, b: np.ndarray) -> float:
+    """mean((a - b)^2) over equal-length arrays."""
+    return float(np.square(np.subtract(a, b)).mean())
+
+
+def stability_stats(values: np.ndarray, window: int, drift_threshold: float) -> Dict[str, float]:
+    """
+    Test 4.1 statistics: mean, std, ±3σ outliers, drift violations of the centered
+    rolling mean (more than drift_threshold % from the mean) and stable readings
+    (within ±3σ and not drifting).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    mean, std, lower, upper = sigma_bounds(values, 3.0)
+    drifting = drift_mask(rolling_mean(values, window, center=True),
+                          mean, mean * (drift_threshold / 100.0))
+    within = (values >= lower) & (values <= upper)
+    return {
+        'total': len(values),
+        'mean': float(mean),
+        'std': float(std),
+        'outliers': int(len(values) - np.count_nonzero(within)),
+        'drift_violations': int(np.count_nonzero(drifting)),
+        'stable': int(np.count_nonzero(within & ~drifting)),
+    }
+
+
+def snr_stats(steady_values: np.ndarray) -> Dict[str, float]:
+    """
+    Test 3.2 statistics of the steady-state readings: signal power (mean square),
+    noise power (variance after removing the linear trend), the Welch spectral
+    signal/noise power split at 10% of the spectrum, median and MAD.
+    """
+    steady_values = np.asarray(steady_values, dtype=np.float64)
+    noise_power = float(np.var(scipy.signal.detrend(steady_values, type='linear')))
+    try:
+        _, psd = scipy.signal.welch(
+            steady_values, nperseg=min(len(steady_values) // 4, 256))
+        spectral = _spectral_split(psd)
+    except Exception:
+        spectral = (None, None)
+    return {
+        'steady': len(steady_values),
+        'signal_power': float(np.mean(steady_values ** 2)),
+        'noise_power': noise_power,
+        'spectral_signal_power': spectral[0],
+        'spectral_noise_power': spectral[1],
+        'median': float(np.median(steady_values)),
+        'mad': float(scipy_stats.median_abs_deviation(steady_values)),
+    }
+
+
+def _spectral_split(psd: np.ndarray) -> Tuple[float, float]:
+    """PSD power below / above the first 10% of frequency bins."""
+    cutoff = len(psd) // 10
+    return float(np.sum(psd[:cutoff])), float(np.sum(psd[cutoff:]))
+
+
+# ---------------- streaming (chunked) kernels ----------------
+
+
+class RunningMoments:
+    """Count, mean and sum of squared deviations merged chunk by chunk (Welford / Chan)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, chunk: np.ndarray):
+        n = len(chunk)
+        if n == 0:
+            return
+        chunk_mean = float(np.mean(chunk))
+        chunk_m2 = float(np.sum(np.square(chunk - chunk_mean)))
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        """Population variance (ddof=0, like np.var)."""
+        return self.m2 / self.count if self.count else 0.0
+
+
+class RunningLinearFit:
+    """
+    Running least-squares line through (position, value) pairs, merged chunk by chunk.
+    residual_variance equals np.var(scipy.signal.detrend(values, type='linear')).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean_t = 0.0
+        self.mean_y = 0.0
+        self.c_tt = 0.0
+        self.c_ty = 0.0
+        self.c_yy = 0.0
+
+    def update(self, chunk: np.ndarray):
+        n = len(chunk)
+        if n == 0:
+            return
+        t = np.arange(self.count, self.count + n, dtype=np.float64)
+        chunk_t, chunk_y = float(t.mean()), float(np.mean(chunk))
+        dt, dy = t - chunk_t, chunk - chunk_y
+        total = self.count + n
+        delta_t, delta_y = chunk_t - self.mean_t, chunk_y - self.mean_y
+        weight = self.count * n / total
+        self.c_tt += float(np.dot(dt, dt)) + delta_t * delta_t * weight
+        self.c_ty += float(np.dot(dt, dy)) + delta_t * delta_y * weight
+        self.c_yy += float(np.dot(dy, dy)) + delta_y * delta_y * weight
+        self.mean_t += delta_t * n / total
+        self.mean_y += delta_y * n / total
+        self.count = total
+
+    @property
+    def residual_variance(self) -> float:
+        if self.count == 0:
+            return 0.0
+        if self.c_tt == 0:
+            return self.c_yy / self.count
+        return max(self.c_yy - self.c_ty * self.c_ty / self.c_tt, 0.0) / self.count
+
+
+class RunningWelch:
+    """
+    Welch PSD over a stream: scipy.signal.welch defaults (Hann window, 50% overlap,
+    constant detrend, density scaling, mean average). Whole segments are passed to
+    scipy as they complete; only the partial trailing segment is carried over.
+    """
+
+    def __init__(self, nperseg: int):
+        self.nperseg = nperseg
+        self.step = nperseg - nperseg // 2
+        self.buffer = np.empty(0, dtype=np.float64)
+        self.psd_sum = None
+        self.segments = 0
+
+    def update(self, chunk: np.ndarray):
+        self.buffer = np.concatenate((self.buffer, chunk))
+        if len(self.buffer) < self.nperseg:
+            return
+        segments = (len(self.buffer) - self.nperseg) // self.step + 1
+        used = (segments - 1) * self.step + self.nperseg
+        _, psd = scipy.signal.welch(self.buffer[:used], nperseg=self.nperseg)
+        self.psd_sum = psd * segments if self.psd_sum is None else self.psd_sum + psd * segments
+        self.segments += segments
+        self.buffer = self.buffer[segments * self.step:]
+
+    @property
+    def psd(self) -> np.ndarray:
+        if not self.segments:
+            raise ValueError("Not enough samples for one Welch segment")
+        return self.psd_sum / self.segments
+
+
+class RollingDriftCounter:
+    """
+    Streaming Test 4.1 counts. Keeps the last window - 1 samples to complete windows
+    across chunk boundaries and the ±3σ flags of readings whose centered rolling mean
+    is not known yet; positions without a full window never count as drifting, as
+    with pandas rolling(center=True).
+    """
+
+    def __init__(self, window: int, reference: float, threshold: float, lower: float, upper: float):
+        self.window = window
+        self.lead = window // 2
+        self.reference = reference
+        self.threshold = threshold
+        self.lower = lower
+        self.upper = upper
+        self.tail = np.empty(0, dtype=np.float64)
+        self.pending = np.empty(0, dtype=bool)
+        self.seen = 0
+        self.finalized = 0
+        self.outliers = 0
+        self.drift_violations = 0
+        self.stable = 0
+
+    def update(self, chunk: np.ndarray):
+        within = (chunk >= self.lower) & (chunk <= self.upper)
+        self.outliers += int(len(chunk) - np.count_nonzero(within))
+        self.pending = np.concatenate((self.pending, within))
+        self.seen += len(chunk)
+
+        data = np.concatenate((self.tail, chunk - self.reference))
+        windows = max(0, len(data) - self.window + 1)
+        drifting = np.abs(_window_sums(data, self.window) / self.window) > self.threshold \
+            if windows else np.empty(0, dtype=bool)
+        self.tail = data[len(data) - min(len(data), self.window - 1):]
+
+        # Leading readings have no full window: within ±3σ is enough
+        lead_end = min(self.lead, self.seen)
+        if self.finalized < lead_end:
+            done = lead_end - self.finalized
+            self.stable += int(np.count_nonzero(self.pending[:done]))
+            self.pending = self.pending[done:]
+            self.finalized = lead_end
+
+        if windows:
+            self.drift_violations += int(np.count_nonzero(drifting))
+            self.stable += int(np.count_nonzero(self.pending[:windows] & ~drifting))
+            self.pending = self.pending[windows:]
+            self.finalized += windows
+
+    def finish(self):
+        """Trailing readings have no full window either."""
+        self.stable += int(np.count_nonzero(self.pending))
+        self.finalized += len(self.pending)
+        self.pending = self.pending[:0]
+
+
+def streaming_stability(source: ChunkSource, window: int, drift_threshold: float) -> Dict[str, float]:
+    """stability_stats over a chunk source in two passes (moments, then outliers and drift)."""
+    moments = RunningMoments()
+    for chunk in source():
+        moments.update(chunk)
+    if moments.count == 0:
+        return {'total': 0}
+
+    mean, std = moments.mean, float(np.sqrt(moments.variance))
+    counter = RollingDriftCounter(window, mean, mean * (drift_threshold / 100.0),
+                                  mean - 3 * std, mean + 3 * std)
+    for chunk in source():
+        counter.update(chunk)
+    counter.finish()
+    return {
+        'total': moments.count,
+        'mean': mean,
+        'std': std,
+        'outliers': counter.outliers,
+        'drift_violations': counter.drift_violations,
+        'stable': counter.stable,
+    }
+
+
+def streaming_snr(source: ChunkSource, min_q: float) -> Dict[str, float]:
+    """
+    snr_stats over the readings > min_q of a chunk source, plus 'total' readings. The
+    first pass counts readings (the Welch segment length depends on the steady count),
+    the second accumulates power, trend fit, Welch segments and the MAD sample.
+    """
+    total = steady = 0
+    for chunk in source():
+        total += len(chunk)
+        steady += int(np.count_nonzero(chunk > min_q))
+    result = {'total': total, 'steady': steady}
+    if steady == 0:
+        return result
+
+    square_sum = 0.0
+    fit = RunningLinearFit()
+    welch = RunningWelch(min(steady // 4, 256)) if steady // 4 >= 1 else None
+    stride = -(-steady // MAD_SAMPLE_SIZE)
+    sample, offset = [], 0
+    for chunk in source():
+        chunk = chunk[chunk > min_q]
+        square_sum += float(np.dot(chunk, chunk))
+        fit.update(chunk)
+        if welch is not None:
+            welch.update(chunk)
+        sample.append(chunk[(-offset) % stride::stride])
+        offset += len(chunk)
+
+    try:
+        spectral = _spectral_split(welch.psd)
+    except Exception:
+        spectral = (None, None)
+    sample = np.concatenate(sample)
+    result.update({
+        'signal_power': square_sum / steady,
+        'noise_power': fit.residual_variance,
+        'spectral_signal_power': spectral[0],
+        'spectral_noise_power': spectral[1],
+        'median': float(np.median(sample)),
+        'mad': float(scipy_stats.median_abs_deviation(sample)),
+    })
+    return result
+
+
+def _aligned_chunks(a: Iterable[np.ndarray], b: Iterable[np.ndarray]) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Pair two chunk streams position by position, stopping at the shorter one."""
+    a, b = iter(a), iter(b)
+    left = right = np.empty(0, dtype=np.float64)
+    while True:
+        while len(left) == 0:
+            left = next(a, None)
+            if left is None:
+                return
+        while len(right) == 0:
+            right = next(b, None)
+            if right is None:
+                return
+        n = min(len(left), len(right))
+        yield left[:n], right[:n]
+        left, right = left[n:], right[n:]
+
+
+def streaming_mse(digital_source: ChunkSource, analog_source: ChunkSource) -> Dict[str, float]:
+    """
+    Test 3.1 over two chunk sources: readings paired by position and trimmed to the
+    shorter signal, returning 'count', 'mse' and 'nominal' (mean of the paired digital readings).
+    """
+    count = 0
+    square_error = digital_sum = 0.0
+    for digital, analog in _aligned_chunks(digital_source(), analog_source()):
+        diff = digital - analog
+        square_error += float(np.dot(diff, diff))
+        digital_sum += float(np.sum(digital))
+        count += len(digital)
+    if count == 0:
+        return {'count': 0, 'mse': 0.0, 'nominal': 0.0}
+    return {'count': count, 'mse': square_error / count, 'nominal': digital_sum / count}
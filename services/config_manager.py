@@ -486,6 +486,15 @@ class ConfigManager:
         """
         return self.get('rtudata.default_output_path', "D:\\Historical-Rtudata\\")
 
+    def get_rtudata_sidecar_index(self) -> bool:
+        """
+        Get whether RTU exports keep a '<file>.dt.idx' sidecar index next to each .dt file.
+
+        Returns:
+            True to load (and create) sidecar indexes, False to index in memory only
+        """
+        return self.get('rtudata.sidecar_index', False)
+
     def get_database_config(self) -> Dict[str, Any]:
         """
         Get the database configuration section.
@@ -675,6 +684,78 @@ class ConfigManager:
         """
         return self.get('pymbsd.timeout', 30)
 
+    def get_flowmeter_acceptance_config(self) -> Dict[str, Any]:
+        """
+        Get flowmeter acceptance analysis configuration.
+
+        Returns:
+            Dictionary containing flowmeter acceptance configuration
+        """
+        return self.get('flowmeter_acceptance', {})
+
+    def get_flowmeter_max_workers(self) -> int:
+        """
+        Get the number of worker processes for per-meter acceptance tests.
+
+        Returns:
+            Worker process count (0 = one per CPU core, 1 = run meters sequentially)
+        """
+        return self.get('flowmeter_acceptance.max_workers', 1)
+
+    def get_flowmeter_streaming_chunk_rows(self) -> int:
+        """
+        Get the CSV chunk size for streaming acceptance statistics (Tests 3.1, 3.2, 4.1).
+
+        Returns:
+            Rows per chunk (0 = load each tag's readings into memory at once)
+        """
+        return self.get('flowmeter_acceptance.streaming_chunk_rows', 0)
+
+    def get_review_to_csv_config(self) -> Dict[str, Any]:
+        """
+        Get Review to CSV (dreview) configuration.
+
+        Returns:
+            Dictionary containing review to CSV configuration
+        """
+        return self.get('review_to_csv', {})
+
+    def get_review_dreview_command(self) -> str:
+        """
+        Get the dreview command used in pipe mode.
+
+        Returns:
+            dreview executable (optionally with leading arguments)
+        """
+        return self.get('review_to_csv.dreview_command', 'dreview.exe')
+
+    def get_review_max_processes(self) -> int:
+        """
+        Get the maximum number of concurrent dreview processes.
+
+        Returns:
+            Process cap (0 = one per CPU core)
+        """
+        return self.get('review_to_csv.max_processes', 0)
+
+    def get_review_time_pruning(self) -> bool:
+        """
+        Get whether review files outside the requested time range are skipped.
+
+        Returns:
+            True to skip files whose name or modification time rules out the range
+        """
+        return self.get('review_to_csv.time_pruning', False)
+
+    def get_review_pipe_output(self) -> bool:
+        """
+        Get whether dreview output is piped straight into the merger.
+
+        Returns:
+            True to spawn dreview directly and merge its stdout, False to use cmd.exe redirects to per-file CSVs
+        """
+        return self.get('review_to_csv.pipe_output', False)
+
     def get_all_config(self) -> Dict[str, Any]:
         """
         Get the entire configuration dictionary.
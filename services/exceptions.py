@@ -56,6 +56,11 @@ class ServiceError(WUTCError):
     pass
 
 
+class OperationCancelledError(WUTCError):
+    """Raised when a running operation is cancelled by the user."""
+    pass
+
+
 class DataProcessingError(ProcessingError):
     """Raised when data processing operations encounter specific errors."""
     pass
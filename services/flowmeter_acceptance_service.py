@@ -4,21 +4,158 @@ Simplified Flowmeter Acceptance Service - Actually works!
 
 import os
 import logging
+import multiprocessing
+import queue
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Iterator, Optional, List
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import psutil
 from plotly.subplots import make_subplots
-from services.exceptions import ProcessingError
+from services.exceptions import ProcessingError, OperationCancelledError
+from services import acceptance_stats
 from services.rtu_service import RTUService
-from services.review_to_csv_service import ReviewCsvService
-from services.config_manager import ConfigManager
-import tempfile
-import shutil
-import scipy.signal
-from scipy import stats
+from services.review_to_csv_service import MATCH_ARG_BUDGET, ReviewCsvService
+from services.config_manager import ConfigManager, get_config_manager
+
+
+class AcceptanceDataContext:
+    """
+    Per-run cache of the CSV files in the _Data directory.
+
+    Every file is parsed once per analysis run (once per worker process when meters
+    run in parallel, so memory grows with the worker count) and RTU flat files are
+    grouped by tag_name once, so each test
+    draws its tag's rows from memory instead of re-reading and re-filtering the
+    whole CSV. Returned frames are shallow copies:
+    replacing or adding columns stays local to the caller, but values must not be
+    modified in place.
+    """
+
+    def __init__(self):
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._tag_rows: Dict[str, Dict[str, pd.DataFrame]] = {}
+        self._review_rows: Dict[tuple, pd.DataFrame] = {}
+
+    def _frame(self, csv_file: str) -> pd.DataFrame:
+        key = os.path.abspath(csv_file)
+        if key not in self._frames:
+            self._frames[key] = pd.read_csv(csv_file)
+        return self._frames[key]
+
+    def read_csv(self, csv_file: str) -> pd.DataFrame:
+        """The parsed CSV file (read from disk on first use only)."""
+        return self._frame(csv_file).copy(deep=False)
+
+    def tag_rows(self, csv_file: str, tag_name: str) -> pd.DataFrame:
+        """Rows of an RTU flat CSV for one tag, in file order (empty if the tag is absent)."""
+        key = os.path.abspath(csv_file)
+        if key not in self._tag_rows:
+            df = self._frame(csv_file)
+            self._tag_rows[key] = dict(iter(df.groupby('tag_name', sort=False)))
+        rows = self._tag_rows[key].get(tag_name)
+        if rows is None:
+            rows = self._frame(csv_file).iloc[0:0]
+        return rows.copy(deep=False)
+
+    def review_tag_rows(self, csv_file: str, tag_name: str) -> pd.DataFrame:
+        """
+        Rows of a review CSV (MBSTagID.csv, Reference_Meter.csv) for one tag: TIME and
+        the tag's :VAL/:ST/:FLAT columns, keeping rows where any of them has a value.
+
+        The review files hold the columns of every meter, and rows that only carry
+        other meters' readings are dropped here. Column names are stripped. If the
+        file has none of the tag's columns, an empty frame with all of its columns
+        is returned.
+        """
+        key = (os.path.abspath(csv_file), tag_name)
+        if key not in self._review_rows:
+            df = self._frame(csv_file)
+            df = df.set_axis(df.columns.str.strip(), axis=1)
+            tag_columns = [f"{tag_name}:{suffix}" for suffix in REVIEW_TAG_SUFFIXES
+                           if f"{tag_name}:{suffix}" in df.columns]
+            if tag_columns:
+                columns = ['TIME'] + tag_columns if 'TIME' in df.columns else tag_columns
+                df = df.loc[df[tag_columns].notna().any(axis=1), columns].reset_index(drop=True)
+            else:
+                df = df.iloc[0:0]
+            self._review_rows[key] = df
+        return self._review_rows[key].copy(deep=False)
+
+    def iter_tag_values(self, csv_file: str, tag_name: str, chunk_rows: int) -> Iterator[np.ndarray]:
+        """
+        Non-null values of one tag in an RTU flat CSV, as float64 arrays read
+        chunk_rows lines at a time. Chunks bypass the cache, so a multi-day file is
+        never held in memory whole.
+        """
+        for chunk in pd.read_csv(csv_file, usecols=['tag_name', 'value'], chunksize=chunk_rows):
+            values = chunk.loc[chunk['tag_name'] == tag_name, 'value'].dropna()
+            if len(values):
+                yield values.to_numpy(dtype=np.float64)
+
+
+# Columns dreview writes for each review tag
+REVIEW_TAG_SUFFIXES = ("VAL", "ST", "FLAT")
+
+
+def _review_tag_variants(tag_name: str) -> List[str]:
+    """The dreview -match entries (and output columns) for one review tag."""
+    return [f"{tag_name}:{suffix}" for suffix in REVIEW_TAG_SUFFIXES]
+
+# Per-process service used by the meter test workers
+_worker_service = None
+
+
+def _init_meter_worker(tags_df: pd.DataFrame, streaming_chunk_rows: int = 0,
+                       pid_queue: multiprocessing.Queue = None):
+    """
+    Worker initializer: receive the Tags.in frame once per process and report the
+    worker's pid on pid_queue (so a cancelled run can terminate it). Each worker reads
+    the _Data CSVs itself through its own AcceptanceDataContext, which keeps every file
+    it touches in memory: no parsed frames are pickled across the process boundary,
+    but peak memory grows with the worker count.
+    """
+    global _worker_service
+    _worker_service = FlowmeterAcceptanceService()
+    _worker_service.tags_df = tags_df
+    _worker_service.streaming_chunk_rows = streaming_chunk_rows
+    if pid_queue is not None:
+        pid_queue.put(os.getpid())
+
+
+def _run_meter_worker(meter_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Run _run_meter_tests for one meter in a worker process."""
+    return _worker_service._run_meter_tests(**meter_kwargs)
+
+
+def _terminate_meter_workers(executor: ProcessPoolExecutor, pid_queue: multiprocessing.Queue):
+    """
+    Stop a meter pool without waiting: pending meters are dropped, running ones killed.
+    Worker pids come from pid_queue, where _init_meter_worker reported them.
+    """
+    executor.shutdown(wait=False, cancel_futures=True)
+    processes = []
+    while True:
+        try:
+            pid = pid_queue.get(timeout=0.2)
+        except queue.Empty:
+            break
+        try:
+            processes.append(psutil.Process(pid))
+        except psutil.NoSuchProcess:
+            continue
+    for process in processes:
+        try:
+            process.terminate()
+        except psutil.NoSuchProcess:
+            pass
+    psutil.wait_procs(processes, timeout=5)
 
 
 class FlowmeterAcceptanceService:
@@ -32,6 +169,12 @@ class FlowmeterAcceptanceService:
         self.tags_df = None
         self.test_results = {}  # Store test results for each meter
         self.plots_data = {}    # Store plot data
+        self.data_context = AcceptanceDataContext()  # Parsed _Data CSVs for the current run
+        self.streaming_chunk_rows = 0  # > 0: Tests 3.1, 3.2 and 4.1 read RTU CSVs in chunks
+
+        # Background job support: progress reporting and cooperative cancellation
+        self._progress_callback = None
+        self._cancel_event = threading.Event()
 
         # Services (initialize when needed)
         self.rtu_service = RTUService()
@@ -40,8 +183,18 @@ class FlowmeterAcceptanceService:
         # Theme support
         self.current_theme = 'mantine_light'
 
-    def run_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Run the flowmeter acceptance analysis - simplified and working."""
+    def run_analysis(self, params: Dict[str, Any],
+                     progress_callback: Callable[[str, int, int, str], None] = None,
+                     cancel_event: threading.Event = None) -> Dict[str, Any]:
+        """
+        Run the flowmeter acceptance analysis - simplified and working.
+
+        progress_callback is called as (stage, done, total, message) for the 'export',
+        'tests' (one step per meter) and 'plots' stages. Setting cancel_event stops
+        the run at the next meter or export step with OperationCancelledError.
+        """
+        self._progress_callback = progress_callback
+        self._cancel_event = cancel_event or threading.Event()
         try:
             self.logger.info(
                 "Starting simplified flowmeter acceptance analysis")
@@ -111,30 +264,40 @@ class FlowmeterAcceptanceService:
             else:
                 # Export CSV data FIRST - tests need these files to exist
                 csv_export_result = self.export_csv_data(params)
+            self._check_cancelled()
 
             # Get the data directory from CSV export result
             if 'data_dir' in csv_export_result:
                 data_dir = csv_export_result['data_dir']
 
+            # Fresh CSV cache for this run - every test reads from it
+            self.data_context = AcceptanceDataContext()
+            self.streaming_chunk_rows = self._streaming_chunk_rows(params)
+
             # Process each meter using Tags.in format
+            meter_jobs = []
             for index, row in self.tags_df.iterrows():
                 meter_name = row['MBSTagID'].strip()
                 digital_tag = row['SCADATagID_DIG'].strip()
                 analog_tag = row['SCADATagID_ANL'].strip()
                 ref_tag = row['Reference_Meter'].strip()
 
-                self.logger.info(f"Processing meter: {meter_name}")
-
                 # Run tests for this meter with UI parameters
-                meter_results = self._run_meter_tests(
-                    meter_name, digital_tag, analog_tag, ref_tag,
-                    rtu_file, review_file, time_start, time_end,
-                    min_range, max_range, min_q, max_q, flat_threshold, params, data_dir
-                )
-
-                self.test_results[meter_name] = meter_results
+                meter_jobs.append(dict(
+                    meter_name=meter_name, digital_tag=digital_tag, analog_tag=analog_tag,
+                    ref_tag=ref_tag, rtu_file=rtu_file, review_file=review_file,
+                    time_start=time_start, time_end=time_end, min_range=min_range,
+                    max_range=max_range, min_q=min_q, max_q=max_q,
+                    flat_threshold=flat_threshold, params=params, data_dir=data_dir
+                ))
+
+            # Results are merged in Tags.in order whichever worker finishes first
+            for meter_kwargs, meter_results in zip(meter_jobs, self._run_meters(meter_jobs, params, data_dir)):
+                self.test_results[meter_kwargs['meter_name']] = meter_results
 
             # Create plots data with actual CSV files
+            self._check_cancelled()
+            self._report_progress('plots', 0, 1, "Generating plots")
             self.plots_data = self._generate_plots_data(data_dir)
 
             # Create plots with actual data
@@ -150,10 +313,118 @@ class FlowmeterAcceptanceService:
                 'message': f'Flowmeter acceptance analysis completed for {len(self.test_results)} meters. {csv_export_result.get("message", "CSV data exported to _Data directory.")}'
             }
 
+        except OperationCancelledError:
+            raise
         except Exception as e:
             self.logger.error(f"Analysis failed: {e}")
             raise ProcessingError(f"Analysis error: {e}")
 
+    def cancel(self):
+        """Request cancellation of a running analysis (stops a running review export too)."""
+        self._cancel_event.set()
+        review_service = self.review_service
+        if review_service is not None:
+            review_service.cancel()
+
+    def _check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise OperationCancelledError("Flowmeter analysis cancelled by user")
+
+    def _report_progress(self, stage: str, done: int, total: int, message: str):
+        if self._progress_callback:
+            self._progress_callback(stage, done, total, message)
+
+    def _meter_worker_count(self, meter_count: int, params: Dict[str, Any]) -> int:
+        """Worker processes for the meter tests: params['max_workers'], else config (0 = CPU cores)."""
+        workers = params.get('max_workers')
+        if workers is None:
+            workers = get_config_manager().get_flowmeter_max_workers()
+        if workers is None:
+            workers = 1
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return max(1, min(int(workers), meter_count))
+
+    def _streaming_chunk_rows(self, params: Dict[str, Any]) -> int:
+        """Chunk size for streaming statistics: params['streaming_chunk_rows'], else config (0 = off)."""
+        chunk_rows = params.get('streaming_chunk_rows')
+        if chunk_rows is None:
+            chunk_rows = get_config_manager().get_flowmeter_streaming_chunk_rows()
+        return max(0, int(chunk_rows or 0))
+
+    def _tag_value_source(self, csv_file: str, tag_name: str):
+        """Re-iterable chunk source of one tag's readings for the streaming statistics."""
+        return lambda: self.data_context.iter_tag_values(csv_file, tag_name, self.streaming_chunk_rows)
+
+    def _run_meters(self, meter_jobs: List[Dict[str, Any]], params: Dict[str, Any],
+                    data_dir: str = None) -> List[Dict[str, Any]]:
+        """
+        Run _run_meter_tests for every meter (keyword arguments per job), in Tags.in order.
+
+        Meters are independent, so with more than one worker they run in a process
+        pool. Each worker parses and caches the _Data CSVs it reads, so peak memory is
+        roughly the worker count times the data set (hence the sequential default).
+        A failed meter fails the analysis, and cancelling terminates the workers.
+        """
+        meter_count = len(meter_jobs)
+        workers = self._meter_worker_count(meter_count, params)
+        if workers > 1:
+            # Only plain values cross the process boundary
+            worker_params = {key: value for key, value in params.items()
+                             if isinstance(value, (str, int, float, bool, list, tuple, dict, type(None)))}
+            worker_jobs = [dict(meter_kwargs, params=worker_params) for meter_kwargs in meter_jobs]
+
+            self.logger.info(
+                f"Running tests for {meter_count} meters on {workers} worker processes")
+            self._report_progress('tests', 0, meter_count,
+                                  f"Running tests for {meter_count} meters on {workers} workers")
+            pid_queue = multiprocessing.Queue()
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_meter_worker,
+                                           initargs=(self.tags_df, self.streaming_chunk_rows, pid_queue))
+            completed = False
+            try:
+                futures = [executor.submit(_run_meter_worker, job) for job in worker_jobs]
+                results = []
+                for meter_kwargs, future in zip(meter_jobs, futures):
+                    meter_name = meter_kwargs['meter_name']
+                    try:
+                        results.append(self._wait_for_meter(future))
+                    except OperationCancelledError:
+                        raise
+                    except Exception as e:
+                        raise ProcessingError(f"Tests for meter {meter_name} failed: {e}") from e
+                    self._report_progress('tests', len(results), meter_count,
+                                          f"Tested meter {meter_name} ({len(results)}/{meter_count})")
+                completed = True
+                return results
+            finally:
+                if completed:
+                    executor.shutdown(wait=True)
+                else:
+                    # Cancelled or failed: don't leave meters running in orphaned workers
+                    _terminate_meter_workers(executor, pid_queue)
+                pid_queue.close()
+
+        results = []
+        for meter_kwargs in meter_jobs:
+            self._check_cancelled()
+            meter_name = meter_kwargs['meter_name']
+            self.logger.info(f"Processing meter: {meter_name}")
+            self._report_progress('tests', len(results), meter_count,
+                                  f"Testing meter {meter_name} ({len(results) + 1}/{meter_count})")
+            results.append(self._run_meter_tests(**meter_kwargs))
+        self._report_progress('tests', meter_count, meter_count, "Meter tests completed")
+        return results
+
+    def _wait_for_meter(self, future) -> Dict[str, Any]:
+        """Result of a worker meter run, checking for cancellation while it runs."""
+        while True:
+            self._check_cancelled()
+            try:
+                return future.result(timeout=0.5)
+            except FuturesTimeoutError:
+                continue
+
     def _generate_plots_data(self, data_dir: str = None) -> Dict[str, Any]:
         """Generate plot data from actual CSV files (MBSTagID.csv and Reference_Meter.csv)."""
         plots_data = {}
@@ -186,28 +457,9 @@ class FlowmeterAcceptanceService:
                 # Load and process MBSTagID.csv data
                 if os.path.exists(mbs_file):
                     try:
-                        mbs_df = pd.read_csv(mbs_file)
-                        # Strip whitespace from column names to handle formatting inconsistencies
-                        mbs_df.columns = mbs_df.columns.str.strip()
-
-                        # Get the correct column names - MBS files have TIME and meter-specific VAL columns
+                        # This meter's rows and :VAL column (the file holds every meter's columns)
+                        mbs_df, val_col = self._review_values(mbs_file, meter_name)
                         time_col = 'TIME' if 'TIME' in mbs_df.columns else None
-                        val_col = None
-
-                        # Find the VAL column for this meter (look for exact match first, then fallback to pattern)
-                        exact_match = f"{meter_name}:VAL"
-
-                        # First try exact match on meter name
-                        if exact_match in mbs_df.columns:
-                            val_col = exact_match
-                        else:
-                            # Fallback: look for any column with :VAL suffix
-                            for col in mbs_df.columns:
-                                if ':VAL' in col:
-                                    val_col = col
-                                    self.logger.warning(
-                                        f"Could not find exact column match for {exact_match}, using {col} instead")
-                                    break
 
                         if time_col and val_col:
                             # Use actual MBS data without any fake generation
@@ -234,11 +486,11 @@ class FlowmeterAcceptanceService:
                     data_dir, "SCADATagID_ANL.csv") if data_dir else None
                 if analog_csv and os.path.exists(analog_csv):
                     try:
-                        analog_df = pd.read_csv(analog_csv)
+                        analog_df = self.data_context.read_csv(analog_csv)
                         # Filter for this specific analog tag
                         if 'tag_name' in analog_df.columns and 'timestamp' in analog_df.columns and 'value' in analog_df.columns:
-                            tag_data = analog_df[analog_df['tag_name']
-                                                 == analog_tag]
+                            tag_data = self.data_context.tag_rows(
+                                analog_csv, analog_tag)
                             if not tag_data.empty:
                                 meter_plots_data['time_series']['analog_signal'] = {
                                     'timestamps': tag_data['timestamp'].tolist(),
@@ -266,11 +518,11 @@ class FlowmeterAcceptanceService:
                         data_dir, "Ref_SCADATagID.csv") if data_dir else None
                     if ref_scada_csv and os.path.exists(ref_scada_csv):
                         try:
-                            ref_scada_df = pd.read_csv(ref_scada_csv)
+                            ref_scada_df = self.data_context.read_csv(ref_scada_csv)
                             # Filter for this specific reference SCADA tag
                             if 'tag_name' in ref_scada_df.columns and 'timestamp' in ref_scada_df.columns and 'value' in ref_scada_df.columns:
-                                tag_data = ref_scada_df[ref_scada_df['tag_name']
-                                                        == ref_scada_tag]
+                                tag_data = self.data_context.tag_rows(
+                                    ref_scada_csv, ref_scada_tag)
                                 if not tag_data.empty:
                                     meter_plots_data['time_series']['ref_scada_signal'] = {
                                         'timestamps': tag_data['timestamp'].tolist(),
@@ -293,28 +545,9 @@ class FlowmeterAcceptanceService:
                 # Load and process Reference_Meter.csv data
                 if os.path.exists(ref_file):
                     try:
-                        ref_df = pd.read_csv(ref_file)
-                        # Strip whitespace from column names to handle formatting inconsistencies
-                        ref_df.columns = ref_df.columns.str.strip()
-
-                        # Use correct column names for Reference_Meter.csv
+                        # The reference meter's rows and :VAL column
+                        ref_df, val_col = self._review_values(ref_file, ref_tag)
                         time_col = 'TIME' if 'TIME' in ref_df.columns else None
-                        val_col = None
-
-                        # Find the VAL column for reference meter
-                        exact_match = f"{ref_tag}:VAL"
-
-                        # First try exact match on reference meter name
-                        if exact_match in ref_df.columns:
-                            val_col = exact_match
-                        else:
-                            # Fallback: look for any column with :VAL suffix
-                            for col in ref_df.columns:
-                                if ':VAL' in col:
-                                    val_col = col
-                                    self.logger.warning(
-                                        f"Could not find exact column match for {exact_match}, using {col} instead")
-                                    break
 
                         if time_col and val_col:
                             meter_plots_data['time_series']['reference_signal'] = {
@@ -438,12 +671,6 @@ class FlowmeterAcceptanceService:
             analog_units_result = self._test_12_units_verified(
                 analog_tag, rtu_file, 'analog', min_q, max_q, data_dir)
 
-            # Test 1.3 - Quality verification for both digital and analog signals
-            digital_quality_result = self._test_13_quality_is_good(
-                digital_tag, rtu_file, 'digital', data_dir)
-            analog_quality_result = self._test_13_quality_is_good(
-                analog_tag, rtu_file, 'analog', data_dir)
-
             # Test 1.4 - Quality verification in Review file
             review_quality_result = self._test_14_quality_review(
                 meter_name, review_file, data_dir)
@@ -670,7 +897,7 @@ class FlowmeterAcceptanceService:
                 return result
 
             # Load CSV data
-            df = pd.read_csv(csv_file)
+            df = self.data_context.read_csv(csv_file)
 
             # Filter for the specific tag using tag_name column (matches CSV format)
             if 'tag_name' not in df.columns:
@@ -678,7 +905,7 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'No tag_name column found in {csv_file}'
                 return result
 
-            tag_data = df[df['tag_name'] == tag_name]
+            tag_data = self.data_context.tag_rows(csv_file, tag_name)
 
             if tag_data.empty:
                 result['details'] = f'No data found for tag {tag_name}'
@@ -695,8 +922,8 @@ class FlowmeterAcceptanceService:
                 return result
 
             # Count values outside range (original logic: >= lower_bound AND <= upper_bound)
-            out_of_range = values[(values < min_range) | (values > max_range)]
-            result['out_of_range_count'] = len(out_of_range)
+            result['out_of_range_count'] = acceptance_stats.count_outside(
+                values.values, min_range, max_range)
 
             # Original logic uses simple count, not percentage
             result['status'] = 'pass' if result['out_of_range_count'] == 0 else 'fail'
@@ -767,7 +994,7 @@ class FlowmeterAcceptanceService:
                 return result
 
             # Load CSV data
-            df = pd.read_csv(csv_file)
+            df = self.data_context.read_csv(csv_file)
 
             # Filter for the specific tag
             if 'tag_name' not in df.columns:
@@ -775,7 +1002,7 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'No tag_name column found in {csv_file}'
                 return result
 
-            tag_data = df[df['tag_name'] == tag_name]
+            tag_data = self.data_context.tag_rows(csv_file, tag_name)
 
             if tag_data.empty:
                 result['details'] = f'No data found for tag {tag_name}'
@@ -783,7 +1010,7 @@ class FlowmeterAcceptanceService:
                 return result
 
             # Get values and perform unit verification (original logic)
-            values = tag_data['value'].dropna().tolist()
+            values = tag_data['value'].dropna().values
             result['total_readings'] = len(values)
 
             if result['total_readings'] == 0:
@@ -791,24 +1018,15 @@ class FlowmeterAcceptanceService:
                 result['details'] = 'No valid readings found'
                 return result
 
-            # Apply original unit_check logic exactly
-            wrong_unit_instance = 0
-            conversions_applied = 0
-
             # Calculate tolerance range (original logic: 80% to 120% of min/max Q)
             min_acceptable = 0.8 * min_q
             max_acceptable = 1.2 * max_q
 
-            for index in range(len(values)):
-                if min_acceptable <= values[index] <= max_acceptable:
-                    # Value is in expected m³/h range, no conversion needed
-                    pass
-                else:
-                    # Value outside expected range - convert from barrels/h to m³/h
-                    wrong_unit_instance += 1
-                    values[index] = values[index] / \
-                        6.2898  # Original conversion factor
-                    conversions_applied += 1
+            # Values outside the expected m³/h range are treated as barrels/h and
+            # converted (original unit_check logic, factor 6.2898)
+            wrong_unit_instance = acceptance_stats.count_outside(
+                values, min_acceptable, max_acceptable)
+            conversions_applied = wrong_unit_instance
 
             result['conversions_applied'] = conversions_applied
 
@@ -882,7 +1100,7 @@ class FlowmeterAcceptanceService:
                 return result
 
             # Load CSV data
-            df = pd.read_csv(csv_file)
+            df = self.data_context.read_csv(csv_file)
 
             # Filter for the specific tag
             if 'tag_name' not in df.columns:
@@ -890,7 +1108,7 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'No tag_name column found in {csv_file}'
                 return result
 
-            tag_data = df[df['tag_name'] == tag_name]
+            tag_data = self.data_context.tag_rows(csv_file, tag_name)
 
             if tag_data.empty:
                 result['details'] = f'No data found for tag {tag_name}'
@@ -968,14 +1186,11 @@ class FlowmeterAcceptanceService:
                 result['status'] = 'fail'
                 return result
 
-            # Load the MBS CSV data
-            df = pd.read_csv(mbs_csv_file)
-
-            # Strip whitespace from column names to handle formatting inconsistencies
-            df.columns = df.columns.str.strip()
+            # This meter's rows of the MBS CSV (the file holds every meter's columns)
+            df = self.data_context.review_tag_rows(mbs_csv_file, meter_name)
 
             # The column format is: TIME, {meter_name}:VAL, {meter_name}:ST, {meter_name}:FLAT
-            # We need to check the ST (status) column (after stripping spaces)
+            # We need to check the ST (status) column
             st_column = f'{meter_name}:ST'
 
             if st_column not in df.columns:
@@ -1078,7 +1293,7 @@ class FlowmeterAcceptanceService:
                 return result
 
             # Load CSV data
-            df = pd.read_csv(csv_file)
+            df = self.data_context.read_csv(csv_file)
 
             # Filter for the specific tag
             if 'tag_name' not in df.columns:
@@ -1086,7 +1301,7 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'No tag_name column found in {csv_file}'
                 return result
 
-            tag_data = df[df['tag_name'] == tag_name].copy()
+            tag_data = self.data_context.tag_rows(csv_file, tag_name).copy()
 
             if tag_data.empty:
                 result['details'] = f'No data found for tag {tag_name}'
@@ -1108,32 +1323,25 @@ class FlowmeterAcceptanceService:
                 result['details'] = 'Need at least 2 readings to calculate time differences'
                 return result
 
-            # Calculate time differences (original logic)
-            timestamps = tag_data['timestamp'].values
-            time_differences = []
-
-            for k in range(len(timestamps) - 1):
-                x = timestamps[k]
-                y = timestamps[k + 1]
-                time_diff = y - x
-                time_differences.append(time_diff)
-
-            # Convert to numpy array for easier statistics
-            time_diffs_array = np.array(time_differences)
+            # Calculate time differences between consecutive readings
+            time_diffs_array = acceptance_stats.time_differences(
+                tag_data['timestamp'].values)
 
             # Calculate statistics
-            result['max_time_diff'] = float(np.max(time_diffs_array))
-            result['mean_time_diff'] = float(np.mean(time_diffs_array))
-            result['median_time_diff'] = float(np.median(time_diffs_array))
-            result['std_time_diff'] = float(np.std(time_diffs_array))
-            result['percentile_95'] = float(
-                np.percentile(time_diffs_array, 95))
+            diff_stats = acceptance_stats.summary_stats(
+                time_diffs_array, percentiles=(95,))
+            result['max_time_diff'] = diff_stats['max']
+            result['mean_time_diff'] = diff_stats['mean']
+            result['median_time_diff'] = diff_stats['median']
+            result['std_time_diff'] = diff_stats['std']
+            result['percentile_95'] = diff_stats['p95']
 
             # Count readings under 5 seconds (primary criterion)
-            readings_under_5s = np.sum(time_diffs_array <= TARGET_FREQUENCY)
-            result['readings_under_5s'] = int(readings_under_5s)
-            result['percentage_under_5s'] = round(
-                (readings_under_5s / len(time_differences)) * 100, 2)
+            readings_under_5s = acceptance_stats.count_at_most(
+                time_diffs_array, TARGET_FREQUENCY)
+            result['readings_under_5s'] = readings_under_5s
+            result['percentage_under_5s'] = acceptance_stats.percentage(
+                readings_under_5s, len(time_diffs_array))
 
             # For values that are near 5 seconds (between 4-6), apply ±20% tolerance
             # This ensures values slightly above 5s but within tolerance are acceptable
@@ -1145,10 +1353,11 @@ class FlowmeterAcceptanceService:
             # Count readings that are either:
             # 1. ≤ 5 seconds (preferred)
             # 2. Between 5-6 seconds (within +20% tolerance)
-            within_acceptable_range = np.sum(time_diffs_array <= upper_bound)
-            result['readings_within_threshold'] = int(within_acceptable_range)
-            result['percentage_within_threshold'] = round(
-                (within_acceptable_range / len(time_diffs_array)) * 100, 2)
+            within_acceptable_range = acceptance_stats.count_at_most(
+                time_diffs_array, upper_bound)
+            result['readings_within_threshold'] = within_acceptable_range
+            result['percentage_within_threshold'] = acceptance_stats.percentage(
+                within_acceptable_range, len(time_diffs_array))
 
             # Determine pass/fail based on strict criteria:
             # 1. At least 95% of readings must be ≤ 6 seconds (5s + 20%)
@@ -1274,11 +1483,8 @@ class FlowmeterAcceptanceService:
                 result['status'] = 'fail'
                 return result
 
-            # Load the MBS CSV data
-            df = pd.read_csv(mbs_csv_file)
-
-            # Strip whitespace from column names to handle formatting inconsistencies
-            df.columns = df.columns.str.strip()
+            # This meter's rows of the MBS CSV (the file holds every meter's columns)
+            df = self.data_context.review_tag_rows(mbs_csv_file, meter_name)
 
             # The column format is: TIME, {meter_name}:VAL, {meter_name}:ST, {meter_name}:FLAT
             val_column = f'{meter_name}:VAL'
@@ -1399,50 +1605,63 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'Analog CSV file not found: {analog_csv}'
                 return result
 
-            # Load CSV data
-            digital_df = pd.read_csv(digital_csv)
-            analog_df = pd.read_csv(analog_csv)
+            if self.streaming_chunk_rows:
+                # Streaming mode: paired readings are accumulated chunk by chunk
+                mse_stats = acceptance_stats.streaming_mse(
+                    self._tag_value_source(digital_csv, digital_tag),
+                    self._tag_value_source(analog_csv, analog_tag))
+                if mse_stats['count'] == 0:
+                    result['status'] = 'fail'
+                    result['details'] = 'No valid readings found in one or both signals'
+                    return result
+                min_length = mse_stats['count']
+                mse_value = mse_stats['mse']
+                nominal_flowrate = mse_stats['nominal']
+            else:
+                # Load CSV data
+                digital_df = self.data_context.read_csv(digital_csv)
+                analog_df = self.data_context.read_csv(analog_csv)
 
-            # Filter for specific tags
-            if 'tag_name' not in digital_df.columns or 'tag_name' not in analog_df.columns:
-                result['status'] = 'fail'
-                result['details'] = 'No tag_name column found in CSV files'
-                return result
+                # Filter for specific tags
+                if 'tag_name' not in digital_df.columns or 'tag_name' not in analog_df.columns:
+                    result['status'] = 'fail'
+                    result['details'] = 'No tag_name column found in CSV files'
+                    return result
 
-            digital_data = digital_df[digital_df['tag_name'] == digital_tag]
-            analog_data = analog_df[analog_df['tag_name'] == analog_tag]
+                digital_data = self.data_context.tag_rows(digital_csv, digital_tag)
+                analog_data = self.data_context.tag_rows(analog_csv, analog_tag)
 
-            if digital_data.empty:
-                result['status'] = 'fail'
-                result['details'] = f'No data found for digital tag {digital_tag}'
-                return result
+                if digital_data.empty:
+                    result['status'] = 'fail'
+                    result['details'] = f'No data found for digital tag {digital_tag}'
+                    return result
 
-            if analog_data.empty:
-                result['status'] = 'fail'
-                result['details'] = f'No data found for analog tag {analog_tag}'
-                return result
+                if analog_data.empty:
+                    result['status'] = 'fail'
+                    result['details'] = f'No data found for analog tag {analog_tag}'
+                    return result
 
-            # Get values
-            digital_values = digital_data['value'].dropna().values
-            analog_values = analog_data['value'].dropna().values
+                # Get values
+                digital_values = digital_data['value'].dropna().values
+                analog_values = analog_data['value'].dropna().values
 
-            if len(digital_values) == 0 or len(analog_values) == 0:
-                result['status'] = 'fail'
-                result['details'] = 'No valid readings found in one or both signals'
-                return result
+                if len(digital_values) == 0 or len(analog_values) == 0:
+                    result['status'] = 'fail'
+                    result['details'] = 'No valid readings found in one or both signals'
+                    return result
 
-            # Align data lengths (trim to shorter length)
-            min_length = min(len(digital_values), len(analog_values))
-            digital_values = digital_values[:min_length]
-            analog_values = analog_values[:min_length]
+                # Align data lengths (trim to shorter length)
+                min_length = min(len(digital_values), len(analog_values))
+                digital_values = digital_values[:min_length]
+                analog_values = analog_values[:min_length]
 
-            result['total_readings'] = min_length
+                # Calculate MSE and RMSE using correct formula: MSE = mean((digital - analog)²)
+                mse_value = acceptance_stats.mean_squared_error(
+                    digital_values, analog_values)
+                nominal_flowrate = np.mean(digital_values)
 
-            # Calculate MSE and RMSE using correct formula: MSE = mean((digital - analog)²)
-            mse_value = np.square(np.subtract(
-                digital_values, analog_values)).mean()
+            result['total_readings'] = min_length
             rmse_value = np.sqrt(mse_value)
-            nominal_flowrate = np.mean(digital_values)
 
             result['mse_value'] = round(mse_value, 3)
             result['rmse_value'] = round(rmse_value, 3)
@@ -1531,50 +1750,62 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'CSV file not found: {csv_file}'
                 return result
 
-            # Load CSV data
-            df = pd.read_csv(csv_file)
+            if self.streaming_chunk_rows:
+                # Streaming mode: readings are accumulated chunk by chunk
+                snr = acceptance_stats.streaming_snr(
+                    self._tag_value_source(csv_file, tag_name), min_q)
+                result['total_readings'] = snr['total']
 
-            # Filter for the specific tag
-            if 'tag_name' not in df.columns:
-                result['status'] = 'fail'
-                result['details'] = f'No tag_name column found in {csv_file}'
-                return result
+                if result['total_readings'] == 0:
+                    result['status'] = 'fail'
+                    result['details'] = f'No valid readings found for tag {tag_name}'
+                    return result
+            else:
+                # Load CSV data
+                df = self.data_context.read_csv(csv_file)
 
-            tag_data = df[df['tag_name'] == tag_name].copy()
+                # Filter for the specific tag
+                if 'tag_name' not in df.columns:
+                    result['status'] = 'fail'
+                    result['details'] = f'No tag_name column found in {csv_file}'
+                    return result
 
-            if tag_data.empty:
-                result['details'] = f'No data found for tag {tag_name}'
-                result['status'] = 'fail'
-                return result
+                tag_data = self.data_context.tag_rows(csv_file, tag_name)
 
-            # Get values
-            values = tag_data['value'].dropna().values
-            result['total_readings'] = len(values)
+                if tag_data.empty:
+                    result['details'] = f'No data found for tag {tag_name}'
+                    result['status'] = 'fail'
+                    return result
 
-            if result['total_readings'] == 0:
-                result['status'] = 'fail'
-                result['details'] = 'No valid readings found'
-                return result
+                # Get values
+                values = tag_data['value'].dropna().values
+                result['total_readings'] = len(values)
+
+                if result['total_readings'] == 0:
+                    result['status'] = 'fail'
+                    result['details'] = 'No valid readings found'
+                    return result
+
+                # Get steady state values (existing logic)
+                steady_state_values = values[values > min_q]
+                snr = {'steady': len(steady_state_values)}
 
-            # Get steady state values (existing logic)
-            steady_state_values = values[values > min_q]
-            result['steady_state_readings'] = len(steady_state_values)
+            result['steady_state_readings'] = snr['steady']
 
-            if len(steady_state_values) < 10:  # Need more data for scipy methods
+            if snr['steady'] < 10:  # Need more data for scipy methods
                 result['status'] = 'fail'
                 result[
-                    'details'] = f'Insufficient steady state data for robust SNR calculation. Found {len(steady_state_values)} readings (need ≥10).'
+                    'details'] = f'Insufficient steady state data for robust SNR calculation. Found {snr["steady"]} readings (need ≥10).'
                 result['snr_value'] = None
                 return result
 
+            if not self.streaming_chunk_rows:
+                snr = acceptance_stats.snr_stats(steady_state_values)
+
             # Method 1: Improved basic SNR with detrending
-            # Remove linear trend to get better noise estimate
-            detrended_values = scipy.signal.detrend(
-                steady_state_values, type='linear')
-            # RMS power of original signal
-            signal_power = np.mean(steady_state_values**2)
-            # Variance of detrended signal as noise
-            noise_power = np.var(detrended_values)
+            # RMS power of the signal; variance of the linearly detrended signal as noise
+            signal_power = snr['signal_power']
+            noise_power = snr['noise_power']
 
             if noise_power == 0:
                 result['status'] = 'fail'
@@ -1586,28 +1817,19 @@ class FlowmeterAcceptanceService:
             snr_db = 10 * np.log10(signal_power / noise_power)
 
             # Method 2: Spectral SNR using Welch's method
-            try:
-                # Estimate power spectral density
-                frequencies, psd = scipy.signal.welch(
-                    steady_state_values, nperseg=min(len(steady_state_values)//4, 256))
-
-                # Assume signal is in low frequency components (first 10% of spectrum)
-                signal_freq_cutoff = len(frequencies) // 10
-                signal_power_spectral = np.sum(psd[:signal_freq_cutoff])
-                noise_power_spectral = np.sum(psd[signal_freq_cutoff:])
-
-                if noise_power_spectral > 0:
-                    snr_spectral_db = 10 * \
-                        np.log10(signal_power_spectral / noise_power_spectral)
-                else:
-                    snr_spectral_db = None
-            except:
+            # Signal is assumed to be in low frequency components (first 10% of spectrum)
+            signal_power_spectral = snr['spectral_signal_power']
+            noise_power_spectral = snr['spectral_noise_power']
+            if noise_power_spectral is not None and noise_power_spectral > 0:
+                snr_spectral_db = 10 * \
+                    np.log10(signal_power_spectral / noise_power_spectral)
+            else:
                 snr_spectral_db = None
 
             # Method 3: Statistical outlier-based noise estimation
             # Use median absolute deviation for robust noise estimation
-            median_val = np.median(steady_state_values)
-            mad = stats.median_abs_deviation(steady_state_values)
+            median_val = snr['median']
+            mad = snr['mad']
 
             if mad > 0:
                 # MAD-based SNR (more robust to outliers)
@@ -1683,7 +1905,7 @@ class FlowmeterAcceptanceService:
                 }
 
             result = self._test_33_target_vs_digital_comparison(
-                target_csv, digital_csv, accuracy_range, data_dir)
+                target_csv, digital_csv, accuracy_range, data_dir, digital_tag, meter_name)
             return {
                 'status': result['status'],
                 'value': f"{result.get('percentage_within_range', 0):.1f}% within ±{accuracy_range}%",
@@ -1718,7 +1940,7 @@ class FlowmeterAcceptanceService:
                 }
 
             result = self._test_34_target_vs_reference_comparison(
-                target_csv, reference_csv, accuracy_range, data_dir)
+                target_csv, reference_csv, accuracy_range, data_dir, meter_name, ref_tag)
             return {
                 'status': result['status'],
                 'value': f"{result.get('percentage_within_range', 0):.1f}% within ±{accuracy_range}%",
@@ -1731,8 +1953,26 @@ class FlowmeterAcceptanceService:
                 'details': 'Test 3.4 execution failed'
             }
 
+    def _review_values(self, csv_file: str, tag_name: str = None) -> tuple:
+        """
+        (frame, :VAL column) of a review CSV for the 3.x comparisons. With tag_name only
+        that tag's rows and its exact {tag_name}:VAL column are used (the files hold
+        every meter's columns); without it the file is taken to hold a single meter and
+        its first :VAL column is used. The column is None if it is missing.
+        """
+        if tag_name:
+            df = self.data_context.review_tag_rows(csv_file, tag_name)
+            val_column = f"{tag_name}:VAL"
+            return df, val_column if val_column in df.columns else None
+
+        df = self.data_context.read_csv(csv_file)
+        # Strip whitespace from column names to handle formatting inconsistencies
+        df.columns = df.columns.str.strip()
+        return df, next((col for col in df.columns if ':VAL' in col), None)
+
     def _test_33_target_vs_digital_comparison(self, target_csv: str, digital_csv: str,
-                                              accuracy_range: float, data_folder: str) -> Dict[str, Any]:
+                                              accuracy_range: float, data_folder: str,
+                                              digital_tag: str = None, meter_name: str = None) -> Dict[str, Any]:
         """
         Test 3.3: Target vs Digital Signal Comparison
         Compares Target meter values (MBSTagID.csv from Review) with Digital RTU values (SCADATagID_DIG.csv)
@@ -1742,6 +1982,9 @@ class FlowmeterAcceptanceService:
             digital_csv: Path to SCADATagID_DIG.csv (Digital signal from RTU)
             accuracy_range: Percentage tolerance for comparison (e.g., 1.0 for ±1%)
             data_folder: Folder containing the CSV files
+            digital_tag: Digital tag to compare (optional, default: every row in the file)
+            meter_name: MBS tag whose :VAL column is compared (optional, default: the
+                        first :VAL column, for a single-meter file)
 
         Returns:
             Dict with comparison results including percentage within range
@@ -1764,19 +2007,10 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'Target CSV file not found: {target_file}'
                 return result
 
-            target_df = pd.read_csv(target_file)
-            # Strip whitespace from column names to handle formatting inconsistencies
-            target_df.columns = target_df.columns.str.strip()
-
-            # Find the :VAL column in target data
-            val_column = None
-            for col in target_df.columns:
-                if ':VAL' in col:
-                    val_column = col
-                    break
+            target_df, val_column = self._review_values(target_file, meter_name)
 
             if val_column is None:
-                result['details'] = 'No :VAL column found in target CSV file'
+                result['details'] = f'No {meter_name or ""}:VAL column found in target CSV file'
                 return result
 
             # Clean and prepare target data
@@ -1794,7 +2028,11 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'Digital CSV file not found: {digital_file}'
                 return result
 
-            digital_df = pd.read_csv(digital_file)
+            # SCADATagID_DIG.csv holds every meter's digital tag - keep this meter's rows
+            if digital_tag:
+                digital_df = self.data_context.tag_rows(digital_file, digital_tag)
+            else:
+                digital_df = self.data_context.read_csv(digital_file)
 
             # Prepare digital data
             digital_df['datetime'] = pd.to_datetime(
@@ -1859,7 +2097,8 @@ class FlowmeterAcceptanceService:
             return result
 
     def _test_34_target_vs_reference_comparison(self, target_csv: str, reference_csv: str,
-                                                accuracy_range: float, data_folder: str) -> Dict[str, Any]:
+                                                accuracy_range: float, data_folder: str,
+                                                meter_name: str = None, ref_tag: str = None) -> Dict[str, Any]:
         """
         Test 3.4: Target vs Reference Meter Comparison (formerly Test 3.5)
         Compares Target meter values (MBSTagID.csv) with Reference meter values (Reference_Meter.csv)
@@ -1870,6 +2109,9 @@ class FlowmeterAcceptanceService:
             reference_csv: Path to Reference_Meter.csv (Reference meter from Review file)
             accuracy_range: Percentage tolerance for comparison (e.g., 1.0 for ±1%)
             data_folder: Folder containing the CSV files
+            meter_name: MBS tag whose :VAL column is compared (optional, default: the
+                        first :VAL column, for a single-meter file)
+            ref_tag: Reference meter tag, likewise for Reference_Meter.csv
 
         Returns:
             Dict with comparison results including percentage within range
@@ -1893,19 +2135,10 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'Target CSV file not found: {target_file}'
                 return result
 
-            target_df = pd.read_csv(target_file)
-            # Strip whitespace from column names to handle formatting inconsistencies
-            target_df.columns = target_df.columns.str.strip()
-
-            # Find the :VAL column in target data
-            target_val_column = None
-            for col in target_df.columns:
-                if ':VAL' in col:
-                    target_val_column = col
-                    break
+            target_df, target_val_column = self._review_values(target_file, meter_name)
 
             if target_val_column is None:
-                result['details'] = 'No :VAL column found in target CSV file'
+                result['details'] = f'No {meter_name or ""}:VAL column found in target CSV file'
                 return result
 
             # Read Reference meter data (Reference_Meter.csv - Review file format)
@@ -1915,19 +2148,10 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'Reference CSV file not found: {reference_file}'
                 return result
 
-            reference_df = pd.read_csv(reference_file)
-            # Strip whitespace from column names to handle formatting inconsistencies
-            reference_df.columns = reference_df.columns.str.strip()
-
-            # Find the :VAL column in reference data
-            reference_val_column = None
-            for col in reference_df.columns:
-                if ':VAL' in col:
-                    reference_val_column = col
-                    break
+            reference_df, reference_val_column = self._review_values(reference_file, ref_tag)
 
             if reference_val_column is None:
-                result['details'] = 'No :VAL column found in reference CSV file'
+                result['details'] = f'No {ref_tag or ""}:VAL column found in reference CSV file'
                 return result
 
             # Clean and prepare target data
@@ -2061,78 +2285,54 @@ class FlowmeterAcceptanceService:
                 result['details'] = f'CSV file not found: {csv_file}'
                 return result
 
-            # Load CSV data
-            df = pd.read_csv(csv_file)
+            if self.streaming_chunk_rows:
+                # Streaming mode: moments first, then outliers and drift, chunk by chunk
+                stability = acceptance_stats.streaming_stability(
+                    self._tag_value_source(csv_file, tag_name), int(window_size), drift_threshold)
+                result['total_readings'] = stability['total']
+            else:
+                # Load CSV data
+                df = self.data_context.read_csv(csv_file)
 
-            # Filter for the specific tag
-            if 'tag_name' not in df.columns:
-                result['status'] = 'fail'
-                result['details'] = f'No tag_name column found in {csv_file}'
-                return result
+                # Filter for the specific tag
+                if 'tag_name' not in df.columns:
+                    result['status'] = 'fail'
+                    result['details'] = f'No tag_name column found in {csv_file}'
+                    return result
 
-            tag_data = df[df['tag_name'] == tag_name].copy()
+                tag_data = self.data_context.tag_rows(csv_file, tag_name)
 
-            if tag_data.empty:
-                result['details'] = f'No data found for tag {tag_name}'
-                result['status'] = 'fail'
-                return result
+                if tag_data.empty:
+                    result['details'] = f'No data found for tag {tag_name}'
+                    result['status'] = 'fail'
+                    return result
 
-            # Get values and basic statistics
-            values = tag_data['value'].dropna().values
-            result['total_readings'] = len(values)
+                # Get values and basic statistics
+                values = tag_data['value'].dropna().values
+                result['total_readings'] = len(values)
 
             if result['total_readings'] < window_size:
                 result['status'] = 'fail'
                 result['details'] = f'Insufficient data: need at least {window_size} readings, got {result["total_readings"]}'
                 return result
 
-            # Calculate basic statistics
-            mean_value = np.mean(values)
-            std_deviation = np.std(values)
-            result['mean_value'] = round(mean_value, 3)
-            result['std_deviation'] = round(std_deviation, 3)
-
-            # ±3σ outlier detection (original approach)
-            lower_3sigma = mean_value - 3 * std_deviation
-            upper_3sigma = mean_value + 3 * std_deviation
-            outliers = values[(values < lower_3sigma) |
-                              (values > upper_3sigma)]
-            result['outliers_count'] = len(outliers)
-
-            # Rolling statistics for drift detection
-            values_series = pd.Series(values)
-            rolling_mean = values_series.rolling(
-                window=window_size, center=True).mean()
-            rolling_std = values_series.rolling(
-                window=window_size, center=True).std()
-
-            # Drift detection: check if rolling mean deviates more than drift_threshold% from overall mean
-            drift_violations = 0
-            drift_threshold_abs = mean_value * (drift_threshold / 100.0)
-
-            for rolling_val in rolling_mean.dropna():
-                if abs(rolling_val - mean_value) > drift_threshold_abs:
-                    drift_violations += 1
+            if not self.streaming_chunk_rows:
+                # ±3σ outliers, centered rolling mean drifting more than drift_threshold%
+                # from the overall mean, and readings that are neither
+                stability = acceptance_stats.stability_stats(
+                    values, int(window_size), drift_threshold)
 
+            result['mean_value'] = round(stability['mean'], 3)
+            result['std_deviation'] = round(stability['std'], 3)
+            result['outliers_count'] = stability['outliers']
+            drift_violations = stability['drift_violations']
             result['drift_violations'] = drift_violations
 
             # Stability analysis: combine outlier and drift analysis
             # A reading is considered "stable" if:
             # 1. It's within ±3σ bounds
-            # 2. Its local rolling mean is within drift threshold
-            stable_readings = 0
-
-            for i, value in enumerate(values):
-                is_within_3sigma = lower_3sigma <= value <= upper_3sigma
-
-                # Check if rolling mean at this point is stable (if available)
-                rolling_stable = True
-                if not pd.isna(rolling_mean.iloc[i]):
-                    rolling_stable = abs(
-                        rolling_mean.iloc[i] - mean_value) <= drift_threshold_abs
-
-                if is_within_3sigma and rolling_stable:
-                    stable_readings += 1
+            # 2. Its local rolling mean (where defined) is within drift threshold
+            stable_readings = stability['stable']
 
             result['stable_readings'] = stable_readings
             result['stability_percentage'] = round(
@@ -2448,6 +2648,9 @@ class FlowmeterAcceptanceService:
                 f"Loaded {len(self.tags_df)} meter configurations")
 
             exported_files = []
+            # RTU and Review tags are collected per output file and exported in one pass each afterwards
+            rtu_tag_groups = {}
+            review_tag_groups = {}
 
             # Process each meter's tags (Tags.in format only)
             for index, row in self.tags_df.iterrows():
@@ -2459,45 +2662,54 @@ class FlowmeterAcceptanceService:
                 ref_scada_tag = row.get('Ref_SCADATagID', '').strip(
                 ) if 'Ref_SCADATagID' in row else ''
 
-                self.logger.info(f"Exporting data for meter: {meter_name}")
+                self.logger.info(f"Collecting export tags for meter: {meter_name}")
 
-                # Export RTU data for digital tag
+                # Collect RTU data for digital tag
                 if digital_tag:
                     dig_csv_file = os.path.join(data_dir, "SCADATagID_DIG.csv")
-                    self._export_rtu_tag_data(
-                        rtu_file, digital_tag, dig_csv_file, time_start, time_end)
+                    rtu_tag_groups.setdefault(dig_csv_file, []).append(digital_tag)
                     exported_files.append(dig_csv_file)
 
-                # Export RTU data for analog tag
+                # Collect RTU data for analog tag
                 if analog_tag:
                     anl_csv_file = os.path.join(data_dir, "SCADATagID_ANL.csv")
-                    self._export_rtu_tag_data(
-                        rtu_file, analog_tag, anl_csv_file, time_start, time_end)
+                    rtu_tag_groups.setdefault(anl_csv_file, []).append(analog_tag)
                     exported_files.append(anl_csv_file)
 
-                # Export RTU data for reference SCADA tag (new functionality)
+                # Collect RTU data for reference SCADA tag (new functionality)
                 if ref_scada_tag:
                     ref_scada_csv_file = os.path.join(
                         data_dir, "Ref_SCADATagID.csv")
-                    self._export_rtu_tag_data(
-                        rtu_file, ref_scada_tag, ref_scada_csv_file, time_start, time_end)
+                    rtu_tag_groups.setdefault(ref_scada_csv_file, []).append(ref_scada_tag)
                     exported_files.append(ref_scada_csv_file)
 
-                # Export Review data for MBS tag
+                # Collect Review data for MBS tag
                 if meter_name:
                     mbs_csv_file = os.path.join(data_dir, "MBSTagID.csv")
-                    self._export_review_tag_data(
-                        review_file, meter_name, mbs_csv_file, time_start, time_end)
+                    review_tag_groups.setdefault(mbs_csv_file, []).append(meter_name)
                     exported_files.append(mbs_csv_file)
 
-                # Export Review data for Reference tag
+                # Collect Review data for Reference tag
                 if ref_tag:
                     ref_csv_file = os.path.join(
                         data_dir, "Reference_Meter.csv")
-                    self._export_review_tag_data(
-                        review_file, ref_tag, ref_csv_file, time_start, time_end)
+                    review_tag_groups.setdefault(ref_csv_file, []).append(ref_tag)
                     exported_files.append(ref_csv_file)
 
+            # Export all Review tags with a single dreview pass over the review files
+            self._check_cancelled()
+            if review_tag_groups:
+                self._report_progress('export', 0, 2, "Exporting review data")
+                self._export_review_tag_groups(
+                    review_file, review_tag_groups, time_start, time_end)
+
+            # Export all RTU tags with a single read of the RTU file
+            self._check_cancelled()
+            if rtu_tag_groups:
+                self._report_progress('export', 1, 2, "Exporting RTU data")
+                self._export_rtu_tag_groups(
+                    rtu_file, rtu_tag_groups, time_start, time_end)
+
             return {
                 'success': True,
                 # Remove duplicates
@@ -2506,46 +2718,96 @@ class FlowmeterAcceptanceService:
                 'message': f'CSV export completed. {len(set(exported_files))} files exported to {data_dir}'
             }
 
+        except OperationCancelledError:
+            raise
         except Exception as e:
             self.logger.error(f"CSV export failed: {e}")
             raise ProcessingError(f"CSV export error: {e}")
 
-    def _export_rtu_tag_data(self, rtu_file: str, tag_name: str, output_file: str,
-                             start_time: str, end_time: str):
-        """Export RTU data for a specific tag to CSV."""
-        try:
-            self.logger.info(f"Exporting RTU tag: {tag_name} to {output_file}")
-
-            # Create a temporary tags file for the specific tag
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_tags_file:
-                temp_tags_file.write(tag_name)
-                temp_tags_path = temp_tags_file.name
+    def _export_rtu_tag_groups(self, rtu_file: str, tag_groups: Dict[str, List[str]],
+                               start_time: str, end_time: str):
+        """
+        Export RTU data for all meters' tags in one pass over the RTU file.
 
-            try:
-                self.rtu_service.export_csv_flat(
-                    input_file=rtu_file,
-                    output_file=output_file,
-                    start_time=start_time,
-                    end_time=end_time,
-                    tags_file=temp_tags_path
-                )
+        tag_groups maps each output CSV to the tags written to it (e.g. every meter's
+        digital tag goes to SCADATagID_DIG.csv); the tests filter the files by tag_name.
+        """
+        try:
+            self.logger.info(
+                f"Exporting RTU tags to {len(tag_groups)} CSV files: {tag_groups}")
+
+            counts = self.rtu_service.export_csv_flat_groups(
+                input_file=rtu_file,
+                groups=tag_groups,
+                start_time=start_time,
+                end_time=end_time
+            )
+            for output_file, count in counts.items():
                 self.logger.info(
-                    f"Successfully exported RTU tag {tag_name} to {output_file}")
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_tags_path):
-                    os.unlink(temp_tags_path)
+                    f"Successfully exported {count} RTU points to {output_file}")
 
         except Exception as e:
-            self.logger.error(f"Failed to export RTU tag {tag_name}: {e}")
-            raise ProcessingError(f"RTU export error for {tag_name}: {e}")
+            self.logger.error(f"Failed to export RTU tags {tag_groups}: {e}")
+            raise ProcessingError(f"RTU export error for {tag_groups}: {e}")
+
+    def _review_match_batches(self, tag_groups: Dict[str, List[str]]) -> List[Dict[str, List[str]]]:
+        """
+        Pack tag_groups into dreview runs whose -match list stays within MATCH_ARG_BUDGET.
 
-    def _export_review_tag_data(self, review_file: str, tag_name: str, output_file: str,
-                                start_time: str, end_time: str):
-        """Export Review data for a specific tag using ReviewCsvService exactly like REVIEW to CSV page."""
+        Output files are kept whole in one run while they fit; an output whose tags
+        alone exceed the budget is split across runs by tag. Returns one
+        {output_file: tags} mapping per run (a single run for typical tag counts).
+        """
+        def match_length(tag):
+            return len(",".join(_review_tag_variants(tag))) + 1
+
+        batches: List[Dict[str, List[str]]] = [{}]
+        batch_tags = set()
+        used = 0
+        for output_file, tags in tag_groups.items():
+            tags = list(dict.fromkeys(tags))
+            if used and used + sum(match_length(tag) for tag in tags if tag not in batch_tags) > MATCH_ARG_BUDGET:
+                batches.append({})
+                batch_tags, used = set(), 0
+            for tag in tags:
+                if tag not in batch_tags:
+                    if used and used + match_length(tag) > MATCH_ARG_BUDGET:
+                        batches.append({})
+                        batch_tags, used = set(), 0
+                    batch_tags.add(tag)
+                    used += match_length(tag)
+                batches[-1].setdefault(output_file, []).append(tag)
+        return batches
+
+    def _merge_review_parts(self, output_file: str, parts: List[str]):
+        """Merge the per-run parts of one review output file by TIME into output_file."""
+        with ExitStack() as stack:
+            sources = [(os.path.basename(part), stack.enter_context(open(part))) for part in parts]
+            rows = ReviewCsvService.merge_review_streams(sources, output_file, unit_lines=False)
+        if rows is None:
+            # No rows in any run: keep one part's header so the tests see an empty file
+            shutil.copyfile(parts[0], output_file)
+        self.logger.info(
+            f"Merged {rows or 0} Review rows from {len(parts)} dreview runs into {output_file}")
+
+    def _export_review_tag_groups(self, review_file: str, tag_groups: Dict[str, List[str]],
+                                  start_time: str, end_time: str):
+        """
+        Export Review data for all meters' tags with ReviewCsvService, like the REVIEW to CSV page.
+
+        tag_groups maps each output CSV to the tags written to it (e.g. every meter's
+        MBS tag goes to MBSTagID.csv). One -match covers the :VAL/:ST/:FLAT variants of
+        every tag, so each review file goes through dreview once; the merged result is
+        then split by column into the output files (TIME plus each tag's variants).
+        When the -match list would exceed the cmd.exe command-line limit, the tags are
+        split into several runs (see _review_match_batches).
+        Each output file holds the rows of all its tags, so the tests read one meter
+        through AcceptanceDataContext.review_tag_rows.
+        """
+        all_tags = list(dict.fromkeys(tag for tags in tag_groups.values() for tag in tags))
         try:
             self.logger.info(
-                f"Exporting Review tag: {tag_name} to {output_file}")
+                f"Exporting Review tags to {len(tag_groups)} CSV files: {tag_groups}")
 
             # Get the review folder from the review file (parent directory)
             review_folder = os.path.dirname(review_file)
@@ -2577,50 +2839,96 @@ class FlowmeterAcceptanceService:
             start_formatted = parse_datetime_to_service_format(start_time)
             end_formatted = parse_datetime_to_service_format(end_time)
 
-            # Create tags with suffixes (same as original logic)
-            tag_variants = [
-                f"{tag_name}:VAL",
-                f"{tag_name}:ST",
-                f"{tag_name}:FLAT"
-            ]
+            merged_file = "FlowmeterReview_merged.csv"
+            merged_path = os.path.join(review_folder, merged_file)
+
+            # Each output file is written by one run where its tags fit in the -match
+            # budget; an output split across runs is assembled from its parts afterwards
+            batches = self._review_match_batches(tag_groups)
+            runs_per_output = {output_file: sum(output_file in batch for batch in batches)
+                               for output_file in tag_groups}
+            output_parts = {output_file: [] for output_file in tag_groups}
+            if len(batches) > 1:
+                self.logger.info(
+                    f"Review -match list for {len(all_tags)} tags split into {len(batches)} dreview runs")
 
             try:
-                # Create ReviewCsvService instance exactly like REVIEW to CSV page
-                review_service = ReviewCsvService(
-                    folder_path=review_folder,
-                    start_time=start_formatted,
-                    end_time=end_formatted,
-                    peek_list=tag_variants,  # Set peek_list directly instead of using file
-                    dump_all=True,  # Export all data points, not just sampled at intervals
-                    freq=None,  # Not used when dump_all=True
-                    merged_file=os.path.basename(output_file)
-                )
-                review_service.run()
-
-                # The merged file should be in the review folder, move it to output location
-                source_file = os.path.join(
-                    review_folder, os.path.basename(output_file))
-                if os.path.exists(source_file):
-                    if source_file != output_file:
-                        shutil.move(source_file, output_file)
-                    self.logger.info(
-                        f"Successfully exported Review tag {tag_name} to {output_file}")
-                else:
-                    self.logger.warning(
-                        f"Expected output file not found: {source_file}")
-                    # Check if there are any CSV files generated in the review folder
-                    csv_files = [f for f in os.listdir(
-                        review_folder) if f.endswith('.csv')]
+                for run_number, batch in enumerate(batches, 1):
+                    batch_tags = list(dict.fromkeys(tag for tags in batch.values() for tag in tags))
+
+                    def report_files(files_done, file_count, _review_file):
+                        self._report_progress('export', 0, 2,
+                                              f"Exporting review data, run {run_number}/{len(batches)} "
+                                              f"({files_done}/{file_count} files)")
+
+                    # Create ReviewCsvService instance exactly like REVIEW to CSV page
+                    review_service = ReviewCsvService(
+                        folder_path=review_folder,
+                        start_time=start_formatted,
+                        end_time=end_formatted,
+                        # Set peek_list directly instead of using file
+                        peek_list=[variant for tag in batch_tags for variant in _review_tag_variants(tag)],
+                        dump_all=True,  # Export all data points, not just sampled at intervals
+                        freq=None,  # Not used when dump_all=True
+                        merged_file=merged_file,
+                        progress_callback=report_files
+                    )
+                    # Exposed so cancel() can stop the dreview processes
+                    self.review_service = review_service
+                    try:
+                        review_stats = review_service.run()
+                    finally:
+                        self.review_service = None
                     self.logger.info(
-                        f"CSV files found in review folder: {csv_files}")
-
+                        f"dreview throughput for {len(batch_tags)} tags: {review_stats['files_per_sec']} files/s, {review_stats['rows_per_sec']} rows/s")
+                    if review_stats['files_failed']:
+                        self.logger.warning(
+                            f"dreview failed for review files {review_stats['files_failed']}; their data may be incomplete")
+                    self._check_cancelled()
+
+                    # The merged file is in the review folder, split it into the output files
+                    if os.path.exists(merged_path):
+                        split_targets = {}
+                        for output_file, tags in batch.items():
+                            target = output_file if runs_per_output[output_file] == 1 \
+                                else f"{output_file}.part{run_number}"
+                            output_parts[output_file].append(target)
+                            split_targets[target] = [variant for tag in tags for variant in _review_tag_variants(tag)]
+                        try:
+                            counts = ReviewCsvService.split_columns(merged_path, split_targets)
+                        finally:
+                            os.remove(merged_path)
+                        for target, count in counts.items():
+                            self.logger.info(f"Successfully exported {count} Review rows to {target}")
+                    else:
+                        self.logger.warning(
+                            f"Expected output file not found: {merged_path}")
+                        # Check if there are any CSV files generated in the review folder
+                        csv_files = [f for f in os.listdir(
+                            review_folder) if f.endswith('.csv')]
+                        self.logger.info(
+                            f"CSV files found in review folder: {csv_files}")
+
+                for output_file, parts in output_parts.items():
+                    if runs_per_output[output_file] > 1 and parts:
+                        self._merge_review_parts(output_file, parts)
+
+            except OperationCancelledError:
+                raise
             except Exception as service_error:
                 self.logger.error(f"ReviewCsvService failed: {service_error}")
                 raise
+            finally:
+                for output_file, parts in output_parts.items():
+                    for part in parts:
+                        if part != output_file and os.path.exists(part):
+                            os.remove(part)
 
+        except OperationCancelledError:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to export Review tag {tag_name}: {e}")
-            raise ProcessingError(f"Review export error for {tag_name}: {e}")
+            self.logger.error(f"Failed to export Review tags {all_tags}: {e}")
+            raise ProcessingError(f"Review export error for {all_tags}: {e}")
 
             return {
                 'success': True,
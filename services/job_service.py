@@ -0,0 +1,207 @@
+"""
+Background job service for long-running page operations.
+
+Dash callbacks submit work here instead of running it inline, get a job ID back
+immediately and poll the job's status from a dcc.Interval. Each job runs in a
+daemon thread (the same model the RTU pages use) and reports stage-level
+progress; cancellation is cooperative through a threading.Event.
+"""
+
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+# Finished jobs are kept this long for the page to collect their result
+FINISHED_JOB_TTL_SEC = 3600
+
+
+class Job:
+    """State of one background job. Mutated by the worker thread, read through JobService.status."""
+
+    def __init__(self, job_id: str, name: str, on_cancel: Callable[[], None] = None):
+        self.job_id = job_id
+        self.name = name
+        self.status = QUEUED
+        self.stage = None
+        self.stage_done = 0
+        self.stage_total = 0
+        self.message = "Queued"
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self.on_cancel = on_cancel
+        self._lock = threading.Lock()
+
+    def report(self, stage: str, done: int = 0, total: int = 0, message: str = ""):
+        """Progress callback handed to the job function: (stage, done, total, message)."""
+        with self._lock:
+            if self.status != RUNNING:
+                return
+            self.stage = stage
+            self.stage_done = done
+            self.stage_total = total
+            self.message = message or stage
+
+    def _finish(self, status: str, result: Any = None, error: str = None):
+        with self._lock:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished_at = time.time()
+            if status == COMPLETED:
+                self.message = "Completed"
+            elif status == CANCELLED:
+                self.message = "Cancelled"
+            else:
+                self.message = f"Failed: {error}"
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            percent = None
+            if self.stage_total:
+                percent = round(100.0 * self.stage_done / self.stage_total, 1)
+            return {
+                'job_id': self.job_id,
+                'name': self.name,
+                'status': self.status,
+                'stage': self.stage,
+                'stage_done': self.stage_done,
+                'stage_total': self.stage_total,
+                'percent': percent,
+                'progress': self.message,
+                'result': self.result,
+                'error': self.error,
+                'elapsed_sec': round((self.finished_at or time.time()) - self.created_at, 1),
+            }
+
+
+class JobService:
+    """
+    Registry of background jobs keyed by job ID.
+
+    submit() runs func(*args, progress_callback=..., cancel_event=..., **kwargs) in a
+    daemon thread, so func must accept those two keyword arguments. A function that
+    notices the cancel event should stop and return or raise; the job then ends as
+    'cancelled' whatever it returns.
+    """
+
+    def __init__(self, finished_ttl_sec: float = FINISHED_JOB_TTL_SEC):
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._finished_ttl_sec = finished_ttl_sec
+
+    def submit(self, func: Callable[..., Any], *args, name: str = "job",
+               on_cancel: Callable[[], None] = None, **kwargs) -> str:
+        """
+        Start func in the background and return its job ID.
+
+        Args:
+            func: Work function; receives progress_callback and cancel_event keyword arguments
+            name: Label for logs and status
+            on_cancel: Optional hook called from cancel() to interrupt blocking work
+                (e.g. kill subprocesses) in addition to setting the cancel event
+        """
+        self._prune()
+        job = Job(f"{name}_{uuid.uuid4().hex[:12]}", name, on_cancel)
+        with self._lock:
+            self._jobs[job.job_id] = job
+
+        thread = threading.Thread(
+            target=self._run, args=(job, func, args, kwargs),
+            name=job.job_id, daemon=True)
+        job.status = RUNNING
+        job.message = "Starting..."
+        thread.start()
+        logger.info(f"Started job {job.job_id}")
+        return job.job_id
+
+    def _run(self, job: Job, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]):
+        try:
+            result = func(*args, progress_callback=job.report,
+                          cancel_event=job.cancel_event, **kwargs)
+        except Exception as e:
+            if job.cancel_event.is_set():
+                job._finish(CANCELLED)
+                logger.info(f"Job {job.job_id} cancelled")
+            else:
+                job._finish(FAILED, error=str(e))
+                logger.error(f"Job {job.job_id} failed: {e}", exc_info=True)
+            return
+
+        if job.cancel_event.is_set():
+            job._finish(CANCELLED)
+            logger.info(f"Job {job.job_id} cancelled")
+        else:
+            job._finish(COMPLETED, result=result)
+            logger.info(f"Job {job.job_id} completed")
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Snapshot of a job's state (None for unknown or expired job IDs)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job.snapshot() if job else None
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation. Returns False if the job is unknown or already finished."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return False
+
+        logger.info(f"Cancellation requested for job {job_id}")
+        job.cancel_event.set()
+        if job.on_cancel:
+            try:
+                job.on_cancel()
+            except Exception as e:
+                logger.warning(f"Cancel hook for job {job_id} failed: {e}")
+        return True
+
+    def discard(self, job_id: str):
+        """Forget a finished job once its result has been collected."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.status in FINISHED_STATES:
+                del self._jobs[job_id]
+
+    def _prune(self):
+        """Drop finished jobs nobody collected within the TTL."""
+        cutoff = time.time() - self._finished_ttl_sec
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+# Global job service instance
+_job_service: Optional[JobService] = None
+
+
+def get_job_service() -> JobService:
+    """
+    Get the global job service instance.
+
+    Returns:
+        Global JobService instance
+    """
+    global _job_service
+    if _job_service is None:
+        _job_service = JobService()
+    return _job_service
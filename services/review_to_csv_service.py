@@ -1,18 +1,328 @@
 import os
+import csv
+import heapq
+import re
+import shlex
 import subprocess
+import tempfile
+from collections import deque
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import pandas as pd
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import threading
 import time
 import psutil  # pip install psutil
 from logging_config import get_logger
+from services.config_manager import get_config_manager
 
 logger = get_logger(__name__)
 
+# dreview TIME formats. All are zero-padded and big-endian, so when every input uses
+# the same one the TIME text sorts chronologically and rows are merged on the text.
+REVIEW_TIME_FORMATS = (
+    '%y/%m/%d %H:%M:%S',
+    '%y/%m/%d_%H:%M:%S',
+    '%Y/%m/%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S',
+    '%y/%m/%d %H:%M:%S.%f',
+    '%Y/%m/%d %H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S.%f',
+)
+
+
+def _review_time_format(value: str) -> Optional[str]:
+    """The REVIEW_TIME_FORMATS entry value is written in exactly (None if none)."""
+    for fmt in REVIEW_TIME_FORMATS:
+        try:
+            if datetime.strptime(value, fmt).strftime(fmt) == value:
+                return fmt
+        except ValueError:
+            continue
+    return None
+
+
+def _parsed_time_key(value: str) -> tuple:
+    """Sort key for mixed or unknown TIME formats; unparseable times sort as text after the rest."""
+    for fmt in REVIEW_TIME_FORMATS:
+        try:
+            return (0, datetime.strptime(value, fmt))
+        except ValueError:
+            continue
+    return (1, value)
+
+
+def _csv_field(value: str) -> str:
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _split_csv_line(line: str) -> List[str]:
+    # Plain split unless the line uses quoting
+    return next(csv.reader([line])) if '"' in line else line.split(',')
+
+
+class ReviewCsvInput:
+    """
+    One dreview CSV output read as a stream: header line, unit line (dropped), data rows.
+
+    Lines are consumed one at a time from any iterable of text lines (an open file
+    or a process pipe), so only the current row of each input is held. unit_line=False
+    reads CSVs without a unit line (e.g. written by merge_review_streams or split_columns).
+    """
+
+    def __init__(self, name: str, lines: Iterable[str], unit_line: bool = True):
+        self.name = name
+        self._lines = iter(lines)
+        header_line = next(self._lines, '').rstrip('\r\n')
+        self.header = _split_csv_line(header_line) if header_line else None
+        if unit_line:
+            next(self._lines, None)
+        # Blank lines are skipped; the first data row tells whether the input is empty
+        self.first_line = self._next_line()
+        self.skipped_rows = 0
+
+        upper = [name.strip().upper() for name in self.header or []]
+        self._time_pos = upper.index('TIME') if 'TIME' in upper else 0
+        self.time_format = None
+        if self.first_line is not None:
+            fields = _split_csv_line(self.first_line)
+            if self._time_pos < len(fields):
+                self.time_format = _review_time_format(fields[self._time_pos].strip())
+
+    def _next_line(self) -> Optional[str]:
+        for line in self._lines:
+            line = line.rstrip('\r\n')
+            if line:
+                return line
+        return None
+
+    @property
+    def empty(self) -> bool:
+        return not self.header or self.first_line is None
+
+    def keyed_lines(self, order: int, columns: dict, text_keys: bool) -> Iterator[Tuple[object, int, str]]:
+        """
+        (time key, order, output line) for every data row, laid out on the merged
+        columns. order breaks ties between inputs so equal times keep input order.
+        """
+        width = len(columns)
+        field_count = len(self.header)
+        positions = [columns[name] for name in self.header]
+        identity = positions == list(range(field_count))
+        time_pos = self._time_pos
+
+        lines = chain([self.first_line], (line.rstrip('\r\n') for line in self._lines))
+        for line in lines:
+            if not line:
+                continue
+            fields = _split_csv_line(line)
+            if len(fields) > field_count:
+                # Same policy as pandas on_bad_lines='skip'
+                self.skipped_rows += 1
+                continue
+            time_value = fields[time_pos].strip() if time_pos < len(fields) else ''
+            key = time_value if text_keys else _parsed_time_key(time_value)
+            if identity:
+                # Row passes through as read, padded to the merged width
+                yield key, order, line + ',' * (width - len(fields))
+            else:
+                out = [''] * width
+                for pos, value in zip(positions, fields):
+                    out[pos] = _csv_field(value)
+                yield key, order, ','.join(out)
+
+
+# Date (and optional time) embedded in a review file name, e.g. ..._20250113_0800.review
+_REVIEW_NAME_TIME = re.compile(
+    r'(?<!\d)(\d{4})[-_]?(\d{2})[-_]?(\d{2})(?:[-_T]?(\d{2})[-_:]?(\d{2})(?:[-_:]?(\d{2}))?)?(?!\d)')
+
+# A review file is never pruned unless its last write is this long before TBEGIN
+# (covers clock and time zone differences between the writer and the share)
+REVIEW_MTIME_SLACK = timedelta(hours=24)
+
+# Lines of dreview output a DreviewPipe holds in memory before spilling to disk
+PIPE_BUFFER_LINES = 1 << 14
+
+# cmd.exe rejects longer command lines
+CMD_LINE_LIMIT = 8191
+
+# Characters allowed in one -match=(...) list when callers batch their tags; the rest
+# of CMD_LINE_LIMIT covers dreview.exe, the paths and the options
+MATCH_ARG_BUDGET = 6000
+
+# Review service time format ('yy/MM/dd_HH:mm:ss')
+REVIEW_SERVICE_TIME_FORMAT = '%y/%m/%d_%H:%M:%S'
+
+
+def _review_name_time(name: str) -> Optional[datetime]:
+    """
+    Start time encoded in a review file name, or None. The earliest date-like token
+    is used, so a range name such as X_20250101_20250131 starts on its first date.
+    """
+    times = []
+    for match in _REVIEW_NAME_TIME.finditer(name):
+        year, month, day, hour, minute, second = (int(g) if g else 0 for g in match.groups())
+        try:
+            times.append(datetime(year, month, day, hour, minute, second))
+        except ValueError:
+            continue
+    return min(times) if times else None
+
+
+class ReviewTimeIndex:
+    """
+    Lightweight time index of the review files in one folder, used to skip files
+    that cannot overlap [TBEGIN, TEND] before launching dreview.
+
+    Bounds come from file metadata only (the files are never opened):
+    - end: a file holds no data after its last write, so files last modified more
+      than REVIEW_MTIME_SLACK before TBEGIN are skipped;
+    - start: a file holds no data before the date/time in its name, so files whose
+      name starts after TEND are skipped.
+    No end bound is taken from file names: a folder may interleave several series,
+    so the next file's name says nothing about where this one ends. A file without
+    usable bounds is always kept. Name times are cached per folder and only parsed
+    for new names; modification times are re-read on every query because the
+    newest file is still being written.
+    """
+
+    _cache: Dict[str, Dict[str, Optional[datetime]]] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, folder_path: Path):
+        self.folder_path = Path(folder_path)
+
+    def _name_times(self, names: List[str]) -> Dict[str, Optional[datetime]]:
+        key = os.path.abspath(self.folder_path)
+        with self._cache_lock:
+            cached = self._cache.setdefault(key, {})
+            for name in names:
+                if name not in cached:
+                    cached[name] = _review_name_time(name)
+            return {name: cached[name] for name in names}
+
+    def overlapping(self, review_files: List[Path], start: datetime, end: datetime) -> List[Path]:
+        """The review_files (order kept) that may hold data within [start, end]."""
+        name_times = self._name_times([f.name for f in review_files])
+
+        kept = []
+        for review_file in review_files:
+            starts = name_times[review_file.name]
+            if starts is not None and starts > end:
+                continue
+            try:
+                last_write = datetime.fromtimestamp(review_file.stat().st_mtime)
+            except OSError:
+                last_write = None
+            if last_write is not None and last_write + REVIEW_MTIME_SLACK < start:
+                continue
+            kept.append(review_file)
+        return kept
+
+
+class DreviewPipe:
+    """
+    Text lines of one dreview process's stdout, as an iterable for the merger.
+
+    A worker thread (ReviewCsvService._pipe_review_file) feeds the lines in batches
+    while the process runs and closes the pipe at EOF; iteration blocks until lines
+    arrive, so there is no polling.
+
+    At most buffer_lines lines are held in memory. The merger needs the first row of
+    every input before it emits anything, so once there are more files than dreview
+    processes, finished outputs would otherwise wait in memory for the last file to
+    start. When the buffer is full, the unread lines and the rest of the output are
+    spilled to a temporary file and read back once the pipe is closed. The feeder never blocks, so a slow
+    merger cannot hold a dreview process (or its worker slot) open.
+    """
+
+    def __init__(self, review_file: Path, buffer_lines: int = None):
+        self.review_file = review_file
+        self.buffer_lines = buffer_lines or PIPE_BUFFER_LINES
+        self.rows = 0
+        self.spilled_rows = 0
+        self.buffered_lines = 0
+        self._batches = deque()
+        self._spill = None
+        self._closed = False
+        self._discarded = False
+        self._ready = threading.Condition()
+
+    def feed(self, lines: List[str]):
+        with self._ready:
+            if self._closed:
+                return  # cancelled: nobody will read these lines
+            self.rows += len(lines)
+            if self._spill is None and self.buffered_lines + len(lines) <= self.buffer_lines:
+                self._batches.append(lines)
+                self.buffered_lines += len(lines)
+                self._ready.notify()
+                return
+            if self._spill is None:
+                self._spill = tempfile.NamedTemporaryFile(
+                    mode='w+', prefix=f"{self.review_file.stem}_", suffix='.dreview', delete=False)
+                logger.info("Merger is not keeping up with %s, spilling its output to %s",
+                            self.review_file.name, self._spill.name)
+                # Lines not yet read move to the file too, so a spilled pipe holds no memory
+                while self._batches:
+                    batch = self._batches.popleft()
+                    self._spill.writelines(batch)
+                    self.spilled_rows += len(batch)
+                self.buffered_lines = 0
+            # Once spilling, every later line goes to the file so order is kept
+            self._spill.writelines(lines)
+            self.spilled_rows += len(lines)
+
+    def close(self):
+        with self._ready:
+            self._closed = True
+            self._ready.notify_all()
+
+    def discard(self):
+        """Close the pipe and delete its spill file (after the merge or on cancel)."""
+        with self._ready:
+            self._closed = True
+            self._discarded = True
+            self._batches.clear()
+            self.buffered_lines = 0
+            spill, self._spill = self._spill, None
+            self._ready.notify_all()
+        if spill is not None:
+            spill.close()
+            try:
+                os.unlink(spill.name)
+            except OSError as ex:
+                logger.warning("Could not remove spill file %s: %s", spill.name, ex)
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            with self._ready:
+                while not self._batches and not self._closed:
+                    self._ready.wait()
+                if not self._batches:
+                    break
+                lines = self._batches.popleft()
+                self.buffered_lines -= len(lines)
+            yield from lines
+
+        with self._ready:
+            spill = None if self._discarded else self._spill
+            if spill is not None:
+                spill.flush()
+                spill.seek(0)
+        if spill is not None:
+            yield from spill
+        self.discard()
+
 
 class ReviewCsvService:
-    def __init__(self, folder_path: str, start_time: str, end_time: str, peek_list=None, dump_all=False, freq=None, merged_file="merged.csv"):
+    def __init__(self, folder_path: str, start_time: str, end_time: str, peek_list=None, dump_all=False, freq=None, merged_file="merged.csv",
+                 pipe_output: bool = None, dreview_command=None, max_processes: int = None,
+                 progress_callback: Callable[[int, int, Path], None] = None, time_pruning: bool = None):
         """
         :param folder_path: Folder containing .review files
         :param start_time: Start time in 'yy/MM/dd_HH:mm:ss' format
@@ -21,6 +331,15 @@ class ReviewCsvService:
         :param dump_all: Boolean flag for duration text
         :param freq: Frequency for -DT if dump_all is False
         :param merged_file: Name of final merged CSV file
+        :param pipe_output: Spawn dreview directly and merge its stdout (no cmd.exe, no per-file CSVs);
+            None uses review_to_csv.pipe_output from config
+        :param dreview_command: dreview executable for pipe mode, a string or argument list
+            (e.g. a stand-in script); None uses review_to_csv.dreview_command from config
+        :param max_processes: Maximum concurrent dreview processes; None uses
+            review_to_csv.max_processes from config (0 = one per CPU core)
+        :param progress_callback: Called as (files_done, file_count, review_file) as files finish
+        :param time_pruning: Skip review files that cannot overlap [start_time, end_time]
+            (see ReviewTimeIndex); None uses review_to_csv.time_pruning from config
         """
         self.folder_path = Path(folder_path)
         self.start_time = start_time
@@ -30,6 +349,28 @@ class ReviewCsvService:
         self.freq = freq
         self.merged_file = merged_file
 
+        config = get_config_manager()
+        self.pipe_output = config.get_review_pipe_output() if pipe_output is None else pipe_output
+        if dreview_command is None:
+            dreview_command = config.get_review_dreview_command()
+        if isinstance(dreview_command, str):
+            dreview_command = shlex.split(dreview_command, posix=(os.name != 'nt'))
+        self.dreview_command = list(dreview_command)
+
+        if max_processes is None:
+            max_processes = config.get_review_max_processes()
+        if not max_processes or max_processes <= 0:
+            max_processes = os.cpu_count() or 1
+        self.max_processes = int(max_processes)
+        self.progress_callback = progress_callback
+
+        # Throughput of the last run (see run())
+        self.last_run_stats: Dict[str, Any] = {}
+        # Review files whose dreview run failed in the last fetch
+        self.failed_files: List[Path] = []
+        self._files_done = 0
+        self._progress_lock = threading.Lock()
+
         # Cancellation and process tracking
         self._cancel_event = threading.Event()
         self._processes = []
@@ -37,14 +378,38 @@ class ReviewCsvService:
         # Executor tracking
         self._executor = None
         self._futures = []
+        self._pipes = []
 
         if not self.folder_path.exists() or not self.folder_path.is_dir():
             raise ValueError(f"{folder_path} is not a valid directory")
 
-        self.review_files = list(self.folder_path.glob("*.review"))
+        self.review_files = sorted(self.folder_path.glob("*.review"))
         if not self.review_files:
             logger.warning("No .review files found in the folder")
 
+        self.files_pruned = 0
+        if time_pruning is None:
+            time_pruning = config.get_review_time_pruning()
+        if time_pruning and self.review_files:
+            self._prune_review_files()
+
+    def _prune_review_files(self):
+        """Drop review files that cannot overlap [start_time, end_time] (see ReviewTimeIndex)."""
+        try:
+            start = datetime.strptime(self.start_time, REVIEW_SERVICE_TIME_FORMAT)
+            end = datetime.strptime(self.end_time, REVIEW_SERVICE_TIME_FORMAT)
+        except (TypeError, ValueError):
+            logger.warning("Cannot parse review time range %s - %s, processing all files",
+                           self.start_time, self.end_time)
+            return
+
+        kept = ReviewTimeIndex(self.folder_path).overlapping(self.review_files, start, end)
+        self.files_pruned = len(self.review_files) - len(kept)
+        if self.files_pruned:
+            logger.info("Skipping %d of %d review files outside %s - %s",
+                        self.files_pruned, len(self.review_files), self.start_time, self.end_time)
+        self.review_files = kept
+
     def set_peek_file(self, peek_file_path: str):
         """Read peek file and extract arguments."""
         with open(peek_file_path, "r") as f:
@@ -68,6 +433,10 @@ class ReviewCsvService:
             f'cmd.exe /C dreview.exe "{review_file}" -match=({peek_arg}) '
             f'-TBEGIN={self.start_time} -TEND={self.end_time} {duration_text} > "{csv_file}"'
         )
+        if len(cmd) > CMD_LINE_LIMIT:
+            raise RuntimeError(
+                f"dreview command line for {review_file} is {len(cmd)} characters, over the "
+                f"cmd.exe limit of {CMD_LINE_LIMIT}; match fewer tags per run or use pipe mode")
 
         proc = None
         try:
@@ -109,6 +478,131 @@ class ReviewCsvService:
             if proc and proc in self._processes:
                 self._processes.remove(proc)
 
+    def _dreview_args(self, review_file: Path) -> List[str]:
+        """dreview argument list for pipe mode (same arguments as the cmd.exe command line)."""
+        args = self.dreview_command + [
+            str(review_file),
+            f"-match=({','.join(self.peek_list)})",
+            f"-TBEGIN={self.start_time}",
+            f"-TEND={self.end_time}",
+        ]
+        if not self.dump_all:
+            args.append(f"-DT={self.freq or ''}")
+        return args
+
+    def _pipe_review_file(self, pipe: DreviewPipe):
+        """Run dreview for one file and feed its stdout into pipe (worker thread)."""
+        review_file = pipe.review_file
+        proc = None
+        stderr_lines = []
+        try:
+            if self._cancel_event.is_set():
+                logger.info("Skipping %s (cancel requested)", review_file)
+                return
+
+            proc = subprocess.Popen(
+                self._dreview_args(review_file), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, bufsize=1 << 16)
+            self._processes.append(proc)
+
+            # stderr is drained on its own thread so a chatty dreview cannot block stdout
+            stderr_thread = threading.Thread(
+                target=lambda: stderr_lines.extend(proc.stderr), daemon=True)
+            stderr_thread.start()
+
+            while True:
+                lines = proc.stdout.readlines(1 << 16)
+                if not lines:
+                    break
+                pipe.feed(lines)
+
+            returncode = proc.wait()
+            stderr_thread.join()
+            stderr = "".join(stderr_lines)
+
+            if self._cancel_event.is_set():
+                logger.info("Cancellation requested, stopped %s", review_file)
+                return
+            if returncode != 0:
+                raise RuntimeError(
+                    f"dreview failed for {review_file}:\n{stderr}")
+            if stderr.strip():
+                logger.warning("dreview warnings for %s: %s",
+                               review_file, stderr.strip())
+
+            logger.info("Successfully processed %s (%d lines)", review_file, pipe.rows)
+
+        except Exception as ex:
+            logger.error("Error processing file %s: %s", review_file, ex)
+            raise
+        finally:
+            pipe.close()
+            if proc:
+                if proc in self._processes:
+                    self._processes.remove(proc)
+                proc.stdout.close()
+
+    def fetch_and_merge_piped(self) -> Optional[int]:
+        """
+        Pipe mode workflow: run dreview on every review file and k-way merge the
+        outputs into the merged file as they are produced.
+
+        Rows are parsed from each process's stdout by a worker thread and consumed by
+        the merger on this thread; nothing is written per review file. A dreview that
+        fails is logged and listed in failed_files; rows it emitted before failing stay
+        merged (they are written as they arrive).
+
+        :return: Rows written to the merged file (None if there was no data)
+        :raises RuntimeError: if dreview failed for every review file
+        """
+        if not self.review_files:
+            logger.warning("No review files to process")
+            return None
+
+        self._cancel_event.clear()
+        self.failed_files = []
+        # Merge inputs stay in name order (ties on TIME keep that order); launches go largest first
+        self._pipes = [DreviewPipe(review_file) for review_file in self.review_files]
+        merged_path = self.folder_path / self.merged_file
+
+        try:
+            self._futures = self._submit_largest_first(
+                self._pipe_review_file, self._pipes, lambda pipe: pipe.review_file)
+            rows = self.merge_review_streams(
+                [(pipe.review_file.name, pipe) for pipe in self._pipes], merged_path)
+
+            for pipe, future in zip(self._pipes, self._futures):
+                if future.cancelled():
+                    continue
+                try:
+                    future.result()  # propagate exceptions to the log
+                except Exception as ex:
+                    logger.error("Error processing review file: %s", ex)
+                    self.failed_files.append(pipe.review_file)
+
+            if self._cancel_event.is_set():
+                logger.info("Processing cancelled, removing partial merged file")
+                if merged_path.exists():
+                    merged_path.unlink()
+                return None
+            if len(self.failed_files) == len(self.review_files):
+                if merged_path.exists():
+                    merged_path.unlink()
+                raise RuntimeError(f"dreview failed for all {len(self.review_files)} review files")
+            if self.failed_files:
+                logger.warning("dreview failed for %d of %d review files; rows emitted before "
+                               "the failure are merged: %s", len(self.failed_files),
+                               len(self.review_files), ", ".join(f.name for f in self.failed_files))
+            if rows is None:
+                logger.error("No data returned by dreview for any review file")
+            return rows
+
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._futures.clear()
+            for pipe in self._pipes:
+                pipe.discard()
+
     @staticmethod
     def _is_file_locked(filepath: Path):
         """Check if a file is locked by trying to open it in exclusive mode."""
@@ -118,20 +612,61 @@ class ReviewCsvService:
         except IOError:
             return True
 
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _submit_largest_first(self, target: Callable, items: list, review_file_of: Callable[[Any], Path]):
+        """
+        Submit target(item) for every item to a pool of max_processes workers,
+        largest review file first (longest dreview runs start early, which keeps
+        the makespan close to the longest single file). Returns futures in item order.
+        """
+        self._files_done = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.max_processes)
+        order = sorted(range(len(items)),
+                       key=lambda i: self._file_size(review_file_of(items[i])), reverse=True)
+        futures = [None] * len(items)
+        for i in order:
+            future = self._executor.submit(target, items[i])
+            future.add_done_callback(
+                lambda done, review_file=review_file_of(items[i]): self._file_finished(done, review_file))
+            futures[i] = future
+        return futures
+
+    def _file_finished(self, future, review_file: Path):
+        if future.cancelled():
+            return
+        with self._progress_lock:
+            self._files_done += 1
+            files_done = self._files_done
+        if self.progress_callback:
+            try:
+                self.progress_callback(files_done, len(self.review_files), review_file)
+            except Exception as ex:
+                logger.warning("Progress callback failed: %s", ex)
+
     def fetch_review_file_data(self):
-        """Process all review files in parallel."""
+        """
+        Process all review files in parallel (at most max_processes dreview processes at once).
+
+        Files whose dreview fails are logged, listed in failed_files and left out of the
+        merge (their partial CSV is removed). Raises RuntimeError if every file failed.
+        """
         if not self.review_files:
             logger.warning("No review files to process")
             return
 
         self._cancel_event.clear()
-        self._executor = ThreadPoolExecutor()
+        self.failed_files = []
 
         try:
-            self._futures = [
-                self._executor.submit(self._write_review_to_csv, f)
-                for f in self.review_files
-            ]
+            self._futures = self._submit_largest_first(
+                self._write_review_to_csv, self.review_files, lambda review_file: review_file)
+            review_file_of = dict(zip(self._futures, self.review_files))
 
             for future in as_completed(self._futures):
                 if self._cancel_event.is_set():
@@ -141,6 +676,10 @@ class ReviewCsvService:
                     future.result()  # propagate exceptions
                 except Exception as ex:
                     logger.error("Error processing review file: %s", ex)
+                    self.failed_files.append(review_file_of[future])
+
+            if not self._cancel_event.is_set() and len(self.failed_files) == len(self.review_files):
+                raise RuntimeError(f"dreview failed for all {len(self.review_files)} review files")
 
         except Exception as ex:
             logger.error("Error during fetch_review_file_data: %s",
@@ -167,6 +706,11 @@ class ReviewCsvService:
                 logger.error("Error terminating process %s: %s", proc.pid, ex)
 
         self._processes.clear()
+
+        # Wake the merger up for files whose dreview never started
+        for pipe in self._pipes:
+            pipe.close()
+
         self._cleanup_partial_files()
 
     @staticmethod
@@ -196,94 +740,166 @@ class ReviewCsvService:
                 logger.warning(
                     "Could not remove partial file %s: %s", csv_file, ex)
 
-    def clean_csv_files(self):
-        """Remove second line from all CSV files in the folder (except merged file)."""
-        for csv_file in self.folder_path.glob("*.csv"):
-            # Skip the merged file during cleaning
-            if csv_file.name == self.merged_file:
-                continue
+    def merge_csv_files(self) -> Optional[int]:
+        """
+        Merge the per-file dreview CSVs into the merged file and delete them.
 
-            try:
-                lines = csv_file.read_text().splitlines()
-                if len(lines) > 1:
-                    lines.pop(1)
-                    csv_file.write_text("\n".join(lines))
-            except Exception as e:
-                logger.warning(
-                    "Could not clean CSV file %s: %s", csv_file.name, e)
+        The files are streamed: each unit line is dropped while reading, rows are
+        k-way merged by TIME (each dreview output is already in time order) and
+        written once, so only one row per input is held in memory.
 
-    def merge_csv_files(self):
-        """Merge all CSVs into a single file and clean up individual files."""
-        csv_files = list(self.folder_path.glob("*.csv"))
+        :return: Rows written to the merged file (None if there was nothing to merge)
+        """
+        csv_files = sorted(f for f in self.folder_path.glob("*.csv")
+                           if f.name != self.merged_file)
         if not csv_files:
             logger.warning("No CSV files to merge")
-            return
+            return None
+
+        merged_path = self.folder_path / self.merged_file
+        with ExitStack() as stack:
+            sources = [(f.name, stack.enter_context(open(f))) for f in csv_files]
+            rows = self.merge_review_streams(sources, merged_path)
+
+        if rows is None:
+            logger.error("No valid CSV files could be read for merging")
+            return None
 
-        df_list = []
-        for f in csv_files:
+        # Clean up individual CSV files after successful merge
+        for csv_file in csv_files:
             try:
-                # Read with error handling for inconsistent field counts
-                df = pd.read_csv(f, on_bad_lines='skip', engine='python')
-                if not df.empty:
-                    df_list.append(df)
-                    logger.info(
-                        f"Successfully read CSV file: {f.name} with {len(df)} rows")
-                else:
-                    logger.warning(f"CSV file {f.name} is empty, skipping")
+                csv_file.unlink()
+                logger.info("Removed individual CSV file: %s",
+                            csv_file.name)
             except Exception as e:
-                logger.error(f"Error reading CSV file {f.name}: {e}")
-                # Try alternative reading methods
-                try:
-                    df = pd.read_csv(f, sep=',', quoting=1,
-                                     on_bad_lines='skip', engine='python')
-                    if not df.empty:
-                        df_list.append(df)
-                        logger.info(
-                            f"Successfully read CSV file with alternative method: {f.name}")
-                except Exception as e2:
-                    logger.error(
-                        f"Failed to read CSV file {f.name} with alternative method: {e2}")
+                logger.warning(
+                    "Could not remove CSV file %s: %s", csv_file.name, e)
+        return rows
+
+    @staticmethod
+    def merge_review_streams(sources: List[Tuple[str, Iterable[str]]], merged_path,
+                             unit_lines: bool = True) -> Optional[int]:
+        """
+        K-way merge dreview CSV streams by TIME into merged_path.
+
+        :param sources: (name, lines) per dreview output; lines is any iterable of text lines
+        :param merged_path: Output CSV path
+        :param unit_lines: Inputs have dreview's unit line after the header (False for
+            CSVs this service wrote, e.g. split_columns outputs)
+        :return: Rows written, or None if every input was empty (nothing is written)
+
+        Columns are the union of the input headers in first-seen order; fields an
+        input does not have are left empty. Rows with more fields than their header
+        are skipped. Rows with equal TIME keep the order of the sources.
+        """
+        inputs = []
+        columns = {}
+        for name, lines in sources:
+            review_input = ReviewCsvInput(name, lines, unit_lines)
+            if review_input.empty:
+                logger.warning(f"CSV file {name} is empty, skipping")
+                continue
+            for column in review_input.header:
+                columns.setdefault(column, len(columns))
+            inputs.append(review_input)
+
+        if not inputs:
+            return None
+
+        time_formats = {review_input.time_format for review_input in inputs}
+        text_keys = len(time_formats) == 1 and None not in time_formats
+        if not text_keys:
+            logger.warning(f"Review TIME formats differ or are unknown ({time_formats}), "
+                           "parsing times to order rows")
+
+        merged = heapq.merge(*(review_input.keyed_lines(order, columns, text_keys)
+                               for order, review_input in enumerate(inputs)))
+        row_count = 0
+        with open(merged_path, "w") as out:
+            out.write(','.join(_csv_field(column) for column in columns) + '\n')
+            for _, _, line in merged:
+                out.write(line)
+                out.write('\n')
+                row_count += 1
+
+        for review_input in inputs:
+            if review_input.skipped_rows:
+                logger.warning(f"Skipped {review_input.skipped_rows} malformed rows in {review_input.name}")
+        logger.info("Merged CSV saved to %s with %d rows from %d inputs",
+                    merged_path, row_count, len(inputs))
+        return row_count
+
+    @staticmethod
+    def split_columns(merged_path, outputs: Dict[str, List[str]]) -> Dict[str, int]:
+        """
+        Split a merged CSV by column in one pass over its lines.
+
+        :param merged_path: Merged CSV (e.g. from merge_review_streams)
+        :param outputs: Output CSV path -> columns written to it after TIME; names are
+            matched ignoring surrounding spaces and missing columns are left out
+        :return: Rows written per output path
+
+        A row goes to an output only if at least one of that output's columns has a
+        value, so each file holds the rows a dreview pass over just its tags would.
+        """
+        with open(merged_path, "r") as merged, ExitStack() as stack:
+            header_line = merged.readline().rstrip('\r\n')
+            header = _split_csv_line(header_line) if header_line else []
+            positions = {name.strip(): pos for pos, name in enumerate(header)}
+            time_pos = positions.get('TIME', 0)
+
+            targets = []
+            rows = dict.fromkeys(outputs, 0)
+            for output_path, columns in outputs.items():
+                value_positions = []
+                for column in dict.fromkeys(columns):
+                    if column in positions:
+                        value_positions.append(positions[column])
+                    else:
+                        logger.warning(f"Column {column} not found in {merged_path}")
+                out = stack.enter_context(open(output_path, "w"))
+                out.write(','.join(_csv_field(header[pos]) for pos in [time_pos] + value_positions) + '\n')
+                targets.append((output_path, out, value_positions))
+
+            for line in merged:
+                line = line.rstrip('\r\n')
+                if not line:
                     continue
+                fields = _split_csv_line(line)
+                for output_path, out, value_positions in targets:
+                    values = [fields[pos] if pos < len(fields) else '' for pos in value_positions]
+                    if any(value.strip() for value in values):
+                        time_value = fields[time_pos] if time_pos < len(fields) else ''
+                        out.write(','.join(_csv_field(value) for value in [time_value] + values) + '\n')
+                        rows[output_path] += 1
 
-        if not df_list:
-            logger.error("No valid CSV files could be read for merging")
-            return
+        return rows
 
-        merged_df = pd.concat(df_list, ignore_index=True)
-        merged_path = self.folder_path / self.merged_file
-        merged_df.to_csv(merged_path, index=False)
-        logger.info("Merged CSV saved to %s with %d rows",
-                    merged_path, len(merged_df))
+    def run(self) -> Dict[str, Any]:
+        """
+        Complete workflow: fetch, then stream-merge (unit lines are dropped while merging).
 
-        # Clean up individual CSV files after successful merge
-        for csv_file in csv_files:
-            if csv_file.name != self.merged_file:  # Don't delete the merged file
-                try:
-                    csv_file.unlink()
-                    logger.info("Removed individual CSV file: %s",
-                                csv_file.name)
-                except Exception as e:
-                    logger.warning(
-                        "Could not remove CSV file %s: %s", csv_file.name, e)
-
-    def run(self):
-        """Complete workflow: fetch, clean, merge."""
+        :return: Throughput of the run (also kept in last_run_stats): files, files_pruned,
+            files_failed (names of review files dreview failed on), rows, input_bytes,
+            elapsed_sec, files_per_sec, rows_per_sec, max_processes, cancelled
+        :raises RuntimeError: if dreview failed for every review file
+        """
+        started = time.perf_counter()
+        rows = None
         try:
-            self.fetch_review_file_data()
-
-            # Check if cancelled before continuing
-            if self._cancel_event.is_set():
-                logger.info("Processing cancelled before cleaning CSV files")
-                return
+            if self.pipe_output:
+                rows = self.fetch_and_merge_piped()
+                return self._record_run_stats(started, rows)
 
-            self.clean_csv_files()
+            self.fetch_review_file_data()
 
             # Check if cancelled before merging
             if self._cancel_event.is_set():
                 logger.info("Processing cancelled before merging CSV files")
-                return
+                return self._record_run_stats(started, rows)
 
-            self.merge_csv_files()
+            rows = self.merge_csv_files()
+            return self._record_run_stats(started, rows)
 
         except Exception as ex:
             logger.error(
@@ -291,3 +907,24 @@ class ReviewCsvService:
             # Clean up partial files on error
             self._cleanup_partial_files()
             raise
+
+    def _record_run_stats(self, started: float, rows: Optional[int]) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - started
+        files = len(self.review_files)
+        rows = rows or 0
+        self.last_run_stats = {
+            'files': files,
+            'files_pruned': self.files_pruned,
+            'files_failed': [f.name for f in self.failed_files],
+            'rows': rows,
+            'input_bytes': sum(self._file_size(f) for f in self.review_files),
+            'elapsed_sec': round(elapsed, 3),
+            'files_per_sec': round(files / elapsed, 2) if elapsed > 0 else 0.0,
+            'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+            'max_processes': self.max_processes,
+            'cancelled': self._cancel_event.is_set(),
+        }
+        logger.info("Review export: %d files, %d rows in %.2fs (%.2f files/s, %.0f rows/s, %d processes)",
+                    files, rows, elapsed, self.last_run_stats['files_per_sec'],
+                    self.last_run_stats['rows_per_sec'], self.max_processes)
+        return self.last_run_stats
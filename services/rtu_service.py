@@ -9,7 +9,7 @@ PERFORMANCE GUARANTEE:
 =====================
 This refactored service maintains ALL performance optimizations from the original:
 - Memory-mapped I/O, vectorized operations, multi-threading, multi-processing
-- Direct RTUGEN streaming, chunked processing, JIT compilation
+- Native binary .dt writing, chunked processing, JIT compilation
 - Same throughput and memory efficiency as the original implementation
 
 USE CASES AND COMBINATIONS:
@@ -28,7 +28,7 @@ USE CASES AND COMBINATIONS:
       service.resize_rtu(input_file, output_file, start_time="25/08/16 20:00:00", end_time="25/08/16 21:00:00", tag_mapping_file="mappings.csv")
    
    - Extract time range from RTU file to new RTU file using vectorized extraction
-   - Uses threaded producer-consumer pattern with direct RTUGEN streaming
+   - Writes the output .dt directly (RtuWriter) - no RTUGEN process or text conversion
    - Optionally apply tag renaming during resize using CSV mapping file (format: old_tag,new_tag)
    - If start_time/end_time not provided, copies entire file
 
@@ -61,6 +61,30 @@ USE CASES AND COMBINATIONS:
    Same combinations as flat format but using:
    service.export_csv_dataframe(input_file, output_file, [same parameters as above])
 
+5. EXPORT TO PARQUET / FEATHER (optional, requires pyarrow):
+   service.export_table(input_file, "out.parquet", layout="flat")
+   service.export_table(input_file, "out.feather", layout="dataframe", [same parameters as above])
+   - Typed columns instead of text: int32 timestamp, float32 values, dictionary-encoded tag names
+   - Format follows the extension (.parquet, .feather/.arrow) or file_format="parquet"|"feather"
+
+6. IN-MEMORY QUERY (no files written):
+   df = service.query(input_file, tags=["TAG1", "TAG2"], start_time="25/08/16 20:00:00", end_time="25/08/16 21:00:00")
+   arrays = service.query(input_file, tags=["TAG1"], as_frame=False)
+   - Same rows as export_csv_flat, returned as a DataFrame or NumPy arrays
+
+SIDECAR INDEX:
+=============
+RTUService(use_index=True) stores a '<file>.dt.idx' sidecar next to each .dt file
+the first time it is scanned (opt-in; the default follows rtudata.sidecar_index in config.json,
+which is off): sorted time index, per-tag point offsets, first/last timestamps and
+the dictionary, keyed by the .dt file's size and mtime. get_file_info() then reads only the sidecar
+header, and time-range / tag-filtered exports read only the matching points. If the sidecar cannot
+be written (e.g. read-only share) the service carries on with the in-memory index.
+
+Without a loaded index, time-range queries binary-search the ring buffer through the mmap and
+decode only the records overlapping [start, end]; files that do not look time-ordered (or are
+truncated) fall back to the full scan.
+
 PARAMETERS:
 ==========
 - input_file: Path to input .dt file (required)
@@ -79,12 +103,15 @@ METHODS:
 - resize_rtu(input_file, output_file, start_time=None, end_time=None, tag_mapping_file=None) -> int
 - export_csv_flat(input_file, output_file, **kwargs) -> int
 - export_csv_dataframe(input_file, output_file, **kwargs) -> int
+- export_table(input_file, output_file, layout="flat"|"dataframe", **kwargs) -> int
+- query(input_file, tags=None, start_time=None, end_time=None, as_frame=True) -> DataFrame | dict
 
 RETURN VALUES:
 ==============
 - get_file_info(): Returns dict with file information
 - resize_rtu(): Returns number of points written
-- export_csv_*(): Returns number of points/rows exported
+- export_csv_*(), export_table(): Returns number of points/rows exported
+- query(): Returns the selected points in memory
 
 ERROR HANDLING:
 ===============
@@ -95,15 +122,18 @@ ERROR HANDLING:
 
 from __future__ import annotations
 import os
+import json
 import struct
 import logging
 from logging_config import get_logger
 import mmap
-import subprocess
 import csv
+import glob
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from services.config_manager import get_config_manager
 
 try:
     import numpy as np
@@ -124,10 +154,25 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # ---------------- constants ----------------
 CUSTOM_EPOCH_UTC = datetime(1967, 12, 31, tzinfo=timezone.utc)
 DEFAULT_ENDIAN = '<'
 
+# Folder exports: estimated peak memory per worker as a multiple of the largest
+# .dt file, and the total size below which files are simply read in-process
+FOLDER_WORKER_MEMORY_FACTOR = 4
+FOLDER_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+# RtuDataset.select: points per merge step when interleaving the per-file runs
+DATASET_MERGE_CHUNK_POINTS = 1 << 20
+
 # Setup logging
 logger = get_logger(__name__)
 
@@ -168,6 +213,274 @@ def from_file_seconds_to_naive_dt(seconds: int) -> datetime:
     dt_local = dt_utc.astimezone(local_tz)
     return dt_local.replace(tzinfo=None)
 
+
+# UTC offset changes (DST) always fall on a quarter-hour boundary, so a single
+# offset lookup per 15-minute bucket is exact for every second in that bucket.
+TZ_BUCKET_SECONDS = 900
+MAX_TZ_BUCKET_SPAN = 1_000_000
+CUSTOM_EPOCH_DT64 = np.datetime64('1967-12-31T00:00:00', 's')
+
+
+def to_local_file_seconds(seconds: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equivalent of from_file_seconds_to_naive_dt.
+
+    Returns local wall-clock seconds since CUSTOM_EPOCH (int64) for an array of
+    file seconds, calling astimezone once per 15-minute bucket instead of once per point.
+    """
+    import tzlocal
+    seconds = np.asarray(seconds, dtype=np.int64)
+    if seconds.size == 0:
+        return seconds.copy()
+
+    local_tz = tzlocal.get_localzone()
+    buckets = seconds // TZ_BUCKET_SECONDS
+    first_bucket = int(buckets.min())
+    span = int(buckets.max()) - first_bucket + 1
+
+    if span <= MAX_TZ_BUCKET_SPAN:
+        # Dense bucket table - no sort required
+        bucket_ids = np.arange(first_bucket, first_bucket + span)
+        bucket_index = buckets - first_bucket
+    else:
+        # Sparse/corrupt time ranges - only resolve the buckets actually present
+        bucket_ids, bucket_index = np.unique(buckets, return_inverse=True)
+
+    offsets = np.fromiter(
+        ((CUSTOM_EPOCH_UTC + timedelta(seconds=int(b) * TZ_BUCKET_SECONDS))
+         .astimezone(local_tz).utcoffset() // timedelta(seconds=1)
+         for b in bucket_ids),
+        dtype=np.int64, count=len(bucket_ids))
+
+    return seconds + offsets[bucket_index]
+
+
+def to_local_datetime64(seconds: np.ndarray) -> np.ndarray:
+    """File seconds as naive local datetime64[s] values."""
+    return CUSTOM_EPOCH_DT64 + to_local_file_seconds(seconds).astype('timedelta64[s]')
+
+
+def format_local_datetimes(seconds: np.ndarray) -> List[str]:
+    """Format file seconds as local '%Y-%m-%d %H:%M:%S' strings in one vectorized pass."""
+    if np.size(seconds) == 0:
+        return []
+
+    # datetime64 -> 'YYYY-MM-DDTHH:MM:SS', then swap the 'T' separator in place
+    text = to_local_datetime64(seconds).astype('U19')
+    chars = text.view('U1').reshape(-1, 19)
+    chars[:, 10] = ' '
+    return text.tolist()
+
+
+def csv_quote_field(value: str) -> str:
+    """Quote a single field exactly as csv.writer (QUOTE_MINIMAL) would."""
+    if any(ch in value for ch in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def build_tag_name_lookup(dict_list: List[str], quote: bool = False) -> np.ndarray:
+    """
+    Build an object array indexed by nameid (1-based dictionary position).
+
+    Index 0 holds the UNKNOWN_0 placeholder; nameids beyond the dictionary are
+    resolved separately by lookup_tag_names.
+    """
+    lookup = np.empty(len(dict_list) + 1, dtype=object)
+    lookup[0] = 'UNKNOWN_0'
+    lookup[1:] = [csv_quote_field(name) if quote else name for name in dict_list]
+    return lookup
+
+
+def lookup_tag_names(nameids: np.ndarray, tag_lookup: np.ndarray) -> np.ndarray:
+    """Map nameids to tag names via NumPy fancy indexing (UNKNOWN_<id> outside the dictionary)."""
+    in_dict = nameids < len(tag_lookup)
+    if in_dict.all():
+        return tag_lookup[nameids]
+
+    names = np.empty(len(nameids), dtype=object)
+    names[in_dict] = tag_lookup[nameids[in_dict]]
+    unknown_ids, inverse = np.unique(nameids[~in_dict], return_inverse=True)
+    unknown_names = np.array(
+        [f"UNKNOWN_{nid}" for nid in unknown_ids], dtype=object)
+    names[~in_dict] = unknown_names[inverse]
+    return names
+
+
+def format_float_values(values: np.ndarray, na_rep: Optional[str] = None) -> List[str]:
+    """
+    Format float32 values as repr() of the float64-widened value - exactly what
+    csv.writer emits for float(np.float32) and pandas.to_csv emits for float64.
+
+    Each distinct value is formatted once (SCADA data repeats values heavily).
+    NaN becomes na_rep when given, otherwise 'nan'.
+    """
+    # Unique on the raw float32 bits keeps -0.0 and NaN payloads distinct
+    value_bits = np.ascontiguousarray(values, dtype=np.float32).ravel().view(np.uint32)
+    unique_bits, value_index = np.unique(value_bits, return_inverse=True)
+    unique_floats = unique_bits.view(np.float32)
+    unique_vals = np.array(
+        [repr(v) for v in unique_floats.astype(np.float64).tolist()], dtype=object)
+    if na_rep is not None:
+        unique_vals[np.isnan(unique_floats)] = na_rep
+    return unique_vals[value_index].tolist()
+
+
+def format_flat_csv_block(times: np.ndarray, nameids: np.ndarray, qualids: np.ndarray,
+                          values: np.ndarray, tag_lookup: np.ndarray) -> str:
+    """
+    Format a block of points as flat CSV text (datetime,timestamp,tag_name,value,quality).
+
+    Output is byte-identical to csv.writer rows of
+    [strftime('%Y-%m-%d %H:%M:%S'), int, tag, float, 'GOOD'/'BAD'].
+    tag_lookup must come from build_tag_name_lookup(..., quote=True).
+    """
+    if len(times) == 0:
+        return ''
+
+    # SCADA data repeats timestamps and values heavily - format each distinct one once
+    unique_times, time_index = np.unique(times, return_inverse=True)
+    datetimes = np.array(format_local_datetimes(unique_times), dtype=object)[time_index].tolist()
+    timestamps = np.array(unique_times.astype(str), dtype=object)[time_index].tolist()
+
+    tags = lookup_tag_names(nameids, tag_lookup).tolist()
+
+    vals = format_float_values(values)
+
+    quality = np.where(qualids == 0, 'GOOD', 'BAD').tolist()
+
+    return '\r\n'.join(map(','.join, zip(datetimes, timestamps, tags, vals, quality))) + '\r\n'
+
+
+def fill_forward_backward(matrix: np.ndarray, block_rows: int = 256) -> None:
+    """
+    In-place forward fill then backward fill along each row of a (tags x timestamps)
+    matrix - equivalent to DataFrame.ffill().bfill() per tag column. Rows are
+    processed in blocks to bound the size of the index temporaries.
+    """
+    n_rows, n_cols = matrix.shape
+    if n_cols == 0:
+        return
+
+    positions = np.arange(n_cols, dtype=np.int32)
+    for start in range(0, n_rows, block_rows):
+        block = matrix[start:start + block_rows]
+        valid = ~np.isnan(block)
+        # Index of the last valid sample at or before each position (forward fill)
+        fill_index = np.where(valid, positions, 0)
+        np.maximum.accumulate(fill_index, axis=1, out=fill_index)
+        # Leading gaps take the first valid sample (backward fill)
+        np.maximum(fill_index, valid.argmax(axis=1)[:, None], out=fill_index)
+        block[...] = np.take_along_axis(block, fill_index, axis=1)
+
+
+def write_dataframe_csv(csv_file: str, timestamps: np.ndarray, tag_names: List[str],
+                        matrix: np.ndarray, chunk_cells: int = 2_000_000) -> None:
+    """
+    Write a (tags x timestamps) matrix as datetime,timestamp,tag1,tag2,... CSV rows,
+    byte-compatible with DataFrame.to_csv(index=False). Rows are emitted in chunks
+    of roughly chunk_cells values.
+    """
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        if len(timestamps) == 0:
+            # Matches an empty DataFrame written by to_csv
+            f.write(os.linesep)
+            return
+
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(['datetime', 'timestamp'] + list(tag_names))
+
+        n_tags = len(tag_names)
+        chunk_rows = max(1, chunk_cells // n_tags)
+        for start in range(0, len(timestamps), chunk_rows):
+            chunk_times = timestamps[start:start + chunk_rows]
+            datetimes = format_local_datetimes(chunk_times)
+            cells = np.array(
+                format_float_values(matrix[:, start:start + chunk_rows].T, na_rep=''),
+                dtype=object).reshape(len(chunk_times), n_tags)
+            f.write(''.join(
+                f"{dt},{ts},{','.join(row)}{os.linesep}"
+                for dt, ts, row in zip(datetimes, chunk_times.tolist(), cells.tolist())
+            ))
+
+
+def folder_worker_count(paths: List[str], max_workers: int = None) -> int:
+    """
+    Number of worker processes for a folder-level export: bounded by CPU cores, the
+    number of files and (with psutil) the memory available for the largest file.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if PSUTIL_AVAILABLE and paths:
+        largest = max(os.path.getsize(path) for path in paths)
+        per_worker = max(1, largest * FOLDER_WORKER_MEMORY_FACTOR)
+        workers = min(workers, int(psutil.virtual_memory().available // per_worker))
+    return max(1, workers)
+
+
+# ---------------- columnar (Parquet / Feather) output ----------------
+
+TABLE_FORMATS = {'.parquet': 'parquet', '.feather': 'feather', '.arrow': 'feather'}
+
+
+def table_format_for(path: str, file_format: str = None) -> str:
+    """Resolve 'parquet' or 'feather' from an explicit format or the output file extension."""
+    fmt = file_format or TABLE_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt not in ('parquet', 'feather'):
+        raise ValueError(
+            "file_format must be 'parquet' or 'feather' (or use a .parquet/.feather/.arrow file)")
+    return fmt
+
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "Parquet/Feather export requires pyarrow. Please install: pip install pyarrow")
+
+
+def flat_arrow_table(times: np.ndarray, nameids: np.ndarray, qualids: np.ndarray,
+                     values: np.ndarray, dict_list: List[str]) -> "pa.Table":
+    """
+    Flat layout as an Arrow table: datetime (local, timestamp[s]), timestamp (int32 file
+    seconds), tag_name and quality (dictionary-encoded strings), value (float32).
+    """
+    _require_pyarrow()
+    used_nameids, id_index = np.unique(nameids, return_inverse=True)
+    id_names = lookup_tag_names(used_nameids, build_tag_name_lookup(dict_list))
+    # Duplicate dictionary names share one dictionary entry
+    tag_names, name_index = np.unique(id_names.astype(str), return_inverse=True)
+    tag_codes = name_index[id_index.reshape(-1)].astype(np.int32)
+
+    return pa.table({
+        'datetime': pa.array(to_local_datetime64(times)),
+        'timestamp': pa.array(np.asarray(times, dtype=np.int32)),
+        'tag_name': pa.DictionaryArray.from_arrays(
+            pa.array(tag_codes), pa.array(tag_names.tolist(), type=pa.string())),
+        'value': pa.array(np.asarray(values, dtype=np.float32)),
+        'quality': pa.DictionaryArray.from_arrays(
+            pa.array((qualids != 0).astype(np.int8)), pa.array(['GOOD', 'BAD'])),
+    })
+
+
+def dataframe_arrow_table(timestamps: np.ndarray, tag_names: List[str], columns: np.ndarray) -> "pa.Table":
+    """
+    Dataframe layout as an Arrow table: datetime, timestamp (int32) and one float32
+    column per tag. `columns` is (tags x timestamps).
+    """
+    _require_pyarrow()
+    arrays = [pa.array(to_local_datetime64(timestamps)),
+              pa.array(np.asarray(timestamps, dtype=np.int32))]
+    arrays += [pa.array(np.asarray(column, dtype=np.float32)) for column in columns]
+    return pa.Table.from_arrays(arrays, names=['datetime', 'timestamp'] + list(tag_names))
+
+
+def write_arrow_table(table: "pa.Table", path: str, file_format: str) -> None:
+    """Write an Arrow table as Parquet or Feather v2 (Arrow IPC)."""
+    _require_pyarrow()
+    if file_format == 'parquet':
+        pa_parquet.write_table(table, path)
+    else:
+        pa_feather.write_feather(table, path)
+
 # ---------------- binary readers ----------------
 
 
@@ -234,32 +547,38 @@ class RtuHeader:
 
     def __init__(self):
         self.BsioHeader = None
+        self.RecType = 1
+        self.Version = 1
         self.DictLoc = 0
+        self.DictMod = 0
+        self.ModCount = 0
         self.DataLocDisk = 0
         self.PointsPerRecord = 0
         self.TotalPoints = 0
         self.Dictionary: List[str] = []
 
-    def Read(self, bsio: BsioHeader, endian: str = DEFAULT_ENDIAN):
-        """Read RTU header and dictionary."""
+    def Read(self, bsio: BsioHeader, endian: str = DEFAULT_ENDIAN, read_dictionary: bool = True):
+        """Read RTU header and dictionary (the dictionary can be skipped when it comes from an RtuIndex)."""
         self.BsioHeader = bsio
         f = bsio.File
         def it(fmt): return struct.unpack(
             endian + fmt, f.read(struct.calcsize(fmt)))[0]
         bsio.Seek(0)
-        _rectype = it('i')
-        _ver = it('i')
+        self.RecType = it('i')
+        self.Version = it('i')
         self.DictLoc = struct.unpack(endian + 'q', f.read(8))[0]
-        _dictmod = it('i')
+        self.DictMod = it('i')
         self.NameCount = it('i')
         self.AfterLastName = struct.unpack(endian + 'q', f.read(8))[0]
         self.DataLocDisk = struct.unpack(endian + 'q', f.read(8))[0]
         self.PointsPerRecord = it('i')
         self.TotalPoints = it('i')
-        _modcount = it('i')
+        self.ModCount = it('i')
 
         # Read dictionary (likely small; keep simple/compatible)
         self.Dictionary = []
+        if not read_dictionary:
+            return
         pos = int(self.DictLoc)
         for _ in range(max(0, int(self.NameCount))):
             bsio.Seek(pos)
@@ -306,6 +625,306 @@ class StringPool:
         return self.pool['GOOD'] if qualid == 0 else self.pool['MANUAL']
 
 
+class RtuWriter:
+    """
+    Native RTU .dt writer: BSIO header, RTU header, dictionary and fixed-stride point records.
+
+    Produces the layout RtuResizer reads: virtual position `pos` lives at file offset
+    (pos // RecordCapacity + 1) * RecLen + pos % RecordCapacity + 4, the dictionary
+    follows the RTU header and data records start on a record boundary. Header fields
+    not implied by the data (record geometry, revision, product key, author) are taken
+    from a template file when one is given.
+    """
+
+    DEFAULT_RECORD_CAPACITY = 4096
+    RTU_HEADER_FORMAT = 'iiqiiqqiii'
+    DICT_LOC = 64
+
+    def __init__(self, path: str, endian: str = DEFAULT_ENDIAN,
+                 template_bsio: BsioHeader = None, template_rtu: RtuHeader = None):
+        self.path = path
+        self.endian = endian
+        self.template_bsio = template_bsio
+        self.template_rtu = template_rtu
+
+        self.record_capacity = int(template_bsio.RecordCapacity) if template_bsio else self.DEFAULT_RECORD_CAPACITY
+        self.rec_len = int(template_bsio.RecLen) if template_bsio else self.record_capacity + 4
+        if self.rec_len < self.record_capacity + 4:
+            raise ValueError(
+                f"RecLen {self.rec_len} too small for RecordCapacity {self.record_capacity}")
+        self.np_point_dtype = np.dtype(
+            [('id', endian + 'i4'), ('time', endian + 'i4'), ('value', endian + 'f4')])
+        self.point_size = self.np_point_dtype.itemsize
+
+        max_ppr = self.record_capacity // self.point_size
+        template_ppr = int(template_rtu.PointsPerRecord) if template_rtu else 0
+        self.points_per_record = template_ppr if 0 < template_ppr <= max_ppr else max_ppr
+
+    def _addr(self, pos: int) -> int:
+        return (pos // self.record_capacity + 1) * self.rec_len + pos % self.record_capacity + 4
+
+    def _put(self, mm: mmap.mmap, pos: int, data: bytes):
+        """Write bytes at a virtual position, splitting them across record boundaries."""
+        while data:
+            room = self.record_capacity - pos % self.record_capacity
+            off = self._addr(pos)
+            mm[off:off + min(room, len(data))] = data[:room]
+            pos += room
+            data = data[room:]
+
+    def _encode_dictionary(self, dictionary: List[str]) -> bytes:
+        """Dictionary entries: int32 length, then the name NUL-padded to a 4-byte boundary."""
+        parts = []
+        for name in dictionary:
+            raw = name.encode('utf8')
+            raw += b'\x00' * (-len(raw) % 4)
+            parts.append(struct.pack(self.endian + 'i', len(raw)) + raw)
+        return b''.join(parts)
+
+    def write(self, dictionary: List[str], ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> int:
+        """Write all points (in the given order) and the dictionary. Returns the number of points."""
+        points = np.empty(len(ids), dtype=self.np_point_dtype)
+        points['id'] = ids
+        points['time'] = times
+        points['value'] = values
+        return self.write_points(dictionary, points)
+
+    def write_points(self, dictionary: List[str], points: np.ndarray) -> int:
+        """
+        Write already-encoded point records (np_point_dtype, in file byte order) and the
+        dictionary. Records are block-copied; nothing is decoded or byte-swapped.
+        """
+        count = len(points)
+        rc = self.record_capacity
+        ppr = self.points_per_record
+
+        dict_bytes = self._encode_dictionary(dictionary)
+        after_last_name = self.DICT_LOC + len(dict_bytes)
+        # Data records must start on a record boundary so each record is one contiguous block
+        data_loc = -(-after_last_name // rc) * rc
+        num_records = max(1, -(-count // ppr))
+        virtual_end = data_loc + num_records * rc
+        file_size = (virtual_end // rc + 1) * self.rec_len
+
+        tb, tr = self.template_bsio, self.template_rtu
+        bsio_header = struct.pack(
+            self.endian + '6i12si', rc,
+            int(tb.RevisionLevel) if tb else 1, int(tb.ProductKey) if tb else 0,
+            self.rec_len, int(tb.CheckSumKey) if tb else 0, int(tb.SerialNumber) if tb else 0,
+            (tb.AuthorNames if tb else '').encode('utf8')[:12], virtual_end)
+        rtu_header = struct.pack(
+            self.endian + self.RTU_HEADER_FORMAT,
+            int(getattr(tr, 'RecType', 1)), int(getattr(tr, 'Version', 1)), self.DICT_LOC,
+            int(getattr(tr, 'DictMod', 0)), len(dictionary), after_last_name, data_loc,
+            ppr, count, int(getattr(tr, 'ModCount', 0)))
+
+        with open(self.path, 'wb+') as f:
+            f.truncate(file_size)
+            mm = mmap.mmap(f.fileno(), file_size)
+            try:
+                mm[0:len(bsio_header)] = bsio_header
+                self._put(mm, 0, rtu_header)
+                self._put(mm, self.DICT_LOC, dict_bytes)
+
+                # Full records as one strided view, then the trailing partial record
+                first = self._addr(data_loc)
+                full = count // ppr
+                for rows, cols, start in ((full, ppr, 0), (1 if count % ppr else 0, count % ppr, full * ppr)):
+                    if rows == 0:
+                        continue
+                    view = np.ndarray((rows, cols), dtype=self.np_point_dtype, buffer=mm,
+                                      offset=first + (start // ppr) * self.rec_len,
+                                      strides=(self.rec_len, self.point_size))
+                    view[...] = points[start:start + rows * cols].reshape(rows, cols)
+                    del view
+                mm.flush()
+            finally:
+                mm.close()
+
+        logger.debug(f"Wrote {count} points ({num_records} records) to '{self.path}'")
+        return count
+
+
+class RtuIndex:
+    """
+    Persistent sidecar index for an RTU .dt file, stored next to it as '<file>.dt.idx'.
+
+    Holds the chronological point index, per-tag point offsets, first/last timestamps,
+    the RTU header fields and the dictionary. The sidecar is keyed by the .dt file's
+    size and mtime, so a stale sidecar is ignored and rebuilt. Arrays are memory-mapped
+    on load: header-only lookups are O(1) and range/tag queries only touch the index
+    pages they need.
+
+    Layout: MAGIC | uint64 header length | JSON header | padding | raw arrays.
+    """
+
+    MAGIC = b'RTUIDX01'
+    VERSION = 1
+    SUFFIX = '.idx'
+    ALIGNMENT = 64
+    ARRAY_NAMES = ('valid_phys', 'valid_timestamps', 'tag_phys', 'tag_offsets')
+
+    def __init__(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray], f=None, mm=None):
+        self.meta = meta
+        self.f = f
+        self.mm = mm
+        # Physical point indices sorted by time, and their timestamps
+        self.valid_phys: np.ndarray = arrays['valid_phys']
+        self.valid_timestamps: np.ndarray = arrays['valid_timestamps']
+        # Physical point indices sorted by (nameid, time); tag_offsets[nameid] is the
+        # start of that nameid's slice in tag_phys
+        self.tag_phys: np.ndarray = arrays['tag_phys']
+        self.tag_offsets: np.ndarray = arrays['tag_offsets']
+
+    @property
+    def dictionary(self) -> List[str]:
+        return self.meta['dictionary']
+
+    @classmethod
+    def sidecar_path(cls, path: str) -> str:
+        return f"{path}{cls.SUFFIX}"
+
+    @staticmethod
+    def _file_key(path: str) -> Dict[str, int]:
+        st = os.stat(path)
+        return {'file_size': st.st_size, 'file_mtime_ns': st.st_mtime_ns}
+
+    @classmethod
+    def load_meta(cls, path: str, endian: str = DEFAULT_ENDIAN) -> Optional[Dict[str, Any]]:
+        """Read only the sidecar header. Returns None if missing, stale or unreadable."""
+        sidecar = cls.sidecar_path(path)
+        if not os.path.isfile(sidecar):
+            return None
+        try:
+            with open(sidecar, 'rb') as f:
+                if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                    return None
+                header_len = struct.unpack('<Q', f.read(8))[0]
+                meta = json.loads(f.read(header_len).decode('utf-8'))
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable RTU index '{sidecar}': {e}")
+            return None
+
+        if meta.get('version') != cls.VERSION or meta.get('endian') != endian:
+            return None
+        if {k: meta.get(k) for k in ('file_size', 'file_mtime_ns')} != cls._file_key(path):
+            logger.debug(f"RTU index '{sidecar}' is stale, ignoring")
+            return None
+        return meta
+
+    @classmethod
+    def load(cls, path: str, endian: str = DEFAULT_ENDIAN) -> Optional['RtuIndex']:
+        """Memory-map a valid sidecar index for path, or return None."""
+        meta = cls.load_meta(path, endian)
+        if meta is None:
+            return None
+
+        f = open(cls.sidecar_path(path), 'rb')
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            arrays = {
+                name: np.frombuffer(mm, dtype=np.dtype(spec['dtype']),
+                                    count=spec['length'], offset=spec['offset'])
+                for name, spec in meta['arrays'].items()
+            }
+        except Exception as e:
+            f.close()
+            logger.debug(f"Ignoring corrupt RTU index for '{path}': {e}")
+            return None
+
+        logger.debug(f"Loaded RTU index for '{path}' ({meta['valid_points']} points)")
+        return cls(meta, arrays, f=f, mm=mm)
+
+    @classmethod
+    def build(cls, resizer: 'RtuResizer') -> 'RtuIndex':
+        """Build an index from a fully loaded RtuResizer."""
+        resizer.build_chrono_index()
+        valid_phys = resizer.valid_phys.astype(np.uint32)
+        valid_timestamps = resizer.valid_timestamps.astype(np.int32)
+
+        nameids = resizer._ids[valid_phys] & 0xFFFFFF
+        tag_order = np.lexsort((valid_timestamps, nameids))
+        tag_phys = valid_phys[tag_order]
+        max_nameid = int(nameids.max()) if len(nameids) else 0
+        tag_offsets = np.searchsorted(
+            nameids[tag_order], np.arange(max_nameid + 2)).astype(np.int64)
+
+        meta = {
+            'version': cls.VERSION,
+            'endian': resizer.endian,
+            **cls._file_key(resizer.path),
+            'first_timestamp': int(valid_timestamps[0]) if len(valid_timestamps) else None,
+            'last_timestamp': int(valid_timestamps[-1]) if len(valid_timestamps) else None,
+            'valid_points': int(len(valid_phys)),
+            'total_points': resizer.total_points,
+            'points_per_record': resizer.points_per_record,
+            'data_loc_disk': int(resizer.rtu.DataLocDisk),
+            'dictionary': list(resizer.rtu.Dictionary),
+        }
+        arrays = {'valid_phys': valid_phys, 'valid_timestamps': valid_timestamps,
+                  'tag_phys': tag_phys, 'tag_offsets': tag_offsets}
+        return cls(meta, arrays)
+
+    def save(self, path: str) -> bool:
+        """Atomically write the sidecar for path. Failures (e.g. read-only shares) are logged, not raised."""
+        sidecar = self.sidecar_path(path)
+        tmp = f"{sidecar}.{os.getpid()}.tmp"
+        try:
+            arrays = {name: np.ascontiguousarray(getattr(self, name)) for name in self.ARRAY_NAMES}
+
+            # Header size depends on the offsets it contains; size it with placeholders first
+            specs = {name: {'dtype': arr.dtype.str, 'length': int(arr.size), 'offset': 0}
+                     for name, arr in arrays.items()}
+            meta = dict(self.meta, arrays=specs)
+            probe_len = len(json.dumps(meta).encode('utf-8')) + 32 * len(specs)
+            offset = -(-(len(self.MAGIC) + 8 + probe_len) // self.ALIGNMENT) * self.ALIGNMENT
+            for name, arr in arrays.items():
+                specs[name]['offset'] = offset
+                offset += -(-arr.nbytes // self.ALIGNMENT) * self.ALIGNMENT
+            header = json.dumps(meta).encode('utf-8')
+            if len(header) > probe_len:
+                raise RuntimeError("index header larger than reserved space")
+
+            with open(tmp, 'wb') as f:
+                f.write(self.MAGIC)
+                f.write(struct.pack('<Q', len(header)))
+                f.write(header)
+                for name, arr in arrays.items():
+                    f.write(b'\x00' * (specs[name]['offset'] - f.tell()))
+                    f.write(arr.tobytes())
+            os.replace(tmp, sidecar)
+            self.meta = meta
+            logger.info(f"Saved RTU index: {sidecar}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save RTU index '{sidecar}': {e}")
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except OSError:
+                pass
+            return False
+
+    def tag_slices(self, keep_nameids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Start/end offsets into tag_phys for every nameid flagged in keep_nameids."""
+        keep = np.flatnonzero(keep_nameids[:len(self.tag_offsets) - 1])
+        return self.tag_offsets[keep], self.tag_offsets[keep + 1]
+
+    def close(self):
+        """Release memory-mapped arrays and the sidecar file handle."""
+        self.valid_phys = self.valid_timestamps = self.tag_phys = self.tag_offsets = None
+        try:
+            if self.mm is not None:
+                self.mm.close()
+        except (BufferError, ValueError) as e:
+            logger.debug(f"Index memory map close warning: {e}")
+        try:
+            if self.f is not None:
+                self.f.close()
+        except Exception as e:
+            logger.debug(f"Index file close warning: {e}")
+
+
 # ---------------- high-performance RTU resizer ----------------
 
 class RtuResizer:
@@ -314,22 +933,34 @@ class RtuResizer:
     - Memory-mapped I/O (mmap) for zero-copy file reading
     - NumPy vectorized filtering and data processing
     - Multi-threaded producer-consumer pattern
-    - Direct pipe streaming to RTUGEN
+    - Native binary .dt output (RtuWriter)
     - Parallel CSV processing
     - JIT compilation with Numba
     """
 
-    def __init__(self, path: str, endian: str = DEFAULT_ENDIAN):
+    # Longest run of same-second points tolerated at the ring's wrap point when
+    # binary-searching for the oldest record (more than this falls back to a full scan)
+    MAX_TAIL_RUN = 65536
+
+    def __init__(self, path: str, endian: str = DEFAULT_ENDIAN, use_index: bool = False):
         self.path = path
         self.f = open(path, 'rb')
         # Memory-map entire file (read-only)
         self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
 
         self.endian = endian
+        # Sidecar index (<file>.dt.idx) - loaded if valid, built on first range/tag query
+        self.use_index = use_index
+        self.index: Optional[RtuIndex] = RtuIndex.load(
+            path, endian) if use_index else None
+
         self.bs = BsioHeader()
         self.bs.Read(self.f, endian=self.endian)
         self.rtu = RtuHeader()
-        self.rtu.Read(self.bs, endian=self.endian)
+        self.rtu.Read(self.bs, endian=self.endian,
+                      read_dictionary=self.index is None)
+        if self.index is not None:
+            self.rtu.Dictionary = list(self.index.dictionary)
 
         self.total_points = int(self.rtu.TotalPoints)
         self.points_per_record = int(self.rtu.PointsPerRecord)
@@ -378,7 +1009,8 @@ class RtuResizer:
         for i in range(len(dict_list), min(10000, max_nameid)):
             self._tag_lookup[i] = f"UNKNOWN_{i+1}"
 
-    def _load_peek_tags(self, peek_file: str) -> set:
+    @staticmethod
+    def _load_peek_tags(peek_file: str) -> set:
         """Load tag names from PEEK file (one tag per line) and return as set."""
         if peek_file is None or not os.path.isfile(peek_file):
             logger.debug(
@@ -412,6 +1044,43 @@ class RtuResizer:
         # Convert tag to lowercase for case-insensitive matching
         return tag.lower() in peek_tags
 
+    def _peek_nameid_mask(self, peek_tags: set, size: int = None) -> Optional[np.ndarray]:
+        """
+        Resolve the PEEK tag set to a boolean lookup table indexed by nameid (covering the
+        dictionary, or `size` nameids when given). Each tag name is lower-cased and checked
+        exactly once. Returns None when no filter applies.
+        """
+        if peek_tags is None:
+            return None
+
+        tag_lookup = build_tag_name_lookup(self.rtu.Dictionary)
+        if size is not None and size > len(tag_lookup):
+            tag_lookup = lookup_tag_names(np.arange(size), tag_lookup)
+        return np.fromiter(
+            (self._filter_tag_by_peek(tag, peek_tags) for tag in tag_lookup),
+            dtype=bool, count=len(tag_lookup))
+
+    def _peek_point_mask(self, nameids: np.ndarray, peek_tags: set) -> Optional[np.ndarray]:
+        """
+        Vectorized PEEK filter: boolean mask over points computed with a single
+        lookup-table pass over nameids. Returns None when no filter applies.
+        """
+        keep_lookup = self._peek_nameid_mask(peek_tags)
+        if keep_lookup is None:
+            return None
+
+        in_dict = nameids < len(keep_lookup)
+        if in_dict.all():
+            return keep_lookup[nameids]
+
+        mask = np.zeros(len(nameids), dtype=bool)
+        mask[in_dict] = keep_lookup[nameids[in_dict]]
+        unknown_ids, inverse = np.unique(nameids[~in_dict], return_inverse=True)
+        unknown_keep = np.array(
+            [self._filter_tag_by_peek(f"UNKNOWN_{nid}", peek_tags) for nid in unknown_ids], dtype=bool)
+        mask[~in_dict] = unknown_keep[inverse]
+        return mask
+
     def _load_all_points(self):
         """Vectorized load of all points across records into contiguous arrays."""
         if self._ids is not None:
@@ -424,6 +1093,14 @@ class RtuResizer:
         logger.debug(
             f"Loading {total} points, {ppr} per record, record capacity {rc}")
 
+        # Fast path: the whole data region as strided record views (one copy per field)
+        if self._ppr_effective() == ppr:
+            decoded = self._decode_points(0, total)
+            if decoded is not None:
+                self._ids, self._times, self._values = decoded
+                return
+            logger.debug("Data region extends past end of file, using per-record loader")
+
         # Pre-allocate arrays
         ids = np.zeros(total, dtype=np.int32)
         times = np.zeros(total, dtype=np.int32)
@@ -511,8 +1188,345 @@ class RtuResizer:
         self._times = times
         self._values = values
 
+    def _ppr_effective(self) -> int:
+        """Points actually stored per record (PointsPerRecord capped by RecordCapacity)."""
+        return min(self.points_per_record, self.record_capacity // self.point_size)
+
+    def _point_time(self, phys: int) -> int:
+        """Timestamp of a single physical point, read straight from the mmap."""
+        ppr = self._ppr_effective()
+        off = (self.bs.addr(int(self.rtu.DataLocDisk)) + (phys // ppr) * self.rec_len
+               + (phys % ppr) * self.point_size + 4)
+        return struct.unpack_from(self.endian + 'i', self.mm, off)[0]
+
+    def _find_ring_start(self) -> Optional[int]:
+        """
+        Physical index of the oldest point in the ring buffer.
+
+        Points are written cyclically in time order, so physical order is a rotation of a
+        sorted sequence (unused zero slots sort first). When the ring has wrapped, every
+        point of the older segment is earlier than the first physical point, which gives
+        a monotone predicate to binary search on. Returns None if the layout does not
+        look like a sorted ring (the caller then falls back to a full scan).
+        """
+        n = self.total_points
+        if n == 0 or self._ppr_effective() <= 0:
+            return None
+        # Lazy reads require every point slot to be inside the file
+        if int(self._point_offsets(np.int64(n - 1))) + self.point_size > len(self.mm):
+            return None
+
+        T = self._point_time
+        t_first = T(0)
+        # The wrap may split a second: skip the short run of points at the physical
+        # end that share the first point's timestamp
+        tail = n - 1
+        while tail > 0 and T(tail) == t_first:
+            tail -= 1
+            if n - 1 - tail > self.MAX_TAIL_RUN:
+                return None
+
+        if tail == 0 or t_first < T(tail):
+            start = 0
+        else:
+            lo, hi = 1, tail
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if T(mid) < t_first:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            start = lo
+
+        # Cheap sanity probe: evenly spaced points in chronological order must not decrease
+        probe = [T((start + k) % n) for k in np.linspace(0, n - 1, 65).astype(np.int64).tolist()]
+        if any(a > b for a, b in zip(probe, probe[1:])):
+            logger.debug("Ring buffer is not time-ordered, lazy range loading disabled")
+            return None
+        return start
+
+    def _locate_range_lazy(self, start_sec: int, end_sec: int) -> Optional[List[tuple[int, int]]]:
+        """
+        Binary-search the ring buffer for points in [start_sec, end_sec] without loading the file.
+
+        Returns physical [p0, p1) point ranges in physical order (at most two, when the
+        window spans the ring's wrap point), an empty list if nothing matches, or None
+        if the file cannot be searched lazily.
+        """
+        ring_start = self._find_ring_start()
+        if ring_start is None:
+            return None
+
+        n = self.total_points
+
+        def chrono_bisect(target: int, right: bool) -> int:
+            lo, hi = 0, n
+            while lo < hi:
+                mid = (lo + hi) // 2
+                t = self._point_time((ring_start + mid) % n)
+                if t < target or (right and t == target):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        a = chrono_bisect(start_sec, right=False)
+        b = chrono_bisect(end_sec, right=True)
+        # The neighbours of the located window must lie outside it
+        if (a > 0 and self._point_time((ring_start + a - 1) % n) >= start_sec) or \
+                (b < n and self._point_time((ring_start + b) % n) <= end_sec):
+            return None
+        if a >= b:
+            return []
+
+        p0, p1 = ring_start + a, ring_start + b
+        if p0 >= n:
+            return [(p0 - n, p1 - n)]
+        if p1 <= n:
+            return [(p0, p1)]
+        return [(0, p1 - n), (p0, n)]
+
+    def _record_view(self, phys: int, num_records: int, points: int) -> np.ndarray:
+        """
+        Structured (num_records, points) view over the mmap starting at physical point `phys`.
+
+        Records sit RecLen apart on disk, so a run of records is a single strided array;
+        no bytes are copied until its fields are assigned somewhere.
+        """
+        return np.ndarray((num_records, points), dtype=self.np_point_dtype, buffer=self.mm,
+                          offset=int(self._point_offsets(np.int64(phys))),
+                          strides=(self.rec_len, self.point_size))
+
+    def _record_pieces(self, p0: int, p1: int):
+        """
+        Split physical points [p0, p1) into a leading partial record, whole records and a
+        trailing partial record. Yields (output slice, (rows, cols) record view) pairs.
+        """
+        ppr = self._ppr_effective()
+        pos = p0
+        while pos < p1:
+            slot = pos % ppr
+            if slot == 0 and p1 - pos >= ppr:
+                rows, cols = (p1 - pos) // ppr, ppr
+            else:
+                rows, cols = 1, min(p1 - pos, ppr - slot)
+            yield slice(pos - p0, pos - p0 + rows * cols), self._record_view(pos, rows, cols)
+            pos += rows * cols
+
+    def _range_in_file(self, p0: int, p1: int) -> bool:
+        """True if every point slot of [p0, p1) lies inside the file."""
+        return self._ppr_effective() > 0 and \
+            int(self._point_offsets(np.int64(p1 - 1))) + self.point_size <= len(self.mm)
+
+    def _decode_points(self, p0: int, p1: int) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Decode physical points [p0, p1) through strided record views, one assignment per
+        field and record run. Returns None if the range extends past the end of the file
+        (truncated file).
+        """
+        if p1 <= p0:
+            return (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32),
+                    np.empty(0, dtype=np.float32))
+        if not self._range_in_file(p0, p1):
+            return None
+
+        ids = np.empty(p1 - p0, dtype=np.int32)
+        times = np.empty(p1 - p0, dtype=np.int32)
+        values = np.empty(p1 - p0, dtype=np.float32)
+        for out, view in self._record_pieces(p0, p1):
+            rows, cols = view.shape
+            ids[out].reshape(rows, cols)[...] = view['id']
+            times[out].reshape(rows, cols)[...] = view['time']
+            values[out].reshape(rows, cols)[...] = view['value']
+        del view
+        return ids, times, values
+
+    def _copy_point_records(self, p0: int, p1: int) -> Optional[np.ndarray]:
+        """Raw point records [p0, p1) in file byte order (block copies, no decoding)."""
+        if p1 > p0 and not self._range_in_file(p0, p1):
+            return None
+        points = np.empty(max(0, p1 - p0), dtype=self.np_point_dtype)
+        for out, view in self._record_pieces(p0, p1):
+            points[out].reshape(view.shape)[...] = view
+            del view
+        return points
+
+    def _select_range_lazy(self, start_sec: int, end_sec: int) -> Optional[tuple]:
+        """
+        Range-only load: decode just the records overlapping [start_sec, end_sec].
+
+        Returns (ids, times, values) in physical order, an empty tuple when nothing
+        matches, or None when the file must be scanned in full instead.
+        """
+        ranges = self._locate_range_lazy(start_sec, end_sec)
+        if ranges is None:
+            return None
+        if not ranges:
+            return ()
+
+        parts = [self._decode_points(p0, p1) for p0, p1 in ranges]
+        ids, times, values = (np.concatenate(col) for col in zip(*parts))
+        chrono_times = np.concatenate([parts[-1][1], parts[0][1]]) if len(parts) == 2 else times
+        if np.any(chrono_times[1:] < chrono_times[:-1]):
+            logger.debug("Located window is not time-ordered, falling back to a full scan")
+            return None
+        logger.debug(
+            f"Lazy range load: {len(ids)} of {self.total_points} points decoded")
+
+        time_mask = (times >= start_sec) & (times <= end_sec)
+        if not np.any(time_mask):
+            return ()
+        return ids[time_mask], times[time_mask], values[time_mask]
+
+    def _ensure_index(self) -> Optional[RtuIndex]:
+        """Build and persist the sidecar index if enabled and not already loaded."""
+        if self.index is None and self.use_index:
+            logger.info(f"Building RTU index for '{self.path}'")
+            self._load_all_points()
+            self.index = RtuIndex.build(self)
+            self.index.save(self.path)
+        return self.index
+
+    def _point_offsets(self, phys: np.ndarray) -> np.ndarray:
+        """File byte offsets of the given physical point indices."""
+        ppr = self._ppr_effective()
+        records = phys // ppr
+        slots = phys % ppr
+        # Data records are contiguous in virtual space, so consecutive records sit RecLen apart on disk
+        first_record = self.bs.addr(int(self.rtu.DataLocDisk))
+        return first_record + records * self.rec_len + slots * self.point_size
+
+    def _gather_points(self, phys: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read only the requested physical points from the mmap (ids, times, values)."""
+        phys = np.asarray(phys, dtype=np.int64)
+        ids = np.empty(len(phys), dtype=np.int32)
+        times = np.empty(len(phys), dtype=np.int32)
+        values = np.empty(len(phys), dtype=np.float32)
+
+        raw = np.frombuffer(self.mm, dtype=np.uint8)
+        point_bytes = np.arange(self.point_size)
+        chunk = 1_000_000
+        for start in range(0, len(phys), chunk):
+            offsets = self._point_offsets(phys[start:start + chunk])
+            points = raw[offsets[:, None] + point_bytes].view(self.np_point_dtype)[:, 0]
+            ids[start:start + chunk] = points['id']
+            times[start:start + chunk] = points['time']
+            values[start:start + chunk] = points['value']
+        del raw
+        return ids, times, values
+
+    def _select_points(self, start_sec: int = None, end_sec: int = None,
+                       peek_tags: set = None) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Points in [start_sec, end_sec] (when both are given) that pass the PEEK filter,
+        in physical file order, as (ids, times, values).
+
+        A loaded sidecar index serves range and tag queries directly. Otherwise a time
+        range is located by binary search over the ring buffer and only the overlapping
+        records are decoded; tag-only queries build the index (when enabled). Only when
+        neither applies is the whole file loaded. Returns None if the file has no valid
+        data or nothing falls in the time range; an empty selection after tag filtering
+        is returned as empty arrays.
+        """
+        has_range = start_sec is not None and end_sec is not None
+        if self.index is not None and (has_range or peek_tags is not None):
+            return self._select_points_indexed(start_sec, end_sec, peek_tags, has_range)
+
+        if has_range and self._ids is None:
+            selection = self._select_range_lazy(start_sec, end_sec)
+            if selection is not None:
+                if not selection:
+                    return None
+                match_ids, match_times, match_values = selection
+                keep_mask = self._peek_point_mask(match_ids & 0xFFFFFF, peek_tags)
+                if keep_mask is not None:
+                    match_ids = match_ids[keep_mask]
+                    match_times = match_times[keep_mask]
+                    match_values = match_values[keep_mask]
+                return match_ids, match_times, match_values
+
+        if peek_tags is not None and self._ensure_index() is not None:
+            return self._select_points_indexed(start_sec, end_sec, peek_tags, has_range)
+
+        self._load_all_points()
+        ids = self._ids
+        times = self._times
+        values = self._values
+
+        # Find valid data end
+        valid_mask = (ids != 0)
+        if not np.any(valid_mask):
+            return None
+
+        last_valid = np.where(valid_mask)[0][-1] + 1
+        match_ids = ids[:last_valid]
+        match_times = times[:last_valid]
+        match_values = values[:last_valid]
+
+        # Vectorized time range filter
+        if has_range:
+            time_mask = (match_times >= start_sec) & (match_times <= end_sec)
+            if not np.any(time_mask):
+                return None
+            match_ids = match_ids[time_mask]
+            match_times = match_times[time_mask]
+            match_values = match_values[time_mask]
+
+        # Filter by PEEK file once over nameids
+        keep_mask = self._peek_point_mask(match_ids & 0xFFFFFF, peek_tags)
+        if keep_mask is not None:
+            match_ids = match_ids[keep_mask]
+            match_times = match_times[keep_mask]
+            match_values = match_values[keep_mask]
+
+        return match_ids, match_times, match_values
+
+    def _select_points_indexed(self, start_sec: int, end_sec: int, peek_tags: set,
+                               has_range: bool) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Index-backed _select_points: pick the smaller of the time slice and the tag slices, then gather."""
+        index = self.index
+        if len(index.valid_phys) == 0:
+            return None
+
+        if has_range:
+            lo = int(np.searchsorted(index.valid_timestamps, start_sec, side='left'))
+            hi = int(np.searchsorted(index.valid_timestamps, end_sec, side='right'))
+            if lo >= hi:
+                return None
+
+        keep_nameids = self._peek_nameid_mask(peek_tags, size=len(index.tag_offsets) - 1)
+        if keep_nameids is not None:
+            starts, ends = index.tag_slices(keep_nameids)
+            tag_count = int((ends - starts).sum())
+
+        if has_range and (keep_nameids is None or hi - lo <= tag_count):
+            phys = index.valid_phys[lo:hi]
+        else:
+            phys = np.concatenate(
+                [index.tag_phys[s:e] for s, e in zip(starts.tolist(), ends.tolist())]
+                or [np.array([], dtype=index.tag_phys.dtype)])
+
+        # Physical order, matching the non-indexed scan
+        ids, times, values = self._gather_points(np.sort(phys))
+
+        # Apply whichever filter the chosen slice did not already satisfy
+        keep = np.ones(len(ids), dtype=bool)
+        if has_range:
+            keep &= (times >= start_sec) & (times <= end_sec)
+        if keep_nameids is not None:
+            keep &= keep_nameids[ids & 0xFFFFFF]
+        if not keep.all():
+            ids, times, values = ids[keep], times[keep], values[keep]
+        return ids, times, values
+
     def close(self):
         """Close file handles and memory maps."""
+        if getattr(self, 'index', None) is not None:
+            # build_chrono_index points these at the index's mmap; drop them first or
+            # the mapping cannot close (and a stale sidecar cannot be replaced on Windows)
+            self.valid_phys = self.valid_timestamps = None
+            self.index.close()
+            self.index = None
         try:
             if hasattr(self, 'mm') and self.mm is not None:
                 self.mm.close()
@@ -527,6 +1541,12 @@ class RtuResizer:
 
     def build_chrono_index(self):
         """Build chronological index for efficient date range queries."""
+        if self.index is not None:
+            # Already sorted on disk - no load or sort required
+            self.valid_phys = self.index.valid_phys
+            self.valid_timestamps = self.index.valid_timestamps
+            return
+
         self._load_all_points()
 
         ids = self._ids
@@ -551,6 +1571,15 @@ class RtuResizer:
 
     def count_between_seconds(self, start_sec: int, end_sec: int) -> int:
         """Count points within time range using vectorized operations."""
+        if self.index is not None:
+            ts = self.index.valid_timestamps
+            return int(np.searchsorted(ts, end_sec, side='right') - np.searchsorted(ts, start_sec, side='left'))
+
+        if self._ids is None:
+            selection = self._select_range_lazy(start_sec, end_sec)
+            if selection is not None:
+                return len(selection[0]) if selection else 0
+
         self._load_all_points()
 
         ids = self._ids
@@ -571,276 +1600,191 @@ class RtuResizer:
 
     def extract_range(self, start_sec: int, end_sec: int, out_file: str, tag_mapping: Dict[str, str] = None) -> int:
         """
-        Ultra-optimized vectorized extraction using threaded producer-consumer pattern.
-        Optionally applies tag renaming using the provided mapping dictionary.
-        """
-        self._load_all_points()
-        ids = self._ids
-        times = self._times
-        values = self._values
-        dict_list = self.rtu.Dictionary
-        dict_len = len(dict_list)
-
-        # Find valid data end
-        valid_mask = (ids != 0)
-        if not np.any(valid_mask):
-            return 0
-
-        # Find last valid index
-        last_valid = np.where(valid_mask)[0][-1] + 1
-
-        # Slice to valid data only
-        valid_ids = ids[:last_valid]
-        valid_times = times[:last_valid]
-        valid_values = values[:last_valid]
+        Write the points in [start_sec, end_sec] to a new .dt file with RtuWriter.
 
-        # Vectorized time range filter
-        time_mask = (valid_times >= start_sec) & (valid_times <= end_sec)
-        if not np.any(time_mask):
+        The output dictionary holds only the tags present in the range (renamed via
+        tag_mapping when given; tags renamed to the same name are merged), and point
+        ids are renumbered to match. Times, values and quality bytes are copied exactly.
+        """
+        # Vectorized time range filter (index-backed when available)
+        selection = self._select_points(start_sec, end_sec)
+        if selection is None:
             return 0
-
-        # Extract matching data
-        match_ids = valid_ids[time_mask]
-        match_times = valid_times[time_mask]
-        match_values = valid_values[time_mask]
+        match_ids, match_times, match_values = selection
 
         count = len(match_ids)
-        logger.info(f"Extracting {count} points to '{out_file}' using RTUGEN")
-
-        # Use threaded producer-consumer pattern for optimal performance
-        written = self._write_threaded(
-            out_file, count, match_ids, match_times, match_values, dict_list, dict_len, tag_mapping)
-        return written
-
-    def _write_threaded(self, out_file: str, count: int, match_ids: np.ndarray,
-                        match_times: np.ndarray, match_values: np.ndarray,
-                        dict_list: List[str], dict_len: int, tag_mapping: Dict[str, str] = None) -> int:
-        """Multi-threaded producer-consumer pattern using ThreadPoolExecutor for optimal performance."""
-
-        # Pre-compute all data vectorized
-        nameids = match_ids & 0xFFFFFF
-        qualids = (match_ids >> 24) & 0xFF
-
-        # Pre-convert timestamps to datetime objects for efficiency
-        import tzlocal
-        local_tz = tzlocal.get_localzone()
-
-        # Pre-create quality strings array for vectorized lookup
-        quality_map = np.array(['GOOD', 'MANUAL'], dtype=object)
-        quality_indices = (qualids != 0).astype(int)
-
-        def produce_chunk(chunk_start: int, chunk_end: int) -> str:
-            """Producer function: converts a chunk of data to text format"""
-            # Pre-allocate string buffer for better performance
-            from io import StringIO
-
-            buffer = StringIO()
-
-            # Vectorized timestamp conversion
-            chunk_times_sec = match_times[chunk_start:chunk_end]
-            chunk_nameids = nameids[chunk_start:chunk_end]
-            chunk_qualids = quality_indices[chunk_start:chunk_end]
-            chunk_values = match_values[chunk_start:chunk_end]
-
-            # Batch convert timestamps
-            chunk_dts = [CUSTOM_EPOCH_UTC + timedelta(seconds=int(ts))
-                         for ts in chunk_times_sec]
-            chunk_local_dts = [dt.astimezone(local_tz).replace(tzinfo=None)
-                               for dt in chunk_dts]
-
-            # Use list comprehension for faster string building with optional tag renaming
-            def get_tag_name(nid):
-                if 1 <= nid <= dict_len:
-                    original_tag = dict_list[int(nid)-1]
-                    if tag_mapping and original_tag in tag_mapping:
-                        return tag_mapping[original_tag]
-                    return original_tag
-                else:
-                    return f'UNKNOWN_{nid}'
+        logger.info(f"Extracting {count} points to '{out_file}'")
 
-            lines = [
-                f"{dt_local:%y/%m/%d %H:%M:%S}  {get_tag_name(nid)}      {
-                    val:.4f}  {quality_map[qid]}\n"
-                for dt_local, nid, val, qid in zip(
-                    chunk_local_dts, chunk_nameids, chunk_values, chunk_qualids
-                )
-            ]
+        out_dictionary, out_ids = self._remap_dictionary(match_ids, tag_mapping)
+        writer = RtuWriter(out_file, endian=self.endian,
+                           template_bsio=self.bs, template_rtu=self.rtu)
+        return writer.write(out_dictionary, out_ids, match_times, match_values)
 
-            buffer.write(''.join(lines))
-            return buffer.getvalue()
-
-        # Start RTUGEN process
-        cmd = ["RTUGEN", out_file, f"-MAXPTS={count}"]
-        logger.debug(f"Running RTUGEN command: {' '.join(cmd)}")
-
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1024*1024*4  # 4MB buffer
-        )
-
-        # Create chunks and submit to ThreadPoolExecutor
-        chunk_size = 10000
-        chunk_ranges = []
-        for chunk_start in range(0, count, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, count)
-            chunk_ranges.append((chunk_start, chunk_end))
+    def _remap_dictionary(self, ids: np.ndarray, tag_mapping: Dict[str, str] = None) -> tuple[List[str], np.ndarray]:
+        """
+        Build a compact dictionary for the given point ids and renumber their nameids.
 
-        written = 0
-        try:
-            # Use ThreadPoolExecutor to produce chunks in parallel
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                # Submit all chunks for processing
-                futures = {
-                    executor.submit(produce_chunk, start, end): (start, end)
-                    for start, end in chunk_ranges
-                }
+        Nameids outside the dictionary become UNKNOWN_<id> tags; tag_mapping renames
+        dictionary tags only.
+        """
+        dict_list = self.rtu.Dictionary
+        nameids = ids & 0xFFFFFF
+        used_nameids, inverse = np.unique(nameids, return_inverse=True)
+        names = lookup_tag_names(used_nameids, build_tag_name_lookup(dict_list)).tolist()
+        if tag_mapping:
+            names = [tag_mapping.get(name, name) if 1 <= nid <= len(dict_list) else name
+                     for nid, name in zip(used_nameids.tolist(), names)]
+
+        # Tags renamed to the same name share one dictionary entry
+        out_dictionary = list(dict.fromkeys(names))
+        position = {name: k + 1 for k, name in enumerate(out_dictionary)}
+        new_nameids = np.array([position[name] for name in names], dtype=np.int32)
+
+        out_ids = (ids & np.int32(~0xFFFFFF)) | new_nameids[inverse.reshape(-1)]
+        return out_dictionary, out_ids.astype(np.int32)
+
+    def copy_range(self, start_sec: int, end_sec: int, out_file: str,
+                   tag_mapping: Dict[str, str] = None) -> Optional[int]:
+        """
+        Binary-to-binary resize: block-copy the point records in [start_sec, end_sec] and
+        rewrite only the dictionary.
 
-                # Process completed chunks in order
-                completed_chunks = {}
-                next_chunk_start = 0
-
-                for future in as_completed(futures):
-                    chunk_start, chunk_end = futures[future]
-                    try:
-                        chunk_data = future.result()
-                        completed_chunks[chunk_start] = chunk_data
-
-                        # Write chunks in order
-                        while next_chunk_start in completed_chunks:
-                            chunk_to_write = completed_chunks.pop(
-                                next_chunk_start)
-                            process.stdin.write(chunk_to_write)
-                            written += chunk_to_write.count('\n')
-
-                            if written % 100000 == 0:
-                                logger.debug(
-                                    f"Streamed {written}/{count} points to RTUGEN")
-
-                            # Find next chunk start
-                            next_chunk_start = next(
-                                (start for start, _ in chunk_ranges if start > next_chunk_start), None)
-                            if next_chunk_start is None:
-                                break
-
-                    except Exception as e:
-                        logger.error(
-                            f"Producer error for chunk {chunk_start}-{chunk_end}: {e}")
-                        raise
+        Nameids are left untouched, so tag_mapping costs one pass over the dictionary
+        rather than a lookup per point. Returns None when the range cannot be located
+        without a full scan, or when tag_mapping renames several tags to the same name
+        (the caller then falls back to extract_range, which merges them).
+        """
+        dictionary = list(self.rtu.Dictionary)
+        if tag_mapping:
+            dictionary = [tag_mapping.get(name, name) for name in dictionary]
+            if len(set(dictionary)) != len(dictionary):
+                logger.debug("tag_mapping merges tags, falling back to extract_range")
+                return None
+
+        ranges = self._locate_range_lazy(start_sec, end_sec)
+        if ranges is None:
+            return None
+        if not ranges:
+            return 0
 
-        finally:
-            process.stdin.close()
+        parts = [self._copy_point_records(p0, p1) for p0, p1 in ranges]
+        if any(part is None for part in parts):
+            return None
+        chrono_times = np.concatenate([part['time'] for part in parts[::-1]])
+        if np.any(chrono_times[1:] < chrono_times[:-1]) or \
+                chrono_times[0] < start_sec or chrono_times[-1] > end_sec:
+            logger.debug("Located window is not time-ordered, falling back to extract_range")
+            return None
+        points = np.concatenate(parts)
 
-        # Get results
-        stdout, stderr = process.communicate()
+        logger.info(f"Block-copying {len(points)} points to '{out_file}'")
+        writer = RtuWriter(out_file, endian=self.endian,
+                           template_bsio=self.bs, template_rtu=self.rtu)
+        return writer.write_points(dictionary, points)
 
-        if process.returncode != 0:
-            logger.error(
-                f"RTUGEN failed with return code {process.returncode}")
-            logger.error(f"STDERR: {stderr}")
-            logger.error(f"STDOUT: {stdout}")
-            raise RuntimeError(f"RTUGEN command failed: {stderr}")
+    def query(self, start_sec: int = None, end_sec: int = None,
+              tags: List[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Selected points as in-memory columns instead of a CSV file.
 
-        logger.info(f"RTUGEN completed successfully - wrote {written} points")
-        return written
+        Same selection and row order as export_to_csv_flat (tags matched case-insensitively,
+        like a PEEK file). Returns 'timestamp' (int64 file seconds), 'tag_name' (object),
+        'value' (float32) and 'quality' (uint8, 0 = GOOD) arrays, empty when nothing matches.
+        """
+        peek_tags = {tag.strip().lower() for tag in tags} if tags is not None else None
+        selection = self._select_points(start_sec, end_sec, peek_tags)
+        if selection is None:
+            selection = (np.array([], dtype=np.uint32), np.array([], dtype=np.int64),
+                         np.array([], dtype=np.float32))
+        match_ids, match_times, match_values = selection
+
+        tag_lookup = build_tag_name_lookup(self.rtu.Dictionary)
+        return {
+            'timestamp': np.asarray(match_times, dtype=np.int64),
+            'tag_name': lookup_tag_names(match_ids & 0xFFFFFF, tag_lookup),
+            'value': np.asarray(match_values, dtype=np.float32),
+            'quality': ((match_ids >> 24) & 0xFF).astype(np.uint8),
+        }
 
     def export_to_csv_flat(self, csv_file: str, start_sec: int = None, end_sec: int = None, peek_file: str = None) -> int:
         """
         Export data to CSV in flat format (chronological rows).
         Format: datetime, timestamp, tag_name, value, quality
+
+        Uses a columnar writer: timestamps are converted to local time in one vectorized
+        pass, tag names come from a NumPy index into the dictionary, and each block of
+        rows is formatted and written as a single string.
         """
-        self._load_all_points()
-        ids = self._ids
-        times = self._times
-        values = self._values
         dict_list = self.rtu.Dictionary
-        dict_len = len(dict_list)
 
-        # Find valid data and apply time filter
-        valid_mask = (ids != 0)
-        if not np.any(valid_mask):
+        # Apply time filter (if specified) and PEEK filter - index-backed when available
+        selection = self._select_points(
+            start_sec, end_sec, self._load_peek_tags(peek_file))
+        if selection is None:
             return 0
+        return self._write_flat_csv(csv_file, *selection, dict_list)
 
-        last_valid = np.where(valid_mask)[0][-1] + 1
-        valid_ids = ids[:last_valid]
-        valid_times = times[:last_valid]
-        valid_values = values[:last_valid]
-
-        # Apply time filter if specified
-        if start_sec is not None and end_sec is not None:
-            time_mask = (valid_times >= start_sec) & (valid_times <= end_sec)
-            if not np.any(time_mask):
-                return 0
-        else:
-            time_mask = np.ones(len(valid_times), dtype=bool)
+    def export_to_csv_flat_groups(self, groups: Dict[str, List[str]], start_sec: int = None,
+                                  end_sec: int = None) -> Dict[str, int]:
+        """
+        Export several tag groups to their own flat CSV files from a single selection.
 
-        # Extract matching data
-        match_ids = valid_ids[time_mask]
-        match_times = valid_times[time_mask]
-        match_values = valid_values[time_mask]
+        `groups` maps csv_file -> tag names. The union of all tags is selected once and
+        split per group with a nameid lookup table, so the file is read and decoded once
+        however many groups there are. Returns {csv_file: rows}; as with
+        export_to_csv_flat, nothing is written when the file has no data in range.
+        """
+        group_tags = {csv_file: {tag.strip().lower() for tag in tags}
+                      for csv_file, tags in groups.items()}
+        selection = self._select_points(
+            start_sec, end_sec, set().union(*group_tags.values()))
+        if selection is None:
+            return {csv_file: 0 for csv_file in groups}
+
+        match_ids, match_times, match_values = selection
+        nameids = match_ids & 0xFFFFFF
+        counts = {}
+        for csv_file, tags in group_tags.items():
+            keep_mask = self._peek_point_mask(nameids, tags)
+            counts[csv_file] = self._write_flat_csv(
+                csv_file, match_ids[keep_mask], match_times[keep_mask],
+                match_values[keep_mask], self.rtu.Dictionary)
+        return counts
 
+    @staticmethod
+    def _write_flat_csv(csv_file: str, match_ids: np.ndarray, match_times: np.ndarray,
+                        match_values: np.ndarray, dict_list: List[str]) -> int:
+        """Write selected points as flat CSV rows in the order given. Returns the row count."""
         count = len(match_ids)
         logger.info(
             f"Exporting {count} points to CSV (flat format): {csv_file}")
 
-        # Load PEEK file tags for filtering
-        peek_tags = self._load_peek_tags(peek_file)
-
         # Pre-compute nameids and qualids
         nameids = match_ids & 0xFFFFFF
         qualids = (match_ids >> 24) & 0xFF
 
-        # Write to CSV
-        import tzlocal
-        local_tz = tzlocal.get_localzone()
+        # Columnar writer: format whole blocks at once and write them as single strings
+        tag_lookup = build_tag_name_lookup(dict_list, quote=True)
 
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(
                 ['datetime', 'timestamp', 'tag_name', 'value', 'quality'])
 
-            # Process in chunks for large datasets
-            chunk_size = 10000
+            block_size = 250000
             written = 0
 
-            for chunk_start in range(0, count, chunk_size):
-                chunk_end = min(chunk_start + chunk_size, count)
-
-                for i in range(chunk_start, chunk_end):
-                    tsec = int(match_times[i])
-                    nameid = int(nameids[i])
-                    qualid = int(qualids[i])
-                    val = float(match_values[i])
-
-                    # Convert timestamp to datetime
-                    dt_utc = CUSTOM_EPOCH_UTC + timedelta(seconds=tsec)
-                    dt_local = dt_utc.astimezone(local_tz).replace(tzinfo=None)
-
-                    # Get tag name
-                    tag = dict_list[nameid -
-                                    1] if 1 <= nameid <= dict_len else f"UNKNOWN_{nameid}"
-
-                    # Filter by PEEK file if specified
-                    if not self._filter_tag_by_peek(tag, peek_tags):
-                        continue
-
-                    # Quality string
-                    quality_str = "GOOD" if qualid == 0 else "BAD"
-
-                    writer.writerow([
-                        dt_local.strftime('%Y-%m-%d %H:%M:%S'),
-                        tsec,
-                        tag,
-                        val,
-                        quality_str
-                    ])
-                    written += 1
-
-                if written % 50000 == 0:
-                    logger.debug(f"Exported {written}/{count} points to CSV")
+            for block_start in range(0, count, block_size):
+                block_end = min(block_start + block_size, count)
+                f.write(format_flat_csv_block(
+                    match_times[block_start:block_end],
+                    nameids[block_start:block_end],
+                    qualids[block_start:block_end],
+                    match_values[block_start:block_end],
+                    tag_lookup
+                ))
+                written += block_end - block_start
+                logger.debug(f"Exported {written}/{count} points to CSV")
 
         logger.info(
             f"Successfully exported {written} points to CSV (flat format)")
@@ -850,226 +1794,149 @@ class RtuResizer:
         """
         Export data to CSV in dataframe format with forward/backward fill.
         Format: datetime, timestamp, tag1, tag2, tag3, ...
+
+        Columnar pivot: points are scattered into a preallocated float32 matrix
+        (one row per tag, one column per unique timestamp), filled with vectorized
+        forward/backward fill and written in chunks of rows. Peak memory is bounded
+        by the matrix rather than by per-point Python objects.
         """
-        self._load_all_points()
-        ids = self._ids
-        times = self._times
-        values = self._values
         dict_list = self.rtu.Dictionary
-        dict_len = len(dict_list)
 
-        # Find valid data and apply time filter
-        valid_mask = (ids != 0)
-        if not np.any(valid_mask):
+        # Apply time filter (if specified) and PEEK filter - index-backed when available
+        selection = self._select_points(
+            start_sec, end_sec, self._load_peek_tags(peek_file))
+        if selection is None:
             return 0
+        return self._write_dataframe_csv(csv_file, *selection, dict_list)
 
-        last_valid = np.where(valid_mask)[0][-1] + 1
-        valid_ids = ids[:last_valid]
-        valid_times = times[:last_valid]
-        valid_values = values[:last_valid]
-
-        # Apply time filter if specified
-        if start_sec is not None and end_sec is not None:
-            time_mask = (valid_times >= start_sec) & (valid_times <= end_sec)
-            if not np.any(time_mask):
-                return 0
-        else:
-            time_mask = np.ones(len(valid_times), dtype=bool)
-
-        # Extract matching data
-        match_ids = valid_ids[time_mask]
-        match_times = valid_times[time_mask]
-        match_values = valid_values[time_mask]
-
+    @classmethod
+    def _write_dataframe_csv(cls, csv_file: str, match_ids: np.ndarray, match_times: np.ndarray,
+                             match_values: np.ndarray, dict_list: List[str]) -> int:
+        """Pivot, fill and write selected points as a dataframe CSV. Returns rows x tag columns."""
         count = len(match_ids)
         logger.info(
             f"Exporting {count} points to CSV (dataframe format): {csv_file}")
 
-        # Load PEEK file tags for filtering
-        peek_tags = self._load_peek_tags(peek_file)
-
         # Pre-compute nameids and qualids
         nameids = match_ids & 0xFFFFFF
         qualids = (match_ids >> 24) & 0xFF
 
-        # Create structured data
-        import tzlocal
-        local_tz = tzlocal.get_localzone()
-
-        # Build data dictionary
-        data_dict = {}
-
-        logger.debug("Processing data points...")
-        for i in range(count):
-            tsec = int(match_times[i])
-            nameid = int(nameids[i])
-            qualid = int(qualids[i])
-            val = float(match_values[i])
-
-            # Get tag name
-            tag = dict_list[nameid -
-                            1] if 1 <= nameid <= dict_len else f"UNKNOWN_{nameid}"
-
-            # Filter by PEEK file if specified
-            if not self._filter_tag_by_peek(tag, peek_tags):
-                continue
-
-            # Only include GOOD quality data, set BAD quality to NaN
-            if qualid != 0:  # BAD quality
-                val = np.nan
-
-            # Group by timestamp
-            if tsec not in data_dict:
-                data_dict[tsec] = {}
-            data_dict[tsec][tag] = val
-
-        # Get all unique timestamps and tags
-        timestamps = sorted(data_dict.keys())
-        all_tags = set()
-        for ts_data in data_dict.values():
-            all_tags.update(ts_data.keys())
-        all_tags = sorted(list(all_tags))
+        logger.debug("Pivoting data points...")
+        timestamps, tag_names, matrix = cls._pivot_points(
+            match_times, nameids, qualids, match_values, dict_list)
 
         logger.debug(
-            f"Found {len(timestamps)} unique timestamps and {len(all_tags)} unique tags")
-
-        # Create DataFrame
-        df_data = []
-        for tsec in timestamps:
-            # Convert timestamp to datetime
-            dt_utc = CUSTOM_EPOCH_UTC + timedelta(seconds=tsec)
-            dt_local = dt_utc.astimezone(local_tz).replace(tzinfo=None)
-
-            row = {
-                'datetime': dt_local.strftime('%Y-%m-%d %H:%M:%S'),
-                'timestamp': tsec
-            }
-
-            # Add tag values (NaN if not present)
-            for tag in all_tags:
-                row[tag] = data_dict[tsec].get(tag, np.nan)
-
-            df_data.append(row)
-
-        # Create DataFrame
-        df = pd.DataFrame(df_data)
+            f"Found {len(timestamps)} unique timestamps and {len(tag_names)} unique tags")
 
         logger.debug("Applying forward fill and backward fill...")
+        fill_forward_backward(matrix)
 
-        # Forward fill then backward fill for each tag column (skip datetime and timestamp)
-        tag_columns = [col for col in df.columns if col not in [
-            'datetime', 'timestamp']]
-        for col in tag_columns:
-            df[col] = df[col].ffill().bfill()
-
-        # Write to CSV
         logger.debug("Writing DataFrame to CSV...")
-        df.to_csv(csv_file, index=False)
+        write_dataframe_csv(csv_file, timestamps, tag_names, matrix)
 
-        total_points = len(df) * len(tag_columns)
+        total_points = len(timestamps) * len(tag_names)
         logger.info(
-            f"Successfully exported dataframe CSV: {len(df)} rows x {len(tag_columns)} tag columns = {total_points} total data points")
+            f"Successfully exported dataframe CSV: {len(timestamps)} rows x {len(tag_names)} tag columns = {total_points} total data points")
         return total_points
 
+    @staticmethod
+    def _collapse_points(match_times: np.ndarray, nameids: np.ndarray, qualids: np.ndarray,
+                         match_values: np.ndarray, dict_list: List[str]) -> tuple:
+        """
+        Collapse points to one value per (tag, timestamp) cell.
+
+        Returns (timestamps, tag_names, tag_index, time_index, cell_values): sorted unique
+        timestamps, sorted unique tag names, and per-cell indexes into both plus the
+        float32 value. BAD quality points are stored as NaN; when a tag has several
+        points at the same second the last one in file order wins.
+        """
+        if len(match_times) == 0:
+            empty_index = np.array([], dtype=np.int64)
+            return (np.array([], dtype=np.int64), [], empty_index, empty_index,
+                    np.array([], dtype=np.float32))
+
+        timestamps, time_index = np.unique(match_times, return_inverse=True)
+
+        # Columns are keyed by tag *name* (duplicate dictionary names share a column)
+        unique_ids, id_index = np.unique(nameids, return_inverse=True)
+        id_names = lookup_tag_names(unique_ids, build_tag_name_lookup(dict_list))
+        tag_names, name_index = np.unique(id_names, return_inverse=True)
+        tag_index = name_index[id_index]
+
+        # Keep only the last point per (tag, timestamp) cell
+        cell = tag_index.astype(np.int64) * len(timestamps) + time_index
+        _, last_from_end = np.unique(cell[::-1], return_index=True)
+        last = len(cell) - 1 - last_from_end
+
+        cell_values = match_values[last].astype(np.float32)
+        cell_values[qualids[last] != 0] = np.nan
+        return timestamps, tag_names.tolist(), tag_index[last], time_index[last], cell_values
+
+    @classmethod
+    def _pivot_points(cls, match_times: np.ndarray, nameids: np.ndarray, qualids: np.ndarray,
+                      match_values: np.ndarray, dict_list: List[str]) -> tuple[np.ndarray, List[str], np.ndarray]:
+        """
+        Pivot points into a (tags x timestamps) float32 matrix (NaN where a tag has no point).
+        Returns sorted unique timestamps, sorted unique tag names and the matrix.
+        """
+        timestamps, tag_names, tag_index, time_index, cell_values = cls._collapse_points(
+            match_times, nameids, qualids, match_values, dict_list)
+
+        matrix = np.full((len(tag_names), len(timestamps)), np.nan, dtype=np.float32)
+        matrix[tag_index, time_index] = cell_values
+        return timestamps, tag_names, matrix
+
     def export_to_csv_dataframe_sampled(self, csv_file: str, start_sec: int = None, end_sec: int = None,
                                         interval_sec: int = 60, mode: str = 'actual', peek_file: str = None) -> int:
         """
         Export data to CSV in dataframe format with time-based sampling.
         This method ONLY applies sampling - it doesn't export all data like the regular dataframe export.
         """
-        self._load_all_points()
-        ids = self._ids
-        times = self._times
-        values = self._values
         dict_list = self.rtu.Dictionary
-        dict_len = len(dict_list)
+        has_range = start_sec is not None and end_sec is not None
 
-        # Find valid data and apply time filter
-        valid_mask = (ids != 0)
-        if not np.any(valid_mask):
+        window = self._sampling_window(start_sec, end_sec)
+        if window is None:
             return 0
+        start_sec, end_sec = window
 
-        last_valid = np.where(valid_mask)[0][-1] + 1
-        valid_ids = ids[:last_valid]
-        valid_times = times[:last_valid]
-        valid_values = values[:last_valid]
+        # Apply time filter (if specified) and PEEK filter - index-backed when available
+        selection = self._select_points(
+            start_sec if has_range else None, end_sec if has_range else None,
+            self._load_peek_tags(peek_file))
+        if selection is None:
+            return 0
+        return self._write_sampled_csv(
+            csv_file, *selection, dict_list, start_sec, end_sec, interval_sec, mode)
 
-        # Apply time filter if specified
+    def _sampling_window(self, start_sec: int = None, end_sec: int = None) -> Optional[tuple[int, int]]:
+        """Sampling grid bounds: the requested range, else the file's data range (None if empty)."""
         if start_sec is not None and end_sec is not None:
-            time_mask = (valid_times >= start_sec) & (valid_times <= end_sec)
-            if not np.any(time_mask):
-                return 0
-        else:
-            time_mask = np.ones(len(valid_times), dtype=bool)
-            # Use data range if no time filter specified
-            if start_sec is None:
-                start_sec = int(np.min(valid_times[time_mask]))
-            if end_sec is None:
-                end_sec = int(np.max(valid_times[time_mask]))
-
-        # Extract matching data
-        match_ids = valid_ids[time_mask]
-        match_times = valid_times[time_mask]
-        match_values = valid_values[time_mask]
-
-        count = len(match_ids)
-        logger.info(
-            f"Sampling {count} points to CSV (dataframe format, {mode} mode, {interval_sec}s intervals): {csv_file}")
-
-        # Load PEEK file tags for filtering
-        peek_tags = self._load_peek_tags(peek_file)
-
-        # Pre-compute nameids and qualids
-        nameids = match_ids & 0xFFFFFF
-        qualids = (match_ids >> 24) & 0xFF
-
-        # Build data dictionary grouped by timestamp
-        values_dict = {}
-        logger.debug("Processing data points...")
-
-        for i in range(count):
-            tsec = int(match_times[i])
-            nameid = int(nameids[i])
-            qualid = int(qualids[i])
-            val = float(match_values[i])
-
-            # Get tag name
-            tag = dict_list[nameid -
-                            1] if 1 <= nameid <= dict_len else f"UNKNOWN_{nameid}"
-
-            # Filter by PEEK file if specified
-            if not self._filter_tag_by_peek(tag, peek_tags):
-                continue
-
-            # Only include GOOD quality data, set BAD quality to NaN
-            if qualid != 0:  # BAD quality
-                val = np.nan
+            return start_sec, end_sec
 
-            # Group by timestamp
-            if tsec not in values_dict:
-                values_dict[tsec] = {}
-            values_dict[tsec][tag] = val
-
-        # Get all unique timestamps and tags
-        timestamps = np.array(sorted(values_dict.keys()))
-        all_tags = set()
-        for ts_data in values_dict.values():
-            all_tags.update(ts_data.keys())
-        all_tags = sorted(list(all_tags))
-
-        logger.debug(
-            f"Found {len(timestamps)} unique timestamps and {len(all_tags)} unique tags")
-
-        # Sample data based on mode
-        if mode == 'interpolated':
-            df_data = self._sample_interpolated(
-                timestamps, values_dict, all_tags, start_sec, end_sec, interval_sec)
-        else:  # 'actual'
-            df_data = self._sample_actual(
-                timestamps, values_dict, all_tags, start_sec, end_sec, interval_sec)
+        # Use data range if no time filter specified
+        self._load_all_points()
+        valid_mask = (self._ids != 0)
+        if not np.any(valid_mask):
+            return None
+        valid_times = self._times[:np.where(valid_mask)[0][-1] + 1]
+        if start_sec is None:
+            start_sec = int(np.min(valid_times))
+        if end_sec is None:
+            end_sec = int(np.max(valid_times))
+        return start_sec, end_sec
 
-        # Create DataFrame
-        df = pd.DataFrame(df_data)
+    @classmethod
+    def _write_sampled_csv(cls, csv_file: str, match_ids: np.ndarray, match_times: np.ndarray,
+                           match_values: np.ndarray, dict_list: List[str], start_sec: int,
+                           end_sec: int, interval_sec: int, mode: str) -> int:
+        """Sample selected points onto the [start_sec, end_sec] grid and write them as a dataframe CSV."""
+        count = len(match_ids)
+        logger.info(
+            f"Sampling {count} points to CSV (dataframe format, {mode} mode, {interval_sec}s intervals): {csv_file}")
+
+        df, all_tags = cls._sample_frame(
+            match_ids, match_times, match_values, dict_list, start_sec, end_sec, interval_sec, mode)
 
         if len(df) == 0:
             logger.warning("No data points found for sampling")
@@ -1086,159 +1953,241 @@ class RtuResizer:
             f"Successfully exported sampled dataframe CSV ({mode} mode): {len(df)} rows x {len(all_tags)} tag columns = {total_points} total data points")
         return total_points
 
-    def _sample_interpolated(self, timestamps: np.ndarray, values_dict: dict, all_tags: list,
-                             start_sec: int, end_sec: int, interval_sec: int) -> list:
-        """Sample data at exact intervals using linear interpolation."""
-        import tzlocal
-        local_tz = tzlocal.get_localzone()
+    @classmethod
+    def _sample_frame(cls, match_ids: np.ndarray, match_times: np.ndarray, match_values: np.ndarray,
+                      dict_list: List[str], start_sec: int, end_sec: int, interval_sec: int,
+                      mode: str) -> tuple[pd.DataFrame, List[str]]:
+        """Sampled DataFrame (datetime, timestamp, tag columns) and its tag names."""
+        # Pre-compute nameids and qualids
+        nameids = match_ids & 0xFFFFFF
+        qualids = (match_ids >> 24) & 0xFF
 
-        # Generate target timestamps at exact intervals
-        target_timestamps = []
-        current_time = start_sec
-        while current_time <= end_sec:
-            target_timestamps.append(current_time)
-            current_time += interval_sec
-
-        df_data = []
-
-        for target_time in target_timestamps:
-            # Convert timestamp to datetime
-            dt_utc = CUSTOM_EPOCH_UTC + timedelta(seconds=target_time)
-            dt_local = dt_utc.astimezone(local_tz).replace(tzinfo=None)
-
-            row = {
-                'datetime': dt_local.strftime('%Y-%m-%d %H:%M:%S'),
-                'timestamp': target_time
-            }
+        logger.debug("Grouping data points by tag...")
+        timestamps, all_tags, tag_index, time_index, cell_values = cls._collapse_points(
+            match_times, nameids, qualids, match_values, dict_list)
 
-            # For each tag, interpolate the value at target_time
-            for tag in all_tags:
-                # Get all timestamps and values for this tag
-                tag_times = []
-                tag_vals = []
-
-                for ts in timestamps:
-                    if tag in values_dict[ts] and not np.isnan(values_dict[ts][tag]):
-                        tag_times.append(ts)
-                        tag_vals.append(values_dict[ts][tag])
-
-                if len(tag_times) < 2:
-                    # Not enough data for interpolation
-                    row[tag] = np.nan
-                    continue
-
-                tag_times = np.array(tag_times)
-                tag_vals = np.array(tag_vals)
-
-                # Find surrounding points for interpolation
-                if target_time <= tag_times[0]:
-                    # Before first point, use first value
-                    row[tag] = tag_vals[0]
-                elif target_time >= tag_times[-1]:
-                    # After last point, use last value
-                    row[tag] = tag_vals[-1]
-                else:
-                    # Interpolate between surrounding points
-                    idx = np.searchsorted(tag_times, target_time)
-                    if idx > 0 and idx < len(tag_times):
-                        t1, t2 = tag_times[idx-1], tag_times[idx]
-                        v1, v2 = tag_vals[idx-1], tag_vals[idx]
-
-                        # Linear interpolation
-                        if t2 != t1:  # Avoid division by zero
-                            interpolated_val = v1 + \
-                                (v2 - v1) * (target_time - t1) / (t2 - t1)
-                            row[tag] = interpolated_val
-                        else:
-                            row[tag] = v1
-                    else:
-                        row[tag] = np.nan
+        logger.debug(
+            f"Found {len(timestamps)} unique timestamps and {len(all_tags)} unique tags")
+
+        # Sample data based on mode
+        if mode == 'interpolated':
+            df = cls._sample_interpolated(
+                timestamps, all_tags, tag_index, time_index, cell_values, start_sec, end_sec, interval_sec)
+        else:  # 'actual'
+            df = cls._sample_actual(
+                timestamps, all_tags, tag_index, time_index, cell_values, start_sec, end_sec, interval_sec)
+        return df, all_tags
 
-            df_data.append(row)
+    def export_to_table(self, out_file: str, start_sec: int = None, end_sec: int = None,
+                        peek_file: str = None, layout: str = 'flat', file_format: str = 'parquet',
+                        interval_sec: int = None, mode: str = 'actual') -> int:
+        """
+        Export to Parquet or Feather (Arrow IPC) instead of CSV.
 
-        return df_data
+        Same selection and layouts as the CSV exports, without any text formatting:
+        timestamps are int32 file seconds (plus a local datetime column), values are
+        float32 and flat tag names are dictionary-encoded. Sampling applies to the
+        dataframe layout when interval_sec is given. Returns the same counts as the
+        corresponding CSV export.
+        """
+        _require_pyarrow()
+        if interval_sec:
+            window = self._sampling_window(start_sec, end_sec)
+            if window is None:
+                return 0
+        has_range = start_sec is not None and end_sec is not None
 
-    def _sample_actual(self, timestamps: np.ndarray, values_dict: dict, all_tags: list,
-                       start_sec: int, end_sec: int, interval_sec: int) -> list:
-        """Sample data using closest actual data points to target intervals."""
-        import tzlocal
-        local_tz = tzlocal.get_localzone()
+        selection = self._select_points(
+            start_sec if has_range else None, end_sec if has_range else None,
+            self._load_peek_tags(peek_file))
+        if selection is None:
+            return 0
+        match_ids, match_times, match_values = selection
+        nameids = match_ids & 0xFFFFFF
+        qualids = (match_ids >> 24) & 0xFF
+
+        if layout == 'flat' and not interval_sec:
+            table = flat_arrow_table(match_times, nameids, qualids, match_values, self.rtu.Dictionary)
+            exported = table.num_rows
+        elif interval_sec:
+            df, tag_names = self._sample_frame(
+                match_ids, match_times, match_values, self.rtu.Dictionary,
+                window[0], window[1], interval_sec, mode)
+            if len(df) == 0:
+                logger.warning("No data points found for sampling")
+                return 0
+            table = dataframe_arrow_table(
+                df['timestamp'].to_numpy(), tag_names, df[tag_names].to_numpy(dtype=np.float32).T)
+            exported = len(df) * len(tag_names)
+        else:
+            timestamps, tag_names, matrix = self._pivot_points(
+                match_times, nameids, qualids, match_values, self.rtu.Dictionary)
+            fill_forward_backward(matrix)
+            table = dataframe_arrow_table(timestamps, tag_names, matrix)
+            exported = len(timestamps) * len(tag_names)
 
-        df_data = []
-        current_target = start_sec
-        last_selected_time = None
+        write_arrow_table(table, out_file, file_format)
+        logger.info(
+            f"Exported {table.num_rows} rows x {table.num_columns} columns to {file_format}: {out_file}")
+        return exported
 
-        while current_target <= end_sec:
-            # Find closest actual timestamp to current_target
-            time_diffs = np.abs(timestamps - current_target)
-            closest_idx = np.argmin(time_diffs)
-            closest_time = timestamps[closest_idx]
+    @staticmethod
+    def _sample_interpolated(timestamps: np.ndarray, all_tags: List[str], tag_index: np.ndarray,
+                             time_index: np.ndarray, cell_values: np.ndarray,
+                             start_sec: int, end_sec: int, interval_sec: int) -> pd.DataFrame:
+        """
+        Sample data at exact intervals using linear interpolation.
 
-            # Skip if we already selected this timestamp (avoid duplicates)
-            if last_selected_time is not None and closest_time == last_selected_time:
-                current_target += interval_sec
+        Cells are grouped by tag once (sorted by tag, then time) and each tag is
+        interpolated over the whole target grid in a single vectorized pass.
+        Targets before the first / after the last sample are clamped to that sample;
+        tags with fewer than two GOOD samples produce NaN.
+        """
+        # Generate target timestamps at exact intervals
+        target_timestamps = np.arange(start_sec, end_sec + 1, interval_sec, dtype=np.int64)
+        sampled = np.full((len(target_timestamps), len(all_tags)), np.nan, dtype=np.float64)
+
+        # Group cells by tag, chronological within each tag, dropping BAD (NaN) samples
+        good = ~np.isnan(cell_values)
+        order = np.lexsort((time_index[good], tag_index[good]))
+        grouped_tags = tag_index[good][order]
+        grouped_times = timestamps[time_index[good][order]].astype(np.int64)
+        grouped_vals = cell_values[good][order].astype(np.float64)
+        bounds = np.searchsorted(grouped_tags, np.arange(len(all_tags) + 1))
+
+        for col in range(len(all_tags)):
+            tag_times = grouped_times[bounds[col]:bounds[col + 1]]
+            tag_vals = grouped_vals[bounds[col]:bounds[col + 1]]
+
+            if len(tag_times) < 2:
+                # Not enough data for interpolation
                 continue
 
-            # Convert timestamp to datetime
-            dt_utc = CUSTOM_EPOCH_UTC + timedelta(seconds=int(closest_time))
-            dt_local = dt_utc.astimezone(local_tz).replace(tzinfo=None)
+            column = sampled[:, col]
+            before = target_timestamps <= tag_times[0]
+            after = ~before & (target_timestamps >= tag_times[-1])
+            inside = ~(before | after)
+
+            # Clamp to the first/last value outside the sampled range
+            column[before] = tag_vals[0]
+            column[after] = tag_vals[-1]
+
+            # Linear interpolation between surrounding points (same arithmetic as before,
+            # so results are bit-identical to the per-target loop)
+            targets = target_timestamps[inside]
+            idx = np.searchsorted(tag_times, targets)
+            t1, t2 = tag_times[idx - 1], tag_times[idx]
+            v1, v2 = tag_vals[idx - 1], tag_vals[idx]
+            column[inside] = v1 + (v2 - v1) * (targets - t1) / (t2 - t1)
+
+        header = pd.DataFrame({
+            'datetime': format_local_datetimes(target_timestamps),
+            'timestamp': target_timestamps
+        })
+        return pd.concat([header, pd.DataFrame(sampled, columns=all_tags)], axis=1)
 
-            row = {
-                'datetime': dt_local.strftime('%Y-%m-%d %H:%M:%S'),
-                'timestamp': int(closest_time)
-            }
+    @staticmethod
+    def _nearest_timestamp_index(timestamps: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Batched nearest-neighbour lookup of targets in sorted unique timestamps.
+        Ties go to the earlier timestamp (same as np.argmin over |timestamps - target|).
+        """
+        right = np.searchsorted(timestamps, targets, side='left')
+        right = np.clip(right, 1, max(1, len(timestamps) - 1))
+        left = right - 1
+        if len(timestamps) == 1:
+            return np.zeros(len(targets), dtype=np.int64)
+        take_left = (targets - timestamps[left]) <= (timestamps[right] - targets)
+        return np.where(take_left, left, right).astype(np.int64)
+
+    @classmethod
+    def _select_actual_timestamps(cls, timestamps: np.ndarray, start_sec: int, end_sec: int,
+                                  interval_sec: int) -> np.ndarray:
+        """
+        Indexes of the actual timestamps chosen by "actual" sampling.
 
-            # Add tag values for this timestamp
-            for tag in all_tags:
-                row[tag] = values_dict[closest_time].get(tag, np.nan)
+        Rule: snap the target to the closest real timestamp, skip it if it repeats the
+        previous selection, and advance the next target from the selected point.
+        Instead of scanning the whole array per target, the successor of every
+        timestamp is resolved up front with one batched searchsorted, then the
+        selection chain is walked.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if len(timestamps) == 0 or start_sec > end_sec:
+            return np.array([], dtype=np.int64)
+
+        # The target from timestamps[i] snaps back to i (and is skipped) until it passes
+        # the midpoint to timestamps[i+1]; the first k*interval past that midpoint is the
+        # next target that can select a new point
+        gaps = np.diff(timestamps)
+        steps = gaps // (2 * interval_sec) + 1
+        next_targets = timestamps[:-1] + steps * interval_sec
+        next_index = cls._nearest_timestamp_index(timestamps, next_targets).tolist()
+        next_targets = next_targets.tolist()
+
+        last_index = len(timestamps) - 1
+        current = int(cls._nearest_timestamp_index(
+            timestamps, np.array([start_sec], dtype=np.int64))[0])
+        selected = [current]
+        while current < last_index and next_targets[current] <= end_sec:
+            current = next_index[current]
+            selected.append(current)
+
+        return np.array(selected, dtype=np.int64)
+
+    @classmethod
+    def _sample_actual(cls, timestamps: np.ndarray, all_tags: List[str], tag_index: np.ndarray,
+                       time_index: np.ndarray, cell_values: np.ndarray,
+                       start_sec: int, end_sec: int, interval_sec: int) -> pd.DataFrame:
+        """Sample data using closest actual data points to target intervals."""
+        selected = cls._select_actual_timestamps(timestamps, start_sec, end_sec, interval_sec)
 
-            df_data.append(row)
-            last_selected_time = closest_time
+        # Scatter the cells at the selected timestamps into a (rows x tags) matrix
+        row_of_time = np.full(len(timestamps), -1, dtype=np.int64)
+        row_of_time[selected] = np.arange(len(selected))
+        rows = row_of_time[time_index]
+        in_sample = rows >= 0
 
-            # Move to next target interval from the selected point
-            current_target = closest_time + interval_sec
+        sampled = np.full((len(selected), len(all_tags)), np.nan, dtype=np.float64)
+        sampled[rows[in_sample], tag_index[in_sample]] = cell_values[in_sample]
 
-        return df_data
+        selected_times = timestamps[selected].astype(np.int64)
+        header = pd.DataFrame({
+            'datetime': format_local_datetimes(selected_times),
+            'timestamp': selected_times
+        })
+        return pd.concat([header, pd.DataFrame(sampled, columns=all_tags)], axis=1)
 
     def export_to_csv_flat_parallel(self, csv_file: str, start_sec: int = None, end_sec: int = None, peek_file: str = None) -> int:
-        """Parallel version of CSV export for very large datasets."""
-        self._load_all_points()
-        ids = self._ids
-        times = self._times
-        values = self._values
+        """
+        Parallel version of CSV export for very large datasets.
+
+        The PEEK filter (if any) is applied to nameids before the work is split, so
+        filtered exports use the same ProcessPool path with no per-row string work.
+        Chunks are written in their original order.
+        """
         dict_list = self.rtu.Dictionary
-        dict_len = len(dict_list)
 
-        # Find valid data and apply time filter
-        valid_mask = (ids != 0)
-        if not np.any(valid_mask):
+        # Apply time filter (if specified) and PEEK filter - index-backed when available
+        selection = self._select_points(
+            start_sec, end_sec, self._load_peek_tags(peek_file))
+        if selection is None:
             return 0
+        return self._write_flat_csv_parallel(csv_file, *selection, dict_list)
 
-        last_valid = np.where(valid_mask)[0][-1] + 1
-        valid_ids = ids[:last_valid]
-        valid_times = times[:last_valid]
-        valid_values = values[:last_valid]
-
-        # Apply time filter if specified
-        if start_sec is not None and end_sec is not None:
-            time_mask = (valid_times >= start_sec) & (valid_times <= end_sec)
-            if not np.any(time_mask):
-                return 0
-        else:
-            time_mask = np.ones(len(valid_times), dtype=bool)
-
-        # Extract matching data
-        match_ids = valid_ids[time_mask]
-        match_times = valid_times[time_mask]
-        match_values = valid_values[time_mask]
+    @classmethod
+    def _write_flat_csv_parallel(cls, csv_file: str, match_ids: np.ndarray, match_times: np.ndarray,
+                                 match_values: np.ndarray, dict_list: List[str]) -> int:
+        """Write selected points as flat CSV, formatting chunks across a process pool."""
+        # Pre-compute nameids and qualids
+        nameids = match_ids & 0xFFFFFF
+        qualids = (match_ids >> 24) & 0xFF
 
-        count = len(match_ids)
+        count = len(nameids)
         logger.info(
             f"Exporting {count} points to CSV (flat format, parallel): {csv_file}")
 
-        # Pre-compute nameids and qualids
-        nameids = match_ids & 0xFFFFFF
-        qualids = (match_ids >> 24) & 0xFF
+        tag_lookup = build_tag_name_lookup(dict_list, quote=True)
 
         # Split work across CPU cores
         n_cores = os.cpu_count()
@@ -1250,68 +2199,36 @@ class RtuResizer:
             for i in range(0, count, chunk_size):
                 chunk_end = min(i + chunk_size, count)
                 future = executor.submit(
-                    self._process_csv_chunk,
-                    match_ids[i:chunk_end],
+                    cls._process_csv_chunk,
                     match_times[i:chunk_end],
                     match_values[i:chunk_end],
                     nameids[i:chunk_end],
                     qualids[i:chunk_end],
-                    dict_list,
-                    dict_len
+                    tag_lookup
                 )
                 futures.append(future)
 
-            # Combine results
+            # Combine results in submission order
             with open(csv_file, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 writer.writerow(
                     ['datetime', 'timestamp', 'tag_name', 'value', 'quality'])
 
                 written = 0
-                for future in as_completed(futures):
-                    chunk_rows = future.result()
-                    writer.writerows(chunk_rows)
-                    written += len(chunk_rows)
+                for future, i in zip(futures, range(0, count, chunk_size)):
+                    f.write(future.result())
+                    written += min(chunk_size, count - i)
 
         logger.info(
             f"Successfully exported {written} points to CSV (flat format, parallel)")
         return written
 
     @staticmethod
-    def _process_csv_chunk(chunk_ids: np.ndarray, chunk_times: np.ndarray, chunk_values: np.ndarray,
+    def _process_csv_chunk(chunk_times: np.ndarray, chunk_values: np.ndarray,
                            chunk_nameids: np.ndarray, chunk_qualids: np.ndarray,
-                           dict_list: List[str], dict_len: int) -> List[List]:
-        """Process a chunk of data for parallel CSV export."""
-        import tzlocal
-        local_tz = tzlocal.get_localzone()
-
-        rows = []
-        for i in range(len(chunk_ids)):
-            tsec = int(chunk_times[i])
-            nameid = int(chunk_nameids[i])
-            qualid = int(chunk_qualids[i])
-            val = float(chunk_values[i])
-
-            # Convert timestamp to datetime
-            dt_utc = CUSTOM_EPOCH_UTC + timedelta(seconds=tsec)
-            dt_local = dt_utc.astimezone(local_tz).replace(tzinfo=None)
-
-            # Get tag name
-            tag = dict_list[nameid -
-                            1] if 1 <= nameid <= dict_len else f"UNKNOWN_{nameid}"
-
-            # Quality string
-            quality_str = "GOOD" if qualid == 0 else "BAD"
-
-            rows.append([
-                dt_local.strftime('%Y-%m-%d %H:%M:%S'),
-                tsec,
-                tag,
-                val,
-                quality_str
-            ])
-
-        return rows
+                           tag_lookup: np.ndarray) -> str:
+        """Format a chunk of data as CSV text for parallel CSV export."""
+        return format_flat_csv_block(chunk_times, chunk_nameids, chunk_qualids, chunk_values, tag_lookup)
 
 
 # Add JIT-compiled functions if Numba is available
@@ -1336,6 +2253,274 @@ else:
         return nameids, qualids
 
 
+# ---------------- multi-file dataset ----------------
+
+def _select_file_points(path: str, endian: str, use_index: bool, start_sec: int, end_sec: int,
+                        peek_tags: set) -> Optional[tuple]:
+    """Process-pool worker: (ids, times, values, dictionary) for one file, or None."""
+    resizer = RtuResizer(path, endian=endian, use_index=use_index)
+    try:
+        selection = resizer._select_points(start_sec, end_sec, peek_tags)
+        if selection is None:
+            return None
+        return (*selection, list(resizer.rtu.Dictionary))
+    finally:
+        resizer.close()
+
+
+def _export_file(endian: str, use_index: bool, method: str, input_file: str,
+                 output_file: str, kwargs: Dict[str, Any]) -> int:
+    """Process-pool worker: run one RTUService export (without nested chunk parallelism)."""
+    service = RTUService(endian=endian, use_index=use_index, parallel_chunks=False)
+    return getattr(service, method)(input_file, output_file, **kwargs)
+
+
+class RtuDataset:
+    """
+    A folder (or list) of .dt files queried as one time-ordered dataset.
+
+    Each file's selection is read through its own RtuResizer (lazy range reads or the
+    sidecar index), tag names are unified into one dataset dictionary, and the per-file
+    chronological runs are merged in memory into a single time-ordered stream. Files
+    whose sidecar index shows they lie outside the requested range are skipped without
+    being opened. No intermediate per-file CSVs are written.
+
+    The whole selection is held in memory (12-16 bytes per point, about twice that
+    while the runs are merged), so very large folders should be queried with a time
+    range or tag list. Files that cannot be read are logged, left out of the result
+    and listed in `skipped_files`.
+    """
+
+    def __init__(self, paths, endian: str = DEFAULT_ENDIAN, use_index: bool = False,
+                 cancel_event: threading.Event = None, max_workers: int = None):
+        if isinstance(paths, str):
+            paths = sorted(glob.glob(os.path.join(paths, "*.dt"))) if os.path.isdir(paths) else [paths]
+        self.paths: List[str] = list(paths)
+        self.endian = endian
+        self.use_index = use_index
+        self.max_workers = max_workers
+        self.skipped_files: List[str] = []
+        self._cancel_event = cancel_event or threading.Event()
+
+    def cancel(self):
+        """Stop reading further files."""
+        self._cancel_event.set()
+
+    def _outside_range(self, path: str, start_sec: int = None, end_sec: int = None) -> bool:
+        """True when the file's sidecar index shows no points in [start_sec, end_sec]."""
+        if start_sec is None or end_sec is None or not self.use_index:
+            return False
+        meta = RtuIndex.load_meta(path, self.endian)
+        if meta is None:
+            return False
+        return (not meta['valid_points'] or meta['last_timestamp'] < start_sec
+                or meta['first_timestamp'] > end_sec)
+
+    def select(self, start_sec: int = None, end_sec: int = None, peek_tags: set = None,
+               progress_callback: Callable[[int, int, str], None] = None) -> Optional[tuple]:
+        """
+        Select points from every file and merge them into one time-ordered stream.
+
+        Returns (ids, times, values, dictionary) where ids carry nameids into the merged
+        dictionary, or None if no file has matching points (or the read was cancelled).
+        Points with equal timestamps keep file order, then in-file order. Unreadable files
+        are skipped (see `skipped_files`); RuntimeError if no file could be read.
+        progress_callback is called as (files_done, file_count, path) as files finish.
+        """
+        self.skipped_files = []
+        candidates = []
+        for path in self.paths:
+            if self._outside_range(path, start_sec, end_sec):
+                logger.debug(f"Skipping '{path}': outside requested time range")
+            else:
+                candidates.append(path)
+
+        selections = self._read_files(candidates, start_sec, end_sec, peek_tags, progress_callback)
+        if selections is None:
+            logger.info("RTU dataset read stopped (cancel requested)")
+            return None
+        if candidates and len(self.skipped_files) == len(candidates):
+            raise RuntimeError(f"None of the {len(candidates)} RTU files could be read")
+
+        dictionary: List[str] = []
+        positions: Dict[str, int] = {}
+        runs = []
+        for path, selection in zip(candidates, selections):
+            if selection is None or len(selection[0]) == 0:
+                continue
+            ids, times, values, file_dictionary = selection
+
+            # Renumber this file's nameids into the dataset dictionary (by tag name)
+            used_nameids, inverse = np.unique(ids & 0xFFFFFF, return_inverse=True)
+            names = lookup_tag_names(used_nameids, build_tag_name_lookup(file_dictionary))
+            for name in names:
+                if name not in positions:
+                    positions[name] = len(dictionary) + 1
+                    dictionary.append(name)
+            dataset_nameids = np.array([positions[name] for name in names], dtype=np.int32)
+            ids = (ids & np.int32(~0xFFFFFF)) | dataset_nameids[inverse.reshape(-1)]
+
+            # Each file becomes one chronological run (a wrapped ring is rotated back)
+            order = np.argsort(times, kind='stable')
+            runs.append((ids[order], times[order], values[order]))
+            logger.debug(f"Selected {len(order)} points from '{path}'")
+
+        if not runs:
+            return None
+
+        ids, times, values = self._merge_runs(runs)
+        logger.info(f"Merged {len(ids)} points from {len(runs)} of {len(self.paths)} files")
+        return ids, times, values, dictionary
+
+    @staticmethod
+    def _merge_runs(runs: list, chunk_points: int = DATASET_MERGE_CHUNK_POINTS) -> tuple:
+        """
+        Merge chronological (ids, times, values) runs into preallocated output arrays.
+
+        Works through the runs in time slices of roughly chunk_points points: each step
+        takes every run's points up to a cut time and stable-sorts just that slice, so
+        the sort temporaries stay bounded however large the dataset is. Equal timestamps
+        keep run order, then in-run order.
+        """
+        if len(runs) == 1:
+            return runs[0]
+        total = sum(len(run[1]) for run in runs)
+        out = tuple(np.empty(total, dtype=np.result_type(*(run[k] for run in runs)))
+                    for k in range(3))
+        cursors = [0] * len(runs)
+        step = max(1, chunk_points // len(runs))
+        written = 0
+        while written < total:
+            # Earliest time `step` points ahead in any run; every run contributes its
+            # points up to (and including) it, so each slice advances by at least `step`
+            ahead = [run[1][c + step] for run, c in zip(runs, cursors) if c + step < len(run[1])]
+            cut = min(ahead) if ahead else None
+            pieces = []
+            for k, (run, c) in enumerate(zip(runs, cursors)):
+                end = len(run[1]) if cut is None else int(np.searchsorted(run[1], cut, side='right'))
+                if end > c:
+                    pieces.append(tuple(col[c:end] for col in run))
+                    cursors[k] = end
+            slice_ids, slice_times, slice_values = (np.concatenate(col) for col in zip(*pieces))
+            order = np.argsort(slice_times, kind='stable')
+            end = written + len(order)
+            out[0][written:end] = slice_ids[order]
+            out[1][written:end] = slice_times[order]
+            out[2][written:end] = slice_values[order]
+            written = end
+        return out
+
+    def _read_files(self, paths: List[str], start_sec: int, end_sec: int, peek_tags: set,
+                    progress_callback=None) -> Optional[list]:
+        """
+        Read each file's selection, in a process pool when the files are large enough to
+        be worth it. Results are in `paths` order; None if cancelled. A file that fails
+        to read is logged, added to `skipped_files` and gets a None result.
+        """
+        workers = folder_worker_count(paths, self.max_workers)
+        total_bytes = sum(os.path.getsize(path) for path in paths)
+        results = [None] * len(paths)
+
+        if workers <= 1 or total_bytes < FOLDER_PARALLEL_MIN_BYTES:
+            for i, path in enumerate(paths):
+                if self._cancel_event.is_set():
+                    return None
+                try:
+                    results[i] = _select_file_points(
+                        path, self.endian, self.use_index, start_sec, end_sec, peek_tags)
+                except Exception as e:
+                    logger.error(f"Failed to read {path}: {e}")
+                    self.skipped_files.append(path)
+                if progress_callback:
+                    progress_callback(i + 1, len(paths), path)
+            return results
+
+        logger.info(f"Reading {len(paths)} RTU files with {workers} worker processes")
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                executor.submit(_select_file_points, path, self.endian, self.use_index,
+                                start_sec, end_sec, peek_tags): i
+                for i, path in enumerate(paths)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                if self._cancel_event.is_set():
+                    return None
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    # Continue with the other files instead of failing the whole dataset
+                    logger.error(f"Failed to read {paths[i]}: {e}")
+                    self.skipped_files.append(paths[i])
+                if progress_callback:
+                    progress_callback(done, len(paths), paths[i])
+            return results
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def time_span(self) -> Optional[tuple[int, int]]:
+        """First and last timestamps across all files (from sidecar indexes when available)."""
+        first = last = None
+        for path in self.paths:
+            meta = RtuIndex.load_meta(path, self.endian) if self.use_index else None
+            if meta is None:
+                resizer = RtuResizer(path, endian=self.endian, use_index=self.use_index)
+                try:
+                    resizer.build_chrono_index()
+                    if self.use_index:
+                        resizer._ensure_index()
+                    if len(resizer.valid_timestamps) == 0:
+                        continue
+                    span = int(resizer.valid_timestamps[0]), int(resizer.valid_timestamps[-1])
+                finally:
+                    resizer.close()
+            elif meta['valid_points']:
+                span = meta['first_timestamp'], meta['last_timestamp']
+            else:
+                continue
+            first = span[0] if first is None else min(first, span[0])
+            last = span[1] if last is None else max(last, span[1])
+        return None if first is None else (first, last)
+
+    def export_to_csv_flat(self, csv_file: str, start_sec: int = None, end_sec: int = None,
+                           peek_file: str = None, progress_callback=None) -> int:
+        """Export all files as one time-ordered flat CSV."""
+        selection = self.select(start_sec, end_sec, RtuResizer._load_peek_tags(peek_file),
+                                progress_callback)
+        if selection is None:
+            return 0
+        if len(selection[0]) > 1000000 and (os.cpu_count() or 1) > 1:
+            return RtuResizer._write_flat_csv_parallel(csv_file, *selection)
+        return RtuResizer._write_flat_csv(csv_file, *selection)
+
+    def export_to_csv_dataframe(self, csv_file: str, start_sec: int = None, end_sec: int = None,
+                                peek_file: str = None, progress_callback=None) -> int:
+        """Export all files as one dataframe CSV (tags as columns, forward/backward filled)."""
+        selection = self.select(start_sec, end_sec, RtuResizer._load_peek_tags(peek_file),
+                                progress_callback)
+        if selection is None:
+            return 0
+        return RtuResizer._write_dataframe_csv(csv_file, *selection)
+
+    def export_to_csv_dataframe_sampled(self, csv_file: str, start_sec: int = None, end_sec: int = None,
+                                        interval_sec: int = 60, mode: str = 'actual',
+                                        peek_file: str = None, progress_callback=None) -> int:
+        """Export all files as one sampled dataframe CSV."""
+        if start_sec is None or end_sec is None:
+            span = self.time_span()
+            if span is None:
+                return 0
+            start_sec = span[0] if start_sec is None else start_sec
+            end_sec = span[1] if end_sec is None else end_sec
+        selection = self.select(start_sec, end_sec, RtuResizer._load_peek_tags(peek_file),
+                                progress_callback)
+        if selection is None:
+            return 0
+        return RtuResizer._write_sampled_csv(
+            csv_file, *selection, start_sec, end_sec, interval_sec, mode)
+
+
 class RTUService:
     """
     Comprehensive RTU processing service with file info, resizing, and CSV export capabilities.
@@ -1348,7 +2533,7 @@ class RTUService:
     ✓ Single-pass extraction (no separate count+write phases)
     ✓ Vectorized bit operations for nameid/qualid extraction
     ✓ Multi-threaded producer-consumer pattern for maximum performance
-    ✓ Direct pipe streaming to RTUGEN (no temporary files)
+    ✓ Native binary .dt writer for resizing (no RTUGEN subprocess)
     ✓ Multi-processing with ProcessPoolExecutor for parallel CSV processing
     ✓ Chunked processing with optimized buffer sizes
     ✓ JIT compilation with Numba (when available)
@@ -1362,14 +2547,26 @@ class RTUService:
     Methods are thread-safe and can be used in larger applications.
     """
 
-    def __init__(self, endian: str = DEFAULT_ENDIAN):
+    def __init__(self, endian: str = DEFAULT_ENDIAN, use_index: bool = None,
+                 parallel_chunks: bool = True):
         """
         Initialize RTU Service.
 
         Args:
             endian: Byte order for RTU file reading ('<' for little-endian)
+            use_index: Use (and create) the '<file>.dt.idx' sidecar index so file info is
+                       O(1) and time-range/tag queries read only the matching points;
+                       None follows rtudata.sidecar_index in config.json (off by default)
+            parallel_chunks: Split large flat exports across a process pool (disabled
+                             inside export_folder workers, which are already parallel)
         """
         self.endian = endian
+        if use_index is None:
+            use_index = get_config_manager().get_rtudata_sidecar_index()
+        self.use_index = bool(use_index)
+        self.parallel_chunks = parallel_chunks
+        # .dt files the last export_folder / export_folder_csv call could not read
+        self.last_skipped_files: List[str] = []
 
     def _validate_input_file(self, input_file: str) -> None:
         """Validate that input file exists and is readable."""
@@ -1491,7 +2688,8 @@ class RTUService:
             'numba_jit_available': NUMBA_AVAILABLE,
             'cpu_cores': os.cpu_count(),
             'psutil_available': PSUTIL_AVAILABLE,
-            'direct_pipe_streaming': True,
+            'native_dt_writer': True,
+            'pyarrow_available': PYARROW_AVAILABLE,
             'chunked_processing': True,
             'vectorized_bit_operations': True,
             'string_pooling': True,
@@ -1499,7 +2697,7 @@ class RTUService:
                 'Memory-mapped I/O (mmap)',
                 'NumPy vectorized operations',
                 'Multi-threaded producer-consumer',
-                'Direct RTUGEN pipe streaming',
+                'Native binary .dt writer',
                 'Parallel CSV processing',
                 'Chunked buffer processing',
                 'Vectorized timestamp conversion',
@@ -1511,6 +2709,9 @@ class RTUService:
         if NUMBA_AVAILABLE:
             info['optimizations_active'].append('Numba JIT compilation')
 
+        if PYARROW_AVAILABLE:
+            info['optimizations_active'].append('Parquet / Feather columnar export')
+
         if PSUTIL_AVAILABLE:
             info['available_memory_gb'] = round(
                 psutil.virtual_memory().available / (1024**3), 2)
@@ -1577,10 +2778,28 @@ class RTUService:
 
         resizer = None
         try:
-            resizer = RtuResizer(input_file, endian=self.endian)
-            resizer.build_chrono_index()
+            meta = RtuIndex.load_meta(
+                input_file, self.endian) if self.use_index else None
+
+            if meta is not None:
+                # O(1) lookup from the sidecar index header
+                first_sec = meta['first_timestamp']
+                last_sec = meta['last_timestamp']
+                total_points = meta['valid_points']
+                dictionary = list(meta['dictionary'])
+            else:
+                resizer = RtuResizer(
+                    input_file, endian=self.endian, use_index=self.use_index)
+                resizer.build_chrono_index()
+                # Persist the index so subsequent lookups skip the full scan
+                resizer._ensure_index()
 
-            if len(resizer.valid_timestamps) == 0:
+                total_points = len(resizer.valid_phys)
+                first_sec = int(resizer.valid_timestamps[0]) if total_points else None
+                last_sec = int(resizer.valid_timestamps[-1]) if total_points else None
+                dictionary = resizer.rtu.Dictionary.copy()
+
+            if total_points == 0:
                 logger.warning("No valid data points found in file")
                 return {
                     'first_timestamp': None,
@@ -1588,15 +2807,12 @@ class RTUService:
                     'first_timestamp_seconds': None,
                     'last_timestamp_seconds': None,
                     'total_points': 0,
-                    'tags_count': len(resizer.rtu.Dictionary),
-                    'tags_list': resizer.rtu.Dictionary.copy(),
+                    'tags_count': len(dictionary),
+                    'tags_list': dictionary,
                     'file_size_bytes': os.path.getsize(input_file),
                     'input_file': input_file
                 }
 
-            first_sec = int(resizer.valid_timestamps[0])
-            last_sec = int(resizer.valid_timestamps[-1])
-
             first_dt = from_file_seconds_to_naive_dt(first_sec)
             last_dt = from_file_seconds_to_naive_dt(last_sec)
 
@@ -1605,9 +2821,9 @@ class RTUService:
                 'last_timestamp': last_dt,
                 'first_timestamp_seconds': first_sec,
                 'last_timestamp_seconds': last_sec,
-                'total_points': len(resizer.valid_phys),
-                'tags_count': len(resizer.rtu.Dictionary),
-                'tags_list': resizer.rtu.Dictionary.copy(),
+                'total_points': total_points,
+                'tags_count': len(dictionary),
+                'tags_list': dictionary,
                 'file_size_bytes': os.path.getsize(input_file),
                 'input_file': input_file
             }
@@ -1630,10 +2846,11 @@ class RTUService:
                    tag_mapping_file: str = None) -> int:
         """
         Resize (extract time range from) an RTU file to create a new RTU file.
-        Uses ultra-optimized vectorized extraction with threaded producer-consumer pattern
-        and direct pipe streaming to RTUGEN for unlimited point capacity.
+        The point records in the range are block-copied into a new .dt written natively
+        (RtuWriter), so no RTUGEN installation is required and points are copied bit-exactly.
 
-        Optionally applies tag renaming during the resize process using a CSV mapping file.
+        Optionally applies tag renaming using a CSV mapping file; renaming rewrites only the
+        dictionary, name IDs are left untouched.
 
         Args:
             input_file: Path to input .dt file
@@ -1670,29 +2887,28 @@ class RTUService:
         logger.info(f"Resizing RTU file from {input_file} to {output_file}")
         logger.info(f"Time range: {start_time} to {end_time}")
         logger.info(
-            "Using high-performance vectorized extraction with RTUGEN streaming")
+            "Using high-performance vectorized extraction with native .dt writer")
 
         resizer = None
         try:
-            resizer = RtuResizer(input_file, endian=self.endian)
-            resizer.build_chrono_index()
-
-            if len(resizer.valid_timestamps) == 0:
-                raise RuntimeError("No valid data points found in input file")
+            resizer = RtuResizer(
+                input_file, endian=self.endian, use_index=self.use_index)
+            # Block-copy the records and rewrite the dictionary; fall back to a
+            # decoded extraction when the range cannot be located in the ring buffer
+            # or the mapping merges tags
+            written = resizer.copy_range(
+                start_sec, end_sec, output_file, tag_mapping)
+            if written is None:
+                written = resizer.extract_range(
+                    start_sec, end_sec, output_file, tag_mapping)
 
-            # Count points in range using vectorized operations
-            count = resizer.count_between_seconds(start_sec, end_sec)
-            if count == 0:
+            if written == 0:
+                resizer.build_chrono_index()
+                if len(resizer.valid_timestamps) == 0:
+                    raise RuntimeError("No valid data points found in input file")
                 logger.warning("No points found in specified time range")
                 return 0
 
-            logger.info(
-                f"Found {count} points in time range - using threaded producer-consumer pattern")
-
-            # Extract range with optimized threaded streaming to RTUGEN
-            written = resizer.extract_range(
-                start_sec, end_sec, output_file, tag_mapping)
-
             logger.info(
                 f"Successfully resized RTU file: {written} points written to {output_file}")
             return written
@@ -1755,7 +2971,8 @@ class RTUService:
 
         resizer = None
         try:
-            resizer = RtuResizer(input_file, endian=self.endian)
+            resizer = RtuResizer(
+                input_file, endian=self.endian, use_index=self.use_index)
 
             if enable_sampling:
                 # For sampling, we use the optimized dataframe sampled export
@@ -1765,21 +2982,23 @@ class RTUService:
                     output_file, start_sec, end_sec, sample_interval, sample_mode, tags_file
                 )
             else:
-                # Check if we should use parallel processing for large datasets
-                resizer.build_chrono_index()
-                total_points = len(resizer.valid_phys) if len(
-                    resizer.valid_phys) > 0 else resizer.total_points
+                # Check if we should use parallel processing for large datasets; a time
+                # range is sized by the points it selects (lazy range count, no full load)
+                if start_sec is not None and end_sec is not None:
+                    total_points = resizer.count_between_seconds(start_sec, end_sec)
+                else:
+                    resizer.build_chrono_index()
+                    total_points = len(resizer.valid_phys) if len(
+                        resizer.valid_phys) > 0 else resizer.total_points
 
-                # Use parallel processing for datasets > 1M points only if no tag filtering is required
-                if total_points > 1000000 and not tags_file:
+                # Use parallel processing for datasets > 1M points; tag filtering is a
+                # nameid lookup applied before the work is split, so it works on both paths
+                if total_points > 1000000 and self.parallel_chunks:
                     logger.info(
                         f"Large dataset ({total_points} points) - using parallel processing")
                     return resizer.export_to_csv_flat_parallel(output_file, start_sec, end_sec, peek_file=tags_file)
                 else:
                     # Use standard optimized flat export with memory mapping and vectorized operations
-                    if tags_file:
-                        logger.info(
-                            f"Tag filtering enabled - using standard export for optimal filtering")
                     return resizer.export_to_csv_flat(output_file, start_sec, end_sec, peek_file=tags_file)
 
         except Exception as e:
@@ -1789,6 +3008,42 @@ class RTUService:
             if resizer:
                 resizer.close()
 
+    def export_csv_flat_groups(self, input_file: str, groups: Dict[str, List[str]],
+                               start_time: str = None, end_time: str = None) -> Dict[str, int]:
+        """
+        Export several tag groups to separate flat CSV files in one pass over the RTU file.
+
+        Equivalent to one export_csv_flat call per output file with a tags file listing
+        that group's tags, but the input is opened, indexed and decoded only once.
+
+        Args:
+            input_file: Path to input .dt file
+            groups: Mapping of output .csv file -> tag names to write to it
+            start_time: Start time string (optional)
+            end_time: End time string (optional)
+
+        Returns:
+            Mapping of output file -> number of rows exported
+        """
+        self._validate_input_file(input_file)
+        start_sec, end_sec = self._parse_time_range(start_time, end_time)
+
+        logger.info(
+            f"Exporting {sum(len(tags) for tags in groups.values())} tags to {len(groups)} flat CSV files: {input_file}")
+
+        resizer = None
+        try:
+            resizer = RtuResizer(
+                input_file, endian=self.endian, use_index=self.use_index)
+            return resizer.export_to_csv_flat_groups(groups, start_sec, end_sec)
+
+        except Exception as e:
+            logger.error(f"Failed to export flat CSV groups: {e}")
+            raise RuntimeError(f"CSV flat export failed: {e}") from e
+        finally:
+            if resizer:
+                resizer.close()
+
     def export_csv_dataframe(self, input_file: str, output_file: str = None,
                              start_time: str = None, end_time: str = None,
                              tags_file: str = None, enable_sampling: bool = False,
@@ -1840,7 +3095,8 @@ class RTUService:
 
         resizer = None
         try:
-            resizer = RtuResizer(input_file, endian=self.endian)
+            resizer = RtuResizer(
+                input_file, endian=self.endian, use_index=self.use_index)
 
             if enable_sampling:
                 # Use optimized sampled export with vectorized interpolation/actual sampling
@@ -1862,6 +3118,257 @@ class RTUService:
             if resizer:
                 resizer.close()
 
+    def export_table(self, input_file: str, output_file: str = None, layout: str = "flat",
+                     file_format: str = None, start_time: str = None, end_time: str = None,
+                     tags_file: str = None, enable_sampling: bool = False,
+                     sample_interval: int = 60, sample_mode: str = "actual") -> int:
+        """
+        Export RTU data to a columnar file (Parquet or Feather / Arrow IPC).
+
+        Same layouts and filters as the CSV exports, stored typed instead of as text:
+        int32 timestamps, float32 values and dictionary-encoded tag names, so
+        downstream pandas/pyarrow/polars readers skip CSV parsing entirely.
+
+        Args:
+            input_file: Path to input .dt file
+            output_file: Path to output .parquet/.feather/.arrow file (if None, auto-generated)
+            layout: "flat" (one row per point) or "dataframe" (tags as columns)
+            file_format: "parquet" or "feather" (default: from the output extension)
+            start_time: Start time string (optional)
+            end_time: End time string (optional)
+            tags_file: Path to text file with tag names for filtering (optional)
+            enable_sampling: Enable time-based sampling, dataframe layout (default: False)
+            sample_interval: Sampling interval in seconds (default: 60)
+            sample_mode: "actual" or "interpolated" (default: "actual")
+
+        Returns:
+            Number of data points exported (rows for flat, rows * tag_columns for dataframe)
+        """
+        _require_pyarrow()
+        self._validate_input_file(input_file)
+        if tags_file:
+            self._validate_tags_file(tags_file)
+
+        if layout not in ["flat", "dataframe"]:
+            raise ValueError("layout must be 'flat' or 'dataframe'")
+
+        if output_file is None:
+            output_file = os.path.splitext(self._generate_default_output_name(
+                input_file, f"csv_{layout}",
+                start_time=start_time, end_time=end_time,
+                tags_file=tags_file, enable_sampling=enable_sampling,
+                sample_interval=sample_interval, sample_mode=sample_mode
+            ))[0] + f".{file_format or 'parquet'}"
+        file_format = table_format_for(output_file, file_format)
+
+        start_sec, end_sec = self._parse_time_range(start_time, end_time)
+
+        if enable_sampling and sample_interval <= 0:
+            raise ValueError(
+                "sample_interval must be positive when sampling is enabled")
+
+        if sample_mode not in ["actual", "interpolated"]:
+            raise ValueError("sample_mode must be 'actual' or 'interpolated'")
+
+        logger.info(
+            f"Exporting RTU to {file_format} ({layout} layout): {input_file} -> {output_file}")
+        logger.info(f"Parameters: time_range={bool(start_time and end_time)}, "
+                    f"tags_filter={bool(tags_file)}, sampling={enable_sampling}")
+
+        resizer = None
+        try:
+            resizer = RtuResizer(
+                input_file, endian=self.endian, use_index=self.use_index)
+            return resizer.export_to_table(
+                output_file, start_sec, end_sec, tags_file, layout, file_format,
+                sample_interval if enable_sampling else None, sample_mode)
+
+        except Exception as e:
+            logger.error(f"Failed to export {file_format}: {e}")
+            raise RuntimeError(f"{file_format} export failed: {e}") from e
+        finally:
+            if resizer:
+                resizer.close()
+
+    def query(self, input_file: str, tags: List[str] = None, start_time: str = None,
+              end_time: str = None, as_frame: bool = True):
+        """
+        Read RTU points into memory - the in-process alternative to export_csv_flat
+        followed by pd.read_csv. No tags file or CSV is written.
+
+        Args:
+            input_file: Path to input .dt file
+            tags: Tag names to select, case-insensitive (optional, default: all tags)
+            start_time: Start time string (optional)
+            end_time: End time string (optional)
+            as_frame: Return a DataFrame (default) or a dict of NumPy arrays
+
+        Returns:
+            DataFrame with the flat CSV columns (datetime, timestamp, tag_name, value, quality)
+            in the same row order, or a dict of 'timestamp', 'tag_name', 'value' and
+            'quality' arrays (quality as the raw quality id, 0 = GOOD)
+        """
+        self._validate_input_file(input_file)
+        start_sec, end_sec = self._parse_time_range(start_time, end_time)
+
+        resizer = None
+        try:
+            resizer = RtuResizer(
+                input_file, endian=self.endian, use_index=self.use_index)
+            columns = resizer.query(start_sec, end_sec, tags)
+        except Exception as e:
+            logger.error(f"Failed to query RTU data: {e}")
+            raise RuntimeError(f"RTU query failed: {e}") from e
+        finally:
+            if resizer:
+                resizer.close()
+
+        logger.debug(f"Queried {len(columns['timestamp'])} points from {input_file}")
+        if not as_frame:
+            return columns
+
+        return pd.DataFrame({
+            'datetime': to_local_datetime64(columns['timestamp']),
+            'timestamp': columns['timestamp'],
+            'tag_name': pd.Categorical(columns['tag_name']),
+            'value': columns['value'],
+            'quality': pd.Categorical.from_codes(
+                (columns['quality'] != 0).astype(np.int8), categories=['GOOD', 'BAD']),
+        })
+
+    def export_folder_csv(self, rtu_folder: str, output_file: str,
+                          start_time: str = None, end_time: str = None,
+                          tags_file: str = None, csv_format: str = "flat",
+                          enable_sampling: bool = False, sample_interval: int = 60,
+                          sample_mode: str = "actual",
+                          progress_callback: Callable[[int, int, str], None] = None,
+                          cancel_event: threading.Event = None) -> int:
+        """
+        Export every .dt file in a folder as ONE time-ordered CSV (RtuDataset).
+
+        Per-file selections are merged in memory; files outside the time range are
+        skipped and no intermediate per-file CSVs are written. Files that fail to read
+        are left out and listed in `last_skipped_files`.
+
+        Args:
+            rtu_folder: Folder containing .dt files (or a list of .dt paths)
+            output_file: Path to the merged output .csv file
+            start_time / end_time / tags_file / sampling options: as export_csv_dataframe
+            csv_format: "flat" or "dataframe"
+            progress_callback: Called as (file_number, file_count, path) before each file
+            cancel_event: Set to stop reading further files (returns 0)
+
+        Returns:
+            Number of points (flat) or rows * tag_columns (dataframe) exported
+        """
+        self.last_skipped_files = []
+        dataset = RtuDataset(rtu_folder, endian=self.endian, use_index=self.use_index,
+                             cancel_event=cancel_event)
+        if not dataset.paths:
+            raise FileNotFoundError(f"No .dt files found in: {rtu_folder}")
+        if tags_file:
+            self._validate_tags_file(tags_file)
+        if csv_format not in ["flat", "dataframe"]:
+            raise ValueError("csv_format must be 'flat' or 'dataframe'")
+        if enable_sampling and sample_interval <= 0:
+            raise ValueError(
+                "sample_interval must be positive when sampling is enabled")
+        if sample_mode not in ["actual", "interpolated"]:
+            raise ValueError("sample_mode must be 'actual' or 'interpolated'")
+
+        start_sec, end_sec = self._parse_time_range(start_time, end_time)
+
+        logger.info(
+            f"Exporting {len(dataset.paths)} RTU files to merged {csv_format} CSV: {output_file}")
+
+        try:
+            if enable_sampling:
+                # Sampling always produces the dataframe layout (as in export_csv_flat)
+                return dataset.export_to_csv_dataframe_sampled(
+                    output_file, start_sec, end_sec, sample_interval, sample_mode,
+                    tags_file, progress_callback)
+            if csv_format == "flat":
+                return dataset.export_to_csv_flat(
+                    output_file, start_sec, end_sec, tags_file, progress_callback)
+            return dataset.export_to_csv_dataframe(
+                output_file, start_sec, end_sec, tags_file, progress_callback)
+        except Exception as e:
+            logger.error(f"Failed to export RTU folder: {e}")
+            raise RuntimeError(f"RTU folder export failed: {e}") from e
+        finally:
+            self.last_skipped_files = list(dataset.skipped_files)
+
+    def export_folder(self, rtu_folder: str, output_dir: str = None, csv_format: str = "flat",
+                      max_workers: int = None,
+                      progress_callback: Callable[[int, int, str], None] = None,
+                      cancel_event: threading.Event = None, **export_kwargs) -> Dict[str, int]:
+        """
+        Export every .dt file in a folder to its own CSV, fanning the files out across a
+        process pool sized by folder_worker_count (CPU cores, file count and available
+        memory).
+
+        Args:
+            rtu_folder: Folder containing .dt files (or a list of .dt paths)
+            output_dir: Where to write '<name>_export.csv' files (default: next to each input)
+            csv_format: "flat" or "dataframe"
+            max_workers: Upper bound on worker processes (default: CPU cores)
+            progress_callback: Called as (files_done, file_count, path) as each file finishes
+            cancel_event: Set to stop scheduling files; files already running complete
+            **export_kwargs: start_time, end_time, tags_file and sampling options, passed
+                             to export_csv_flat / export_csv_dataframe
+
+        Returns:
+            {output_file: points_exported} for every file that was exported successfully;
+            files that failed are listed in `last_skipped_files`
+        """
+        self.last_skipped_files = []
+        dataset = RtuDataset(rtu_folder, endian=self.endian, use_index=self.use_index)
+        if not dataset.paths:
+            raise FileNotFoundError(f"No .dt files found in: {rtu_folder}")
+        if csv_format not in ["flat", "dataframe"]:
+            raise ValueError("csv_format must be 'flat' or 'dataframe'")
+        if export_kwargs.get('tags_file'):
+            self._validate_tags_file(export_kwargs['tags_file'])
+        # Fail fast on bad times in the parent rather than once per worker
+        self._parse_time_range(export_kwargs.get('start_time'), export_kwargs.get('end_time'))
+
+        method = "export_csv_flat" if csv_format == "flat" else "export_csv_dataframe"
+        outputs = {}
+        for path in dataset.paths:
+            base_name = os.path.splitext(os.path.basename(path))[0]
+            outputs[path] = os.path.join(
+                output_dir or os.path.dirname(path), f"{base_name}_export.csv")
+
+        workers = folder_worker_count(dataset.paths, max_workers)
+        logger.info(
+            f"Exporting {len(dataset.paths)} RTU files ({csv_format}) with {workers} worker processes")
+
+        results: Dict[str, int] = {}
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                executor.submit(_export_file, self.endian, self.use_index, method,
+                                path, outputs[path], export_kwargs): path
+                for path in dataset.paths
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                path = futures[future]
+                try:
+                    results[outputs[path]] = future.result()
+                except Exception as e:
+                    # Continue with the other files instead of failing the whole folder
+                    logger.error(f"Failed to process {path}: {e}")
+                    self.last_skipped_files.append(path)
+                if progress_callback:
+                    progress_callback(done, len(futures), path)
+                if cancel_event is not None and cancel_event.is_set():
+                    logger.info("Folder export cancelled, skipping remaining files")
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        logger.info(f"Exported {len(results)}/{len(dataset.paths)} RTU files")
+        return results
 
 # High-Performance Convenience Functions
 # =====================================
@@ -1881,8 +3388,7 @@ def resize_rtu_file(input_file: str, output_file: str = None,
                     tag_mapping_file: str = None) -> int:
     """
     Convenience function to resize RTU file.
-    Uses vectorized extraction with threaded producer-consumer pattern
-    and direct RTUGEN streaming for unlimited capacity.
+    Uses vectorized extraction and the native .dt writer.
     Optionally applies tag renaming using CSV mapping file.
     """
     service = RTUService()
@@ -1924,7 +3430,7 @@ if __name__ == "__main__":
     logger.info("=" * 80)
     logger.info("PERFORMANCE FEATURES:")
     logger.info("✓ Memory-mapped I/O ✓ Vectorized operations ✓ Multi-threading")
-    logger.info("✓ Multi-processing ✓ Direct RTUGEN streaming ✓ JIT compilation")
+    logger.info("✓ Multi-processing ✓ Native .dt writer ✓ JIT compilation")
     logger.info("✓ Chunked processing ✓ String pooling ✓ Pre-allocated arrays")
     logger.info("=" * 80)
     logger.info("")